@@ -6,7 +6,8 @@ from pandas.core.datetools import DateOffset
 import pandas.core.datetools as datetools
 
 from pandas.core.common import isnull, notnull
-from pandas.core.index import Index, MultiIndex
+from pandas.core.index import (Index, Int64Index, Float64Index,
+                               DatetimeIndex, MultiIndex)
 from pandas.core.daterange import DateRange
 from pandas.core.series import Series, TimeSeries
 from pandas.core.frame import DataFrame
@@ -140,6 +140,82 @@ def _ensure_index(index_like):
 
     return index_like
 
+def _factorize_keys(lk, rk):
+    """
+    Label the values of two arrays with a common set of integer codes
+
+    Returns
+    -------
+    (left_labels, right_labels, count)
+        int32 labels, -1 for NA, and the number of distinct values seen
+    """
+    lk = np.asarray(lk)
+    rk = np.asarray(rk)
+
+    if (issubclass(lk.dtype.type, np.integer) and
+        issubclass(rk.dtype.type, np.integer)):
+        table = _tseries.Int64HashTable(len(rk))
+        lk = lk.astype(np.int64)
+        rk = rk.astype(np.int64)
+    elif (issubclass(lk.dtype.type, (np.integer, np.floating)) and
+          issubclass(rk.dtype.type, (np.integer, np.floating))):
+        table = _tseries.Float64HashTable(len(rk))
+        lk = lk.astype(np.float64)
+        rk = rk.astype(np.float64)
+    else:
+        table = _tseries.PyObjectHashTable(len(rk))
+        lk = lk.astype(object)
+        rk = rk.astype(object)
+
+    left_labels = table.get_labels(lk)
+    right_labels = table.get_labels(rk)
+    return left_labels, right_labels, len(table)
+
+# tables grow as needed, don't reserve space for every row up front
+_SIZE_HINT_LIMIT = 2 ** 20
+
+def _factorize(values):
+    """
+    Label the values of an array with integer codes, numbered in sorted order
+    of the distinct values
+
+    Returns
+    -------
+    (labels, uniques)
+        int32 labels, -1 for NA, and the sorted distinct values
+    """
+    values = np.asarray(values)
+    hint = min(len(values), _SIZE_HINT_LIMIT)
+
+    if issubclass(values.dtype.type, np.integer):
+        table = _tseries.Int64HashTable(hint)
+        values = values.astype(np.int64)
+    elif issubclass(values.dtype.type, np.floating):
+        table = _tseries.Float64HashTable(hint)
+        values = values.astype(np.float64)
+    else:
+        table = _tseries.PyObjectHashTable(hint)
+        values = values.astype(object)
+
+    labels = table.get_labels(values)
+    count = len(table)
+
+    mask = labels == -1
+    uniques = np.empty(count, dtype=values.dtype)
+    uniques[labels[~mask]] = values[~mask]
+
+    if count == 0:
+        return labels, uniques
+
+    # renumber in sorted order
+    sorter = uniques.argsort()
+    reverse = np.empty(count, dtype=np.int32)
+    reverse.put(sorter, np.arange(count))
+    labels = reverse.take(labels)
+    np.putmask(labels, mask, -1)
+
+    return labels, uniques.take(sorter)
+
 def _any_none(*args):
     for arg in args:
         if arg is None:
@@ -232,6 +308,27 @@ def _format(s, nanRep=None, float_format=None):
 #-------------------------------------------------------------------------------
 # miscellaneous python tools
 
+def _write_csv(f, arrays, na_rep='', float_format=None, chunksize=None):
+    """
+    Write 1-d arrays, one per output column, as comma-delimited rows. Each
+    chunk of rows is formatted a whole column at a time and written with a
+    single call
+    """
+    if len(arrays) == 0:
+        return
+
+    nrows = len(arrays[0])
+    if chunksize is None:
+        chunksize = 100000 // len(arrays) + 1
+
+    for start in xrange(0, nrows, chunksize):
+        end = min(start + chunksize, nrows)
+        formatted = [_tseries.format_csv_column(np.asarray(arr[start:end]),
+                                                na_rep=na_rep,
+                                                float_format=float_format)
+                     for arr in arrays]
+        _tseries.write_csv_rows(formatted, f)
+
 def rands(n):
     """Generates a random alphanumeric string of length *n*"""
     from random import Random
@@ -5,8 +5,9 @@ import operator
 
 import numpy as np
 
-from pandas.core.index import Index
+from pandas.core.index import Index, _timedelta_ns
 import pandas.core.datetools as datetools
+import pandas._tseries as _tseries
 
 __all__ = ['DateRange']
 
@@ -145,13 +146,13 @@ class DateRange(Index):
 
             end = offset.rollback(end)
 
-            endLoc = cachedRange.indexMap[end] + 1
+            endLoc = cachedRange.get_loc(end) + 1
             startLoc = endLoc - periods
         elif end is None:
             assert(isinstance(start, datetime))
             start = offset.rollforward(start)
 
-            startLoc = cachedRange.indexMap[start]
+            startLoc = cachedRange.get_loc(start)
             if periods is None:
                 raise Exception('Must provide number of periods!')
 
@@ -160,8 +161,8 @@ class DateRange(Index):
             start = offset.rollforward(start)
             end = offset.rollback(end)
 
-            startLoc = cachedRange.indexMap[start]
-            endLoc = cachedRange.indexMap[end] + 1
+            startLoc = cachedRange.get_loc(start)
+            endLoc = cachedRange.get_loc(end) + 1
 
         indexSlice = cachedRange[startLoc:endLoc]
 
@@ -171,6 +172,7 @@ class DateRange(Index):
         if self.ndim == 0: # pragma: no cover
             return self.item()
 
+        Index.__array_finalize__(self, obj)
         self.offset = getattr(obj, 'offset', None)
 
     __lt__ = _bin_op(operator.lt)
@@ -282,6 +284,16 @@ class DateRange(Index):
         else:
             return Index.union(self, other)
 
+    def _wrap_joined_index(self, joined, other):
+        if (isinstance(other, DateRange) and other.offset == self.offset and
+            other.tzinfo == self.tzinfo and len(joined) > 0):
+            # still a DateRange if no dates were skipped
+            rng = DateRange(joined[0], joined[-1], offset=self.offset)
+            if len(rng) == len(joined):
+                return rng
+
+        return Index(joined)
+
     def tz_normalize(self, tz):
         """
         Convert DateRange from one time zone to another (using pytz)
@@ -389,6 +401,12 @@ def generate_range(start=None, end=None, periods=None,
     if start is None:
         start = end - (periods - 1) * offset
 
+    stamps = _range_stamps(start, end, offset)
+    if stamps is not None:
+        for cur in _tseries.array_ns_to_datetime(stamps):
+            yield cur
+        return
+
     cur = start
     if offset._normalizeFirst:
         cur = datetools.normalize_date(cur)
@@ -399,6 +417,37 @@ def generate_range(start=None, end=None, periods=None,
         # faster than cur + offset
         cur = offset.apply(cur)
 
+_NS_PER_DAY = 86400 * 10**9
+
+def _range_stamps(start, end, offset):
+    """
+    Dates on the offset between start and end as int64 nanoseconds since the
+    epoch, computed with integer arithmetic. Returns None if the offset or the
+    dates are not supported, in which case offset.apply must be used
+    """
+    try:
+        start_ns = _tseries.datetime_to_ns(start)
+        end_ns = _tseries.datetime_to_ns(end)
+    except (TypeError, ValueError):
+        return None
+
+    if isinstance(offset, datetools.Tick):
+        step = _timedelta_ns(offset.delta)
+        if step <= 0:
+            return None
+        return np.arange(start_ns, end_ns + 1, step, dtype=np.int64)
+
+    if (type(offset) == datetools.BDay and offset.n == 1 and
+        not offset.offset):
+        # BDay normalizes, so whole days from the first date
+        days = np.arange(start_ns // _NS_PER_DAY, end_ns // _NS_PER_DAY + 1,
+                         dtype=np.int64)
+        # 1970-01-01 was a Thursday
+        days = days[(days + 3) % 7 < 5]
+        return days * _NS_PER_DAY
+
+    return None
+
 # Do I want to cache UTC dates? Can't decide...
 
 # def _utc_in_cache_range(start, end):
@@ -22,7 +22,7 @@ import numpy as np
 
 from pandas.core.common import (isnull, notnull, PandasError, _ensure_index,
                                 _try_sort, _pfixed, _default_index,
-                                _infer_dtype, _stringify)
+                                _infer_dtype, _stringify, _factorize_keys)
 from pandas.core.daterange import DateRange
 from pandas.core.generic import AxisProperty, NDFrame
 from pandas.core.index import Index, MultiIndex, NULL_INDEX
@@ -450,7 +450,7 @@ class DataFrame(NDFrame):
                                default_kind=kind, default_fill_value=fill_value)
 
     def toCSV(self, path, nanRep='', cols=None, header=True,
-              index=True, mode='wb'):
+              index=True, mode='wb', float_format=None, chunksize=None):
         """
         Write the DataFrame to a CSV file
 
@@ -465,13 +465,18 @@ class DataFrame(NDFrame):
             Write out column names
         index : boolean, default True
             Write row names (index)
+        float_format : string, default None
+            Format string for floating point numbers, e.g. '%.12f'
+        chunksize : int, default None
+            Number of rows to format and write at a time
         """
+        from pandas.core.common import _write_csv
+
         f = open(path, mode)
 
         if cols is None:
             cols = self.columns
 
-        series = self._series
         if header:
             joined_cols = ','.join([str(c) for c in cols])
             if index:
@@ -481,22 +486,13 @@ class DataFrame(NDFrame):
                 f.write(joined_cols)
             f.write('\n')
 
-        for idx in self.index:
-            if index:
-                f.write(str(idx))
-            for i, col in enumerate(cols):
-                val = series[col].get(idx)
-                if isnull(val):
-                    val = nanRep
-                else:
-                    val = str(val)
-
-                if i > 0 or index:
-                    f.write(',%s' % val)
-                else:
-                    f.write('%s' % val)
+        # columns are rows of the underlying blocks, no copies made
+        arrays = [self._data.get(col) for col in cols]
+        if index:
+            arrays.insert(0, self.index.values)
 
-            f.write('\n')
+        _write_csv(f, arrays, na_rep=nanRep, float_format=float_format,
+                   chunksize=chunksize)
 
         f.close()
 
@@ -1137,7 +1133,7 @@ class DataFrame(NDFrame):
             series = self[column].order(na_last=False)
             sort_index = series.index
         else:
-            index = np.asarray(self.index)
+            index = self.index.values
             argsorted = np.argsort(index)
             sort_index = index[argsorted.astype(int)]
 
@@ -1508,7 +1504,7 @@ class DataFrame(NDFrame):
     #----------------------------------------------------------------------
     # Data reshaping
 
-    def pivot(self, index=None, columns=None, values=None):
+    def pivot(self, index=None, columns=None, values=None, aggfunc=None):
         """
         Produce 'pivot' table this DataFrame. Uses unique values from index /
         columns to form axes and return either DataFrame or WidePanel, depending
@@ -1523,6 +1519,9 @@ class DataFrame(NDFrame):
             Column name to use to make new frame's columns
         values : string or object, optional
             Column name to use for populating new frame's values
+        aggfunc : function or string, optional
+            Used to combine the values of duplicate (index, columns) entries,
+            e.g. 'mean' or np.sum. By default the last one is kept
 
         Examples
         --------
@@ -1550,27 +1549,36 @@ class DataFrame(NDFrame):
         pivoted : DataFrame (value column specified) or WidePanel (no value
         column specified)
         """
-        from pandas.core.panel import _make_long_index, LongPanel
+        from pandas.core.panel import _make_long_index, WidePanel
+        from pandas.core.series import _Unstacker
 
         index_vals = self[index]
         column_vals = self[columns]
         long_index = _make_long_index(index_vals, column_vals)
 
-        if values is None:
-            items = self.columns - [index, columns]
-            mat = self.reindex(columns=items).values
-        else:
-            items = [values]
-            mat = np.atleast_2d(self[values].values).T
+        if values is not None:
+            unstacker = _Unstacker(self[values].values, long_index, level=1,
+                                   aggfunc=aggfunc)
+            return unstacker.get_result()
 
-        lp = LongPanel(mat, index=long_index, columns=items)
-        lp = lp.sortlevel(level=0)
+        items = self.columns - [index, columns]
+        if self._data.is_mixed_dtype():
+            # keep the type of each column
+            data = {}
+            for item in items:
+                unstacker = _Unstacker(self[item].values, long_index,
+                                       level=1, aggfunc=aggfunc)
+                data[item] = unstacker.get_result()
+            return WidePanel.from_dict(data)
 
-        wp = lp.to_wide()
-        if values is not None:
-            return wp[values]
-        else:
-            return wp
+        unstacker = _Unstacker(self.reindex(columns=items).values, long_index,
+                               level=1, value_columns=items, aggfunc=aggfunc)
+        new_values, mask = unstacker.get_new_values()
+
+        N, K = len(unstacker.get_new_index()), len(long_index.levels[1])
+        new_values = new_values.reshape((N, len(items), K))[:, :, mask]
+        return WidePanel(new_values.swapaxes(0, 1), items,
+                         unstacker.get_new_index(), long_index.levels[1][mask])
 
     def stack(self):
         """
@@ -1741,7 +1749,7 @@ class DataFrame(NDFrame):
     #----------------------------------------------------------------------
     # Function application
 
-    def apply(self, func, axis=0, broadcast=False):
+    def apply(self, func, axis=0, broadcast=False, raw=False):
         """
         Applies func to columns (Series) of this DataFrame and returns either
         a DataFrame (if the function produces another series) or a Series
@@ -1756,15 +1764,24 @@ class DataFrame(NDFrame):
         broadcast : bool, default False
             For aggregation functions, return object of same size with values
             propagated
+        raw : bool, default False
+            Pass each row / column to func as an ndarray instead of a Series,
+            much faster if func does not need the labels
 
         Examples
         --------
         >>> df.apply(numpy.sqrt) --> DataFrame
         >>> df.apply(numpy.sum) --> Series
+        >>> df.apply(numpy.sum, axis=1, raw=True) --> Series
 
         Notes
         -----
-        Functions altering the index are not supported (yet)
+        Functions altering the index are not supported (yet). With axis=1
+        the same Series is passed for every row with its values replaced, so
+        func should copy it if it holds on to it
+
+        Whether func reduces or transforms is decided by its output for the
+        first row / column
         """
         if not len(self.columns):
             return self
@@ -1775,10 +1792,86 @@ class DataFrame(NDFrame):
                                      columns=self.columns, copy=False)
         else:
             if not broadcast:
+                if raw:
+                    return self._apply_raw(func, axis)
+                elif axis == 1:
+                    return self._apply_rows(func)
                 return self._apply_standard(func, axis)
             else:
                 return self._apply_broadcast(func, axis)
 
+    def _apply_raw(self, func, axis):
+        values = self.values
+        if axis == 0:
+            values = values.T
+
+        return self._apply_values(func, values, axis)
+
+    def _apply_rows(self, func):
+        values = self.values
+
+        # one Series, refilled for each row
+        row = Series(np.empty(len(self.columns), dtype=values.dtype),
+                     index=self.columns)
+        buf = row.view(np.ndarray)
+
+        def _func(v):
+            buf[:] = v
+            return func(row)
+
+        return self._apply_values(_func, values, 1)
+
+    def _apply_values(self, func, values, axis):
+        """
+        Apply func to each row of values, the columns (axis=0) or rows
+        (axis=1) of this DataFrame
+        """
+        if axis == 0:
+            agg_index, other = self.columns, self.index
+        else:
+            agg_index, other = self.index, self.columns
+
+        n = len(values)
+        if n == 0:
+            return Series([], index=agg_index)
+
+        first = func(values[0])
+
+        # reduction
+        if not hasattr(first, '__iter__'):
+            results = [first]
+            for i in xrange(1, n):
+                results.append(func(values[i]))
+            return Series(results, index=agg_index)
+
+        # transform, results are copied as the inputs may be reused
+        results = [np.array(first)]
+        aligned = _applied_aligned(first, other)
+        for i in xrange(1, n):
+            applied = func(values[i])
+            aligned = aligned and _applied_aligned(applied, other)
+            if isinstance(applied, Series):
+                applied = applied.copy()
+            else:
+                applied = np.array(applied)
+            results.append(applied)
+
+        if aligned:
+            result = np.array([np.asarray(r) for r in results])
+            if axis == 0:
+                result = result.T
+            return self._constructor(result, index=self.index,
+                                     columns=self.columns)
+
+        if isinstance(first, Series):
+            results[0] = first.copy()
+        result = self._constructor(data=dict(zip(agg_index, results)),
+                                   index=other, columns=agg_index)
+        if axis == 1:
+            result = result.T
+
+        return result
+
     def _apply_standard(self, func, axis):
         if axis == 0:
             target = self
@@ -1915,18 +2008,20 @@ class DataFrame(NDFrame):
 
     def join(self, other, on=None, how=None):
         """
-        Join columns with other DataFrame either on index or on a key
-        column
+        Join columns with other DataFrame either on index or on key
+        column(s)
 
         Parameters
         ----------
         other : DataFrame
             Index should be similar to one of the columns in this one
-        on : string, default None
-            Column name to use, otherwise join on index
+        on : string or list of strings, default None
+            Column name(s) to use, otherwise join on index. Their values are
+            matched against the index of other, which must be a MultiIndex
+            with one level per column if several are given. Keys may be
+            repeated on both sides
         how : {'left', 'right', 'outer', 'inner'}
             How to handle indexes of the two objects. Default: 'left'
-            for joining on index, None otherwise
             * left: use calling frame's index
             * right: use input frame's index
             * outer: form union of indexes
@@ -1935,31 +2030,85 @@ class DataFrame(NDFrame):
         Returns
         -------
         joined : DataFrame
+
+        Notes
+        -----
+        When joining on columns, the result keeps the calling frame's index
+        if its rows are neither repeated nor reordered, otherwise it gets a
+        new integer index. NA keys never match
         """
+        if how is None:
+            how = 'left'
+
         if on is not None:
-            if how is not None:
-                raise Exception('how parameter is not valid when '
-                                '*on* specified')
-            return self._join_on(other, on)
+            return self._join_on(other, on, how)
         else:
-            if how is None:
-                how = 'left'
             return self._join_index(other, how)
 
-    def _join_on(self, other, on):
-        if len(other.index) == 0:
+    def _join_on(self, other, on, how):
+        if how == 'left' and len(other.index) == 0:
             return self
 
-        if on not in self:
-            raise Exception('%s column not contained in this frame!' % on)
+        if isinstance(on, (list, tuple)):
+            keys = list(on)
+        else:
+            keys = [on]
+
+        for key in keys:
+            if key not in self:
+                raise Exception('%s column not contained in this frame!'
+                                % key)
+
+        if (how == 'left' and len(keys) == 1 and other.index.is_unique
+            and notnull(self[keys[0]]).all()):
+            # many-to-one, look the keys up in other's index, which would
+            # match NA keys to an NA label
+            new_data = self._data.join_on(other._data, self[keys[0]], axis=1)
+            return self._constructor(new_data)
 
-        new_data = self._data.join_on(other._data, self[on], axis=1)
-        return self._constructor(new_data)
+        left_keys = [self[key].values for key in keys]
+        if len(keys) == 1:
+            right_keys = [other.index.values]
+        else:
+            if (not isinstance(other.index, MultiIndex) or
+                other.index.nlevels != len(keys)):
+                raise Exception('joining on %d columns requires a '
+                                'MultiIndex with as many levels' % len(keys))
+            right_keys = [lev.values.take(lab) for lev, lab
+                          in zip(other.index.levels, other.index.labels)]
+
+        lidx, ridx = _get_join_indexers(left_keys, right_keys, how)
+
+        if len(lidx) > 0 and lidx[0] >= 0 and (np.diff(lidx) > 0).all():
+            if len(lidx) == len(self.index):
+                new_index, lidx = self.index, None
+            else:
+                new_index = self.index.take(lidx)
+        else:
+            new_index = _default_index(len(lidx))
+
+        this_data = self._data.reindex_indexer(new_index, lidx, axis=1)
+        other_data = other._data.reindex_indexer(new_index, ridx, axis=1)
+
+        if lidx is not None and (lidx == -1).any():
+            # rows only in other get their key values from other's index.
+            # Replace the NA-filled key columns rather than setting them, so
+            # that they get the dtype of the keys
+            for key, lk, rk in zip(keys, left_keys, right_keys):
+                values = _join_key_values(lk, rk, lidx, ridx)
+                loc = this_data.items.get_loc(key)
+                this_data.delete(key)
+                this_data.insert(loc, key, values[np.newaxis, :])
+
+        return self._constructor(this_data.merge(other_data))
 
     def _join_index(self, other, how):
-        join_index = self._get_join_index(other, how)
-        this_data = self.reindex(join_index)._data
-        other_data = other.reindex(join_index)._data
+        join_index, lidx, ridx = self.index.join(other.index, how=how,
+                                                 return_indexers=True)
+        this_data = self._data.consolidate().reindex_indexer(join_index, lidx,
+                                                             axis=1)
+        other_data = other._data.consolidate().reindex_indexer(join_index,
+                                                               ridx, axis=1)
 
         # merge blocks
         merged_data = this_data.merge(other_data)
@@ -2770,6 +2919,14 @@ class DataFrame(NDFrame):
             return self.dropna(axis=0, subset=specificColumns, thresh=minObs)
 
 
+def _applied_aligned(applied, index):
+    """
+    Whether the output of apply lines up with index without reindexing
+    """
+    if isinstance(applied, Series):
+        return applied.index is index or applied.index.equals(index)
+    return len(applied) == len(index)
+
 def group_agg(values, bounds, f):
     """
     R-style aggregator
@@ -2971,6 +3128,52 @@ def _homogenize(data, index, columns, dtype=None):
 def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
+def _get_join_indexers(left_keys, right_keys, how):
+    """
+    Hash join of rows on one or more key arrays
+
+    Returns
+    -------
+    (left_indexer, right_indexer) : int64 arrays, -1 where a row has no match
+    """
+    llab = rlab = None
+    for lk, rk in zip(left_keys, right_keys):
+        llab2, rlab2, count2 = _factorize_keys(lk, rk)
+        if llab is None:
+            llab, rlab, count = llab2, rlab2, count2
+            continue
+
+        # label the pairs of labels, NA if either is NA
+        lmask = (llab == -1) | (llab2 == -1)
+        rmask = (rlab == -1) | (rlab2 == -1)
+        llab, rlab, count = _factorize_keys(llab * np.int64(count2) + llab2,
+                                            rlab * np.int64(count2) + rlab2)
+        llab[lmask] = -1
+        rlab[rmask] = -1
+
+    if how == 'left':
+        return _tseries.left_outer_join(llab, rlab, count)
+    elif how == 'right':
+        rindexer, lindexer = _tseries.left_outer_join(rlab, llab, count)
+        return lindexer, rindexer
+    elif how == 'inner':
+        return _tseries.inner_join(llab, rlab, count)
+    elif how == 'outer':
+        return _tseries.full_outer_join(llab, rlab, count)
+    else:
+        raise Exception('do not recognize join method %s' % how)
+
+def _join_key_values(lk, rk, lindexer, rindexer):
+    lk = np.asarray(lk)
+    rk = np.asarray(rk)
+    mask = lindexer == -1
+    dtype = np.concatenate((lk[:0], rk[:0])).dtype
+
+    result = np.empty(len(lindexer), dtype=dtype)
+    result[-mask] = lk.take(lindexer[-mask])
+    result[mask] = rk.take(rindexer[mask])
+    return result
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
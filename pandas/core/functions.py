@@ -71,7 +71,7 @@ def _bucket_locs(index, buckets, inclusive=False):
 
 def get_bucket(date, bucks):
     if date in bucks:
-        idx = bucks.indexMap[date] + 1
+        idx = bucks.get_loc(date) + 1
     else:
         idx = bucks.searchsorted(date)
     return bucks[idx]
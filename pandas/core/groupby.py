@@ -1,13 +1,11 @@
-from itertools import izip
 import sys
 import types
 
 import numpy as np
 
+from pandas.core.common import _factorize, notnull
 from pandas.core.frame import DataFrame
-from pandas.core.generic import NDFrame, PandasObject
 from pandas.core.index import Factor, Index, MultiIndex
-from pandas.core.internals import BlockManager
 from pandas.core.series import Series
 from pandas.core.panel import WidePanel
 import pandas._tseries as _tseries
@@ -27,6 +25,55 @@ def groupby(obj, grouper, **kwds):
 
     return klass(obj, grouper, **kwds)
 
+def _groupby_function(name, how, alt, doc):
+    def f(self, *args, **kwargs):
+        # options meant for the method of each group, e.g. axis
+        if args or kwargs:
+            return self._make_wrapper(name)(*args, **kwargs)
+
+        try:
+            return self._cython_agg_general(how)
+        except Exception:
+            return self.aggregate(alt)
+
+    f.__name__ = name
+    f.__doc__ = doc
+    return f
+
+def _aggregate_labels(values, comp_ids, ngroups, how):
+    """
+    Reduce the columns of a 2-d float64 array by group id with the Cython
+    kernel for how, e.g. 'add' or 'std'
+    """
+    result = np.empty((ngroups, values.shape[1]), dtype=np.float64)
+    counts = np.zeros(ngroups, dtype=np.int32)
+    _cython_functions[how](result, counts, values, comp_ids)
+
+    if how == 'std':
+        np.sqrt(result, result)
+    elif how == 'count':
+        result = result.astype(np.int64)
+
+    return result
+
+def _first_compat(x):
+    if isinstance(x, DataFrame):
+        raise TypeError('aggregate DataFrame column by column')
+    x = np.asarray(x)
+    x = x[notnull(x)]
+    if len(x) == 0:
+        return np.nan
+    return x[0]
+
+def _last_compat(x):
+    if isinstance(x, DataFrame):
+        raise TypeError('aggregate DataFrame column by column')
+    x = np.asarray(x)
+    x = x[notnull(x)]
+    if len(x) == 0:
+        return np.nan
+    return x[-1]
+
 class GroupBy(object):
     """
     Class for grouping and aggregating relational data.
@@ -64,10 +111,6 @@ class GroupBy(object):
     def _get_obj_with_exclusions(self):
         return self.obj
 
-    @property
-    def _group_shape(self):
-        return tuple(len(ping.ids) for ping in self.groupings)
-
     @property
     def _agg_stride_shape(self):
         raise NotImplementedError
@@ -126,33 +169,85 @@ class GroupBy(object):
                 yield name, self.get_group(name)
         else:
             # provide "flattened" iterator for multi-group setting
-            for it in self._multi_iter():
-                yield it
-
-    def _multi_iter(self):
-        tipo = type(self.obj)
-        if isinstance(self.obj, DataFrame):
-            data = self.obj
-        elif isinstance(self.obj, NDFrame):
-            data = self.obj._data
-        else:
-            data = self.obj
+            keys = self._group_keys
+            for i, group in enumerate(self._iter_groups(self.obj, self.axis)):
+                yield tuple(k[i] for k in keys) + (group,)
 
-        def flatten(gen, level=0):
-            ids = self.groupings[level].ids
-            for cat, subgen in gen:
-                if isinstance(subgen, tipo):
-                    yield (ids[cat],), subgen
-                else:
-                    for subcat, data in flatten(subgen, level=level+1):
-                        if len(data) == 0:
-                            continue
-                        yield (ids[cat],) + subcat, data
+    @property
+    def _group_info(self):
+        """
+        (comp_ids, ngroups, group_labels): the group of each row (-1 if any
+        of its keys is NA), the number of observed groups, and the label of
+        every group in each grouping. Groups are numbered in sorted key order
+        """
+        if self._cached_group_info is None:
+            label_list = [ping.labels for ping in self.groupings]
+            shape = [len(ping.group_index) for ping in self.groupings]
+
+            if len(label_list) == 1:
+                # already dense and sorted
+                info = (label_list[0], shape[0],
+                        [np.arange(shape[0], dtype=np.int32)])
+            else:
+                info = _get_group_info(label_list, shape)
+            self._cached_group_info = info
+        return self._cached_group_info
+
+    _cached_group_info = None
+
+    @property
+    def _group_keys(self):
+        """
+        Values of each grouping for every group, in group order
+        """
+        _, _, group_labels = self._group_info
+        return [np.asarray(ping.levels, dtype=object).take(labels)
+                for ping, labels in zip(self.groupings, group_labels)]
+
+    @property
+    def _result_index(self):
+        if len(self.groupings) == 1:
+            return self.primary.group_index
+
+        _, _, group_labels = self._group_info
+        levels = []
+        labels = []
+        for ping, labs in zip(self.groupings, group_labels):
+            level = ping.group_index
 
-        gen = self._generator_factory(data)
+            # drop keys only ever seen alongside NA in another grouping
+            observed = np.bincount(labs, minlength=len(level)) > 0
+            if not observed.all():
+                level = Index(np.asarray(level)[observed])
+                recode = (observed.cumsum() - 1).astype(np.int32)
+                labs = recode.take(labs)
 
-        for cats, data in flatten(gen):
-            yield cats + (data,)
+            levels.append(level)
+            labels.append(labs)
+
+        return MultiIndex(levels=levels, labels=labels)
+
+    def _get_group_indexers(self):
+        """
+        Positions of the rows in each group, in group order, from a single
+        counting sort of the group ids
+        """
+        comp_ids, ngroups, _ = self._group_info
+        sorter, counts = _tseries.groupsort_indexer(comp_ids, ngroups)
+
+        # NA rows sort first
+        start = counts[0]
+        for i in xrange(ngroups):
+            end = start + counts[i + 1]
+            yield sorter[start:end]
+            start = end
+
+    def _iter_groups(self, obj, axis=0):
+        for indexer in self._get_group_indexers():
+            if isinstance(obj, DataFrame):
+                yield obj.take(indexer, axis=axis)
+            else:
+                yield obj.take(indexer)
 
     def aggregate(self, func):
         raise NotImplementedError
@@ -160,12 +255,6 @@ class GroupBy(object):
     def agg(self, func):
         return self.aggregate(func)
 
-    def _get_names(self):
-        axes = [ping.levels for ping in self.groupings]
-        grouping_names = [ping.name for ping in self.groupings]
-        shape = self._group_shape
-        return zip(grouping_names, _ravel_names(axes, shape))
-
     def _iterate_slices(self):
         yield self.name, self.obj
 
@@ -190,97 +279,85 @@ class GroupBy(object):
         except Exception:
             return self.aggregate(np.sum)
 
-    def _cython_agg_general(self, how):
-        label_list = [ping.labels for ping in self.groupings]
-        shape = self._group_shape
+    prod = _groupby_function('prod', 'prod', lambda x: x.prod(),
+                             'Compute product of values, excluding '
+                             'missing values')
+    min = _groupby_function('min', 'min', lambda x: x.min(),
+                            'Compute minimum of values, excluding missing '
+                            'values')
+    max = _groupby_function('max', 'max', lambda x: x.max(),
+                            'Compute maximum of values, excluding missing '
+                            'values')
+    count = _groupby_function('count', 'count', lambda x: x.count(),
+                              'Compute number of non-missing values in each '
+                              'group')
+    var = _groupby_function('var', 'var', lambda x: x.var(),
+                            'Compute unbiased variance of groups, excluding '
+                            'missing values')
+    std = _groupby_function('std', 'std', lambda x: x.std(),
+                            'Compute unbiased standard deviation of groups, '
+                            'excluding missing values')
+    first = _groupby_function('first', 'first', _first_compat,
+                              'Compute first non-missing value of each group')
+    last = _groupby_function('last', 'last', _last_compat,
+                             'Compute last non-missing value of each group')
 
-        # TODO: address inefficiencies, like duplicating effort (should
-        # aggregate all the columns at once?)
+    def _cython_agg_general(self, how):
+        comp_ids, ngroups, _ = self._group_info
 
-        output = {}
-        cannot_agg = []
+        names = []
+        columns = []
         for name, obj in self._iterate_slices():
             try:
-                obj = np.asarray(obj, dtype=float)
+                values = np.asarray(obj, dtype=float)
             except ValueError:
-                cannot_agg.append(name)
                 continue
+            names.append(name)
+            columns.append(values)
 
-            result, counts =  _tseries.group_aggregate(obj, label_list,
-                                                       shape, how=how)
-            result = result.ravel()
-            mask = counts.ravel() > 0
-            output[name] = result[mask]
+        if len(columns) == 0:
+            raise Exception('No numeric types to aggregate')
 
-        return self._wrap_aggregated_output(output, mask)
+        # aggregate all the columns in a single pass over the rows
+        values = np.column_stack(columns)
+        result = _aggregate_labels(values, comp_ids, ngroups, how)
 
-    def _get_multi_index(self, mask):
-        name_list = self._get_names()
-        masked = [raveled[mask] for _, raveled in name_list]
-        return MultiIndex.from_arrays(masked)
+        output = dict(zip(names, result.T))
+        return self._wrap_aggregated_output(output)
 
     def _python_agg_general(self, arg):
-        group_shape = self._group_shape
-        counts = np.zeros(group_shape, dtype=int)
-
-        # want to cythonize?
-        def _doit(reschunk, ctchunk, gen, shape_axis=0):
-            for i, (_, subgen) in enumerate(gen):
-                if isinstance(subgen, PandasObject):
-                    size = subgen.shape[shape_axis]
-                    ctchunk[i] = size
-                    if size == 0:
-                        continue
-                    reschunk[i] = arg(subgen)
-                else:
-                    _doit(reschunk[i], ctchunk[i], subgen,
-                          shape_axis=shape_axis)
-
-        gen_factory = self._generator_factory
+        ngroups = self._group_info[1]
 
         try:
-            stride_shape = self._agg_stride_shape
-            output = np.empty(group_shape + stride_shape,
+            output = np.empty((ngroups,) + self._agg_stride_shape,
                               dtype=float)
-            output.fill(np.nan)
             obj = self._get_obj_with_exclusions()
-            _doit(output, counts, gen_factory(obj),
-                  shape_axis=self.axis)
-
-            mask = counts.ravel() > 0
-            output = output.reshape((np.prod(group_shape),) + stride_shape)
-            output = output[mask]
+            groups = self._iter_groups(obj, axis=self.axis)
+            for i, group in enumerate(groups):
+                output[i] = arg(group)
         except TypeError:
-            result = np.empty(group_shape, dtype=float)
-            result.fill(np.nan)
             # iterate through "columns" ex exclusions to populate output dict
             output = {}
             for name, obj in self._iterate_slices():
-                _doit(result, counts, gen_factory(obj))
-                # TODO: same mask for every column...
-                result.fill(np.nan)
-                output[name] = result.ravel()
-
-            mask = counts.ravel() > 0
-            for name, result in output.iteritems():
-                output[name] = result[mask]
-
-        return self._wrap_aggregated_output(output, mask)
-
-    @property
-    def _generator_factory(self):
-        labels = [ping.labels for ping in self.groupings]
-        shape = self._group_shape
-
-        if isinstance(self.obj, NDFrame):
-            factory = self.obj._constructor
-        else:
-            factory = None
-
-        factory = None
-        axis = self.axis
-        return lambda obj: generate_groups(obj, labels, shape, axis=axis,
-                                           factory=factory)
+                result = np.empty(ngroups, dtype=float)
+                for i, group in enumerate(self._iter_groups(obj)):
+                    result[i] = arg(group)
+                output[name] = result
+
+        return self._wrap_aggregated_output(output)
+
+_cython_functions = {
+    'add' : _tseries.group_add,
+    'prod' : _tseries.group_prod,
+    'min' : _tseries.group_min,
+    'max' : _tseries.group_max,
+    'mean' : _tseries.group_mean,
+    'var' : _tseries.group_var,
+    'std' : _tseries.group_var,
+    'first' : _tseries.group_first,
+    'last' : _tseries.group_last,
+    'count' : _tseries.group_count,
+}
 
 class Grouping(object):
 
@@ -288,23 +365,22 @@ class Grouping(object):
         self.name = name
         self.level = level
         self.grouper = _convert_grouper(index, grouper)
+        self.index = index
 
         if level is not None:
             inds = index.labels[level]
-            labels = index.levels[level].values.take(inds)
+            labels = np.asarray(index.levels[level], dtype=object).take(inds)
 
             if grouper is not None:
                 self.grouper = _tseries.arrmap(labels, self.grouper)
             else:
                 self.grouper = labels
 
-        self.index = index.values
-
         # no level passed
         if not isinstance(self.grouper, np.ndarray):
-            self.grouper = _tseries.arrmap(self.index, self.grouper)
-
-        self.indices = _tseries.groupby_indices(self.grouper)
+            self.grouper = _tseries.arrmap(np.asarray(index.values,
+                                                      dtype=object),
+                                           self.grouper)
 
     def __repr__(self):
         return 'Grouping(%s)' % self.name
@@ -317,8 +393,10 @@ class Grouping(object):
         return self.index.take(inds)
 
     _labels = None
+    _uniques = None
     _ids = None
     _counts = None
+    _group_index = None
 
     @property
     def labels(self):
@@ -329,12 +407,18 @@ class Grouping(object):
     @property
     def ids(self):
         if self._ids is None:
-            self._make_labels()
+            self._ids = dict(enumerate(self._uniques))
         return self._ids
 
     @property
     def levels(self):
-        return [self.ids[k] for k in sorted(self.ids)]
+        return list(self.uniques)
+
+    @property
+    def uniques(self):
+        if self._uniques is None:
+            self._make_labels()
+        return self._uniques
 
     @property
     def counts(self):
@@ -342,20 +426,51 @@ class Grouping(object):
             self._make_labels()
         return self._counts
 
+    @property
+    def group_index(self):
+        if self._group_index is None:
+            self._make_labels()
+        return self._group_index
+
     def _make_labels(self):
-        ids, labels, counts  = _tseries.group_labels(self.grouper)
-        sids, slabels, scounts = sort_group_labels(ids, labels, counts)
-        self._labels = slabels
-        self._ids = sids
-        self._counts = scounts
+        labels, uniques = _factorize(self.grouper)
+        self._labels = labels
+        self._uniques = uniques
+        self._counts = np.bincount(labels[labels != -1],
+                                   minlength=len(uniques)).astype(np.int32)
+        self._group_index = _make_group_index(uniques)
+
+    _indices = None
+    @property
+    def indices(self):
+        if self._indices is None:
+            sorter, counts = _tseries.groupsort_indexer(self.labels,
+                                                        len(self.uniques))
+            self._indices = {}
+            start = counts[0]
+            for i, key in enumerate(self.levels):
+                end = start + counts[i + 1]
+                self._indices[key] = sorter[start:end]
+                start = end
+        return self._indices
 
     _groups = None
     @property
     def groups(self):
         if self._groups is None:
-            self._groups = _tseries.groupby(self.index, self.grouper)
+            self._groups = _tseries.groupby(
+                np.asarray(self.index.values, dtype=object),
+                np.asarray(self.grouper, dtype=object))
         return self._groups
 
+def _make_group_index(uniques):
+    # numbers produced by a mapping function come out as objects
+    if uniques.dtype == np.object_:
+        converted = np.array(list(uniques))
+        if issubclass(converted.dtype.type, (np.integer, np.floating)):
+            uniques = converted
+    return Index(uniques)
+
 def _get_groupings(obj, grouper=None, axis=0, level=None):
     group_axis = obj._get_axis(axis)
 
@@ -390,18 +505,23 @@ def _convert_grouper(axis, grouper):
         return grouper.get
     elif isinstance(grouper, Series):
         if grouper.index.equals(axis):
-            return np.asarray(grouper, dtype=object)
+            return _grouper_values(grouper.values)
         else:
             return grouper.__getitem__
     elif isinstance(grouper, (list, np.ndarray)):
         assert(len(grouper) == len(axis))
-        return np.asarray(grouper, dtype=object)
+        return _grouper_values(grouper)
     else:
         return grouper
 
-class SeriesGroupBy(GroupBy):
+def _grouper_values(grouper):
+    # numeric keys are factorized without boxing them
+    values = np.asarray(grouper)
+    if not issubclass(values.dtype.type, (np.integer, np.floating)):
+        values = np.asarray(grouper, dtype=object)
+    return values
 
-    _cythonized_methods = set(['add', 'mean'])
+class SeriesGroupBy(GroupBy):
 
     @property
     def _agg_stride_shape(self):
@@ -458,17 +578,12 @@ class SeriesGroupBy(GroupBy):
 
         return ret
 
-    def _wrap_aggregated_output(self, output, mask):
+    def _wrap_aggregated_output(self, output):
         if isinstance(output, dict):
             # sort of a kludge
             output = output[self.name]
 
-        if len(self.groupings) > 1:
-            index = self._get_multi_index(mask)
-            return Series(output, index=index)
-        else:
-            name_list = self._get_names()
-            return Series(output, index=name_list[0][1])
+        return Series(output, index=self._result_index)
 
     def _aggregate_multiple_funcs(self, arg):
         if not isinstance(arg, dict):
@@ -546,19 +661,6 @@ class SeriesGroupBy(GroupBy):
 
         return result
 
-def _ravel_names(axes, shape):
-    """
-    Compute labeling vector for raveled values vector
-    """
-    unrolled = []
-    for i, ax in enumerate(axes):
-        tile_shape = shape[:i] + shape[i+1:] + (1,)
-        tiled = np.tile(ax, tile_shape)
-        tiled = tiled.swapaxes(i, -1)
-        unrolled.append(tiled.ravel())
-
-    return unrolled
-
 class DataFrameGroupBy(GroupBy):
 
     def get_group(self, name, obj=None):
@@ -681,13 +783,8 @@ class DataFrameGroupBy(GroupBy):
 
         return DataFrame(result)
 
-    def _wrap_aggregated_output(self, output, mask):
-        if len(self.groupings) > 1:
-            index = self._get_multi_index(mask)
-            result = DataFrame(output, index=index)
-        else:
-            name_list = self._get_names()
-            result = DataFrame(output, index=name_list[0][1])
+    def _wrap_aggregated_output(self, output):
+        result = DataFrame(output, index=self._result_index)
 
         if self.axis == 1:
             result = result.T
@@ -808,95 +905,74 @@ class LongPanelGroupBy(GroupBy):
     pass
 
 #-------------------------------------------------------------------------------
-# Grouping generator for BlockManager
+# Group ids from the labels of several groupings
 
-def generate_groups(data, label_list, shape, axis=0, factory=lambda x: x):
+_INT64_MAX = np.iinfo(np.int64).max
+
+def _get_group_info(label_list, shape):
     """
-    Parameters
-    ----------
-    data : BlockManager
+    Number the observed combinations of labels in sorted order
 
     Returns
     -------
-    generator
+    (comp_ids, ngroups, group_labels)
+        comp_ids is the group of each row, -1 if any label is NA, and
+        group_labels the label of every group in each of label_list
     """
-    sorted_data, sorted_labels = _group_reorder(data, label_list, axis=axis)
-
-    gen = _generate_groups(sorted_data, sorted_labels, shape,
-                           0, len(label_list[0]), axis=axis, which=0,
-                           factory=factory)
-    for key, group in gen:
-        yield key, group
-
-def _group_reorder(data, label_list, axis=0):
-    indexer = np.lexsort(label_list[::-1])
-    sorted_labels = [labels.take(indexer) for labels in label_list]
-
-    if isinstance(data, BlockManager):
-        # this is sort of wasteful but...
-        sorted_axis = data.axes[axis].take(indexer)
-        sorted_data = data.reindex_axis(sorted_axis, axis=axis)
-    if isinstance(data, Series):
-        sorted_axis = data.index.take(indexer)
-        sorted_data = data.reindex(sorted_axis)
-    elif isinstance(data, DataFrame):
-        sorted_data = data.take(indexer, axis=axis)
-
-    return sorted_data, sorted_labels
-
-def _generate_groups(data, labels, shape, start, end, axis=0, which=0,
-                     factory=lambda x: x):
-    axis_labels = labels[which][start:end]
-    edges = axis_labels.searchsorted(np.arange(1, shape[which] + 1),
-                                     side='left')
-
-    if isinstance(data, DataFrame):
-        def slicer(data, slob):
-            if axis == 0:
-                return data[slob]
-            else:
-                return data.ix[:, slob]
-    elif isinstance(data, BlockManager):
-        def slicer(data, slob):
-            return factory(data.get_slice(slob, axis=axis))
-    else:
-        def slicer(data, slob):
-            return data[slob]
+    group_index, mask = _get_group_index(label_list, shape)
+    comp_ids, ngroups = _compress_group_index(group_index, mask)
 
-    do_slice = which == len(labels) - 1
+    # label of each group in each grouping, read off any of its rows
+    valid = ~mask
+    group_ids = comp_ids[valid]
+    group_labels = []
+    for labels in label_list:
+        group_labs = np.empty(ngroups, dtype=np.int32)
+        group_labs[group_ids] = labels[valid]
+        group_labels.append(group_labs)
 
-    # omit -1 values at beginning-- NA values
-    left = axis_labels.searchsorted(0)
+    return comp_ids, ngroups, group_labels
 
-    # time to actually aggregate
-    for i, right in enumerate(edges):
-        if do_slice:
-            slob = slice(start + left, start + right)
-            yield i, slicer(data, slob)
-        else:
-            # yield subgenerators, yikes
-            yield i, _generate_groups(data, labels, shape, start + left,
-                                      start + right, axis=axis,
-                                      which=which + 1, factory=factory)
-
-        left = right
+def _get_group_index(label_list, shape):
+    """
+    Combine the labels of several groupings into a single int64 key per row,
+    ordered like the tuples of labels. Where the product of the group counts
+    would overflow int64, the keys seen so far are first compressed to
+    dense labels
 
-#----------------------------------------------------------------------
-# sorting levels...cleverly?
+    Returns
+    -------
+    (group_index, mask) : mask is True for rows with an NA key
+    """
+    group_index = label_list[0].astype(np.int64)
+    mask = label_list[0] == -1
+    size = shape[0]
 
-def sort_group_labels(ids, labels, counts):
-    n = len(ids)
-    rng = np.arange(n)
-    values = Series(ids, index=rng, dtype=object).values
-    indexer = values.argsort()
+    for labels, n in zip(label_list[1:], shape[1:]):
+        if size * n > _INT64_MAX:
+            group_index, size = _compress_group_index(group_index, mask)
+            group_index = group_index.astype(np.int64)
 
-    reverse_indexer = np.empty(n, dtype=np.int32)
-    reverse_indexer.put(indexer, np.arange(n))
+        group_index = group_index * n + labels
+        mask |= labels == -1
+        size *= n
 
-    new_labels = reverse_indexer.take(labels)
-    np.putmask(new_labels, labels == -1, -1)
+    return group_index, mask
 
-    new_ids = dict(izip(rng, values.take(indexer)))
-    new_counts = counts.take(indexer)
+def _compress_group_index(group_index, mask):
+    """
+    Number the distinct keys 0..ngroups-1 in sorted order, -1 where masked
 
-    return new_ids, new_labels, new_counts
+    Returns
+    -------
+    (comp_ids, ngroups)
+    """
+    if not mask.any():
+        comp_ids, uniques = _factorize(group_index)
+        return comp_ids, len(uniques)
+
+    comp_ids = np.empty(len(group_index), dtype=np.int32)
+    comp_ids.fill(-1)
+    labels, uniques = _factorize(group_index[~mask])
+    comp_ids[~mask] = labels
+    return comp_ids, len(uniques)
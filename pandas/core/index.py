@@ -1,6 +1,6 @@
 # pylint: disable=E1101,E1103,W0232
 
-from datetime import time
+from datetime import datetime, time, timedelta
 from itertools import izip
 
 import numpy as np
@@ -10,7 +10,7 @@ from pandas.core.common import (_format, adjoin as _adjoin, _stringify,
 import pandas.core.common as common
 import pandas._tseries as _tseries
 
-__all__ = ['Index']
+__all__ = ['Index', 'Int64Index', 'Float64Index', 'DatetimeIndex']
 
 def _indexOp(opname):
     """
@@ -36,10 +36,22 @@ class Index(np.ndarray):
     Note
     ----
     An Index instance can **only** contain immutable objects for
-    reasons of hashability.
+    reasons of hashability. Integer and floating point ndarrays passed
+    without a dtype produce an Int64Index or Float64Index, unless the integers
+    do not fit in int64
     """
-    def __new__(cls, data, dtype=object, copy=False):
+    def __new__(cls, data, dtype=None, copy=False):
         if isinstance(data, np.ndarray):
+            if dtype is None:
+                if issubclass(data.dtype.type, np.integer):
+                    try:
+                        return Int64Index(data, copy=copy)
+                    except TypeError:
+                        # e.g. uint64 labels beyond the int64 range
+                        pass
+                elif issubclass(data.dtype.type, np.floating):
+                    return Float64Index(data, copy=copy)
+                dtype = object
             subarr = np.array(data, dtype=dtype, copy=copy)
         elif np.isscalar(data):
             raise ValueError('Index(...) must be called with a collection '
@@ -48,7 +60,7 @@ class Index(np.ndarray):
             # other iterable of some kind
             if not isinstance(data, (list, tuple)):
                 data = list(data)
-            subarr = np.empty(len(data), dtype=dtype)
+            subarr = np.empty(len(data), dtype=dtype or object)
             subarr[:] = data
         return subarr.view(cls)
 
@@ -67,11 +79,29 @@ class Index(np.ndarray):
     @property
     def indexMap(self):
         if self._indexMap is None:
-            self._indexMap = _tseries.map_indices_buf(self)
-            self._verify_integrity()
+            self._indexMap = _tseries.map_indices_buf(
+                np.asarray(self.values, dtype=object))
+            if len(self._indexMap) < len(self):
+                raise Exception('Index cannot contain duplicate values!')
 
         return self._indexMap
 
+    _engine_type = _tseries.ObjectEngine
+
+    _cached_engine = None
+    @property
+    def _engine(self):
+        # label lookups, created lazily and shared with views of this Index
+        if self._cached_engine is None:
+            self._cached_engine = self._engine_type(self.view(np.ndarray))
+
+        return self._cached_engine
+
+    def __array_finalize__(self, obj):
+        if (isinstance(obj, Index) and obj._cached_engine is not None and
+            _same_data(self, obj)):
+            self._cached_engine = obj._cached_engine
+
     _allDates = None
     def is_all_dates(self):
         if self._allDates is None:
@@ -80,7 +110,7 @@ class Index(np.ndarray):
         return self._allDates
 
     def _verify_integrity(self):
-        if len(self.indexMap) < len(self):
+        if not self._engine.is_unique:
             raise Exception('Index cannot contain duplicate values!')
 
     def __iter__(self):
@@ -97,7 +127,7 @@ class Index(np.ndarray):
         return self
 
     def __contains__(self, key):
-        return key in self.indexMap
+        return key in self._engine
 
     def __hash__(self):
         return hash(self.view(np.ndarray))
@@ -149,7 +179,7 @@ class Index(np.ndarray):
         return np.array_equal(self, other)
 
     def asOfDate(self, date):
-        if date not in self.indexMap:
+        if date not in self:
             loc = self.searchsorted(date, side='left')
             if loc > 0:
                 return self[loc-1]
@@ -203,7 +233,10 @@ class Index(np.ndarray):
         if len(other) == 0 or self.equals(other):
             return self
 
-        new_seq = np.concatenate((self, other))
+        if isinstance(other, Index):
+            other = other.values
+
+        new_seq = np.concatenate((self.values, other))
         try:
             new_seq = np.unique(new_seq)
         except Exception:
@@ -239,14 +272,121 @@ class Index(np.ndarray):
         if self.equals(other):
             return Index([])
 
+        if isinstance(other, Index):
+            other = other.values
+
         otherArr = np.asarray(other)
         theDiff = sorted(set(self) - set(otherArr))
         return Index(theDiff)
 
     __sub__ = lambda self, other: self.diff(other)
 
+    @property
+    def is_unique(self):
+        return self._engine.is_unique
+
+    @property
+    def is_monotonic(self):
+        """
+        True if the labels are sorted and unique
+        """
+        return self._engine.is_monotonic
+
+    _left_indexer = staticmethod(_tseries.left_join_indexer_object)
+    _inner_indexer = staticmethod(_tseries.inner_join_indexer_object)
+    _outer_indexer = staticmethod(_tseries.outer_join_indexer_object)
+
+    def join(self, other, how='left', return_indexers=False):
+        """
+        Join two Index objects. Sorted, unique indexes are merged in a single
+        pass, otherwise the join index is formed with union / intersection and
+        both sides are looked up in it
+
+        Parameters
+        ----------
+        other : Index
+        how : {'left', 'right', 'inner', 'outer'}
+        return_indexers : boolean, default False
+
+        Returns
+        -------
+        join_index, (left_indexer, right_indexer)
+            The indexers locate each join_index label in self and in other,
+            -1 where it is missing. An indexer is None if that Index is
+            already the join index
+        """
+        other = _ensure_index(other)
+
+        if self.equals(other):
+            join_index, lidx, ridx = self, None, None
+        elif (not isinstance(other, MultiIndex) and self.is_monotonic and
+              other.is_monotonic):
+            join_index, lidx, ridx = self._join_monotonic(other, how)
+        else:
+            join_index, lidx, ridx = self._join_general(other, how)
+
+        if return_indexers:
+            return join_index, lidx, ridx
+        else:
+            return join_index
+
+    def _join_general(self, other, how):
+        if how == 'left':
+            join_index = self
+        elif how == 'right':
+            join_index = other
+        elif how == 'inner':
+            join_index = self.intersection(other)
+        elif how == 'outer':
+            join_index = self.union(other)
+        else:
+            raise Exception('do not recognize join method %s' % how)
+
+        lidx = ridx = None
+        if join_index is not self:
+            lidx = self.get_indexer(join_index)[0]
+        if join_index is not other:
+            ridx = other.get_indexer(join_index)[0]
+        return join_index, lidx, ridx
+
+    def _join_monotonic(self, other, how):
+        if how in ('left', 'right'):
+            # the join index is given, and hash lookups are cheaper than
+            # comparing boxed objects
+            return self._join_general(other, how)
+
+        return self._merge_join(other, np.asarray(self.values, dtype=object),
+                                np.asarray(other.values, dtype=object), how)
+
+    def _merge_join(self, other, lvalues, rvalues, how):
+        if how == 'left':
+            join_index = self
+            lidx = None
+            ridx = self._left_indexer(lvalues, rvalues)
+        elif how == 'right':
+            join_index = other
+            lidx = self._left_indexer(rvalues, lvalues)
+            ridx = None
+        elif how in ('inner', 'outer'):
+            if how == 'inner':
+                joined, lidx, ridx = self._inner_indexer(lvalues, rvalues)
+            else:
+                joined, lidx, ridx = self._outer_indexer(lvalues, rvalues)
+
+            if len(joined) == len(self):
+                join_index, lidx = self, None
+            else:
+                join_index = self._wrap_joined_index(joined, other)
+        else:
+            raise Exception('do not recognize join method %s' % how)
+
+        return join_index, lidx, ridx
+
+    def _wrap_joined_index(self, joined, other):
+        return Index(joined)
+
     def get_loc(self, key):
-        return self.indexMap[key]
+        return self._engine.get_loc(key)
 
     def get_indexer(self, target, method=None):
         """
@@ -260,19 +400,20 @@ class Index(np.ndarray):
         -------
         (indexer, mask)
         """
-        if method:
-            method = method.upper()
+        method = _get_fill_method(method)
+        target = _ensure_index(target)
 
-        aliases = {
-            'FFILL' : 'PAD',
-            'BFILL' : 'BACKFILL'
-        }
+        if method is None:
+            indexer = self._engine.get_indexer(target.values)
+            return indexer, indexer != -1
 
-        target = _ensure_index(target)
+        return self._get_fill_indexer(target, method)
 
-        method = aliases.get(method, method)
-        indexer, mask = _tseries.getFillVec(self, target, self.indexMap,
-                                            target.indexMap, method)
+    def _get_fill_indexer(self, target, method):
+        indexer, mask = _tseries.getFillVec(
+            np.asarray(self.values, dtype=object),
+            np.asarray(target.values, dtype=object),
+            self.indexMap, target.indexMap, method)
         return indexer, mask
 
     def reindex(self, target, method=None):
@@ -294,14 +435,14 @@ class Index(np.ndarray):
         if start is None:
             beg_slice = 0
         elif start in self:
-            beg_slice = self.indexMap[start]
+            beg_slice = self.get_loc(start)
         else:
             beg_slice = self.searchsorted(start, side='left')
 
         if end is None:
             end_slice = len(self)
-        elif end in self.indexMap:
-            end_slice = self.indexMap[end] + 1
+        elif end in self:
+            end_slice = self.get_loc(end) + 1
         else:
             end_slice = self.searchsorted(end, side='right')
 
@@ -331,6 +472,378 @@ class Index(np.ndarray):
             raise ValueError('labels %s not contained in axis' % labels[-mask])
         return self.delete(indexer)
 
+class _NumericIndex(Index):
+    """
+    Index backed by a native numeric array. Subclasses set the dtype, lookup
+    engine and the typed kernels used for sorted labels
+    """
+    _dtype = None
+
+    def __new__(cls, data, dtype=None, copy=False):
+        if np.isscalar(data):
+            raise ValueError('Index(...) must be called with a collection '
+                             'of some kind, %s was passed' % repr(data))
+
+        if not isinstance(data, np.ndarray):
+            data = np.asarray(list(data))
+
+        subarr = np.array(data, dtype=cls._dtype, copy=copy)
+        if (subarr.dtype != data.dtype and
+            not ((subarr == data) | (subarr != subarr)).all()):
+            raise TypeError('Unsafe conversion of %s labels to %s'
+                            % (data.dtype, np.dtype(cls._dtype)))
+        return subarr.view(cls)
+
+    def is_all_dates(self):
+        return False
+
+    def _as_object_index(self):
+        return Index(self.values, dtype=object)
+
+    def _typed_values(self, other):
+        """
+        Values of other as an array of this Index's dtype, or None if they
+        would not all convert exactly
+        """
+        if isinstance(other, Index):
+            other = other.values
+        values = np.asarray(other)
+        if values.dtype == self._dtype:
+            return values
+
+        if values.dtype == np.object_ or issubclass(values.dtype.type,
+                                                    np.number):
+            try:
+                converted = values.astype(self._dtype)
+            except (TypeError, ValueError):
+                return None
+            if (converted == values).all():
+                return converted
+
+        return None
+
+    def _get_fill_indexer(self, target, method):
+        target_values = self._typed_values(target)
+        if (target_values is not None and self.is_monotonic and
+            type(self)(target_values).is_monotonic):
+            values = self.view(np.ndarray)
+            if method == 'PAD':
+                indexer = self._pad(values, target_values)
+            elif method == 'BACKFILL':
+                indexer = self._backfill(values, target_values)
+            else:
+                raise Exception("Don't recognize method: %s" % method)
+            return indexer, indexer != -1
+
+        return Index._get_fill_indexer(self._as_object_index(), target,
+                                       method)
+
+    def union(self, other):
+        if not hasattr(other, '__iter__'):
+            raise Exception('Input must be iterable!')
+
+        if len(other) == 0 or self.equals(other):
+            return self
+
+        other_values = self._typed_values(other)
+        if other_values is None:
+            return self._as_object_index().union(other)
+
+        values = self.view(np.ndarray)
+        if self.is_monotonic and type(self)(other_values).is_monotonic:
+            return type(self)(self._union(values, other_values))
+
+        return type(self)(np.union1d(values, other_values))
+
+    def intersection(self, other):
+        if not hasattr(other, '__iter__'):
+            raise Exception('Input must be iterable!')
+
+        if self.equals(other):
+            return self
+
+        other_values = self._typed_values(other)
+        if other_values is None:
+            return self._as_object_index().intersection(other)
+
+        values = self.view(np.ndarray)
+        if self.is_monotonic and type(self)(other_values).is_monotonic:
+            return type(self)(self._intersection(values, other_values))
+
+        return type(self)(np.intersect1d(values, other_values))
+
+    def _join_monotonic(self, other, how):
+        other_values = self._typed_values(other)
+        if other_values is None:
+            return self._join_general(other, how)
+
+        return self._merge_join(other, self.view(np.ndarray), other_values,
+                                how)
+
+    def _wrap_joined_index(self, joined, other):
+        return type(self)(joined)
+
+    def slice_locs(self, start=None, end=None):
+        if not self.is_monotonic:
+            return Index.slice_locs(self, start, end)
+
+        if start is None:
+            beg_slice = 0
+        else:
+            beg_slice = self.searchsorted(start, side='left')
+
+        if end is None:
+            end_slice = len(self)
+        else:
+            end_slice = self.searchsorted(end, side='right')
+
+        return beg_slice, end_slice
+
+class Int64Index(_NumericIndex):
+    """
+    Immutable ndarray of int64 labels, otherwise like Index. Lookups, set
+    operations and filling reindexers use typed routines rather than boxed
+    Python objects
+
+    Parameters
+    ----------
+    data : array-like (1-dimensional)
+    copy : bool
+        Make a copy of input ndarray
+    """
+    _dtype = np.int64
+    _engine_type = _tseries.Int64Engine
+
+    _pad = staticmethod(_tseries.pad_int64)
+    _backfill = staticmethod(_tseries.backfill_int64)
+    _union = staticmethod(_tseries.union_sorted_int64)
+    _intersection = staticmethod(_tseries.intersection_sorted_int64)
+    _left_indexer = staticmethod(_tseries.left_join_indexer_int64)
+    _inner_indexer = staticmethod(_tseries.inner_join_indexer_int64)
+    _outer_indexer = staticmethod(_tseries.outer_join_indexer_int64)
+
+class Float64Index(_NumericIndex):
+    """
+    Immutable ndarray of float64 labels, otherwise like Index. Lookups, set
+    operations and filling reindexers use typed routines rather than boxed
+    Python objects
+
+    Parameters
+    ----------
+    data : array-like (1-dimensional)
+    copy : bool
+        Make a copy of input ndarray
+    """
+    _dtype = np.float64
+    _engine_type = _tseries.Float64Engine
+
+    _pad = staticmethod(_tseries.pad_float64)
+    _backfill = staticmethod(_tseries.backfill_float64)
+    _union = staticmethod(_tseries.union_sorted_float64)
+    _intersection = staticmethod(_tseries.intersection_sorted_float64)
+    _left_indexer = staticmethod(_tseries.left_join_indexer_float64)
+    _inner_indexer = staticmethod(_tseries.inner_join_indexer_float64)
+    _outer_indexer = staticmethod(_tseries.outer_join_indexer_float64)
+
+def _timedelta_ns(delta):
+    return ((delta.days * 86400 + delta.seconds) * 1000000
+            + delta.microseconds) * 1000
+
+def _datetime_op(opname):
+    """
+    Comparison operators for DatetimeIndex, made on the int64 timestamps
+    """
+    def wrapper(self, other):
+        if isinstance(other, datetime):
+            other = _tseries.datetime_to_ns(other)
+        elif isinstance(other, DatetimeIndex):
+            other = other.asi8
+        elif hasattr(other, '__iter__'):
+            other = _tseries.array_datetime_to_ns(np.asarray(other,
+                                                             dtype=object))
+        func = getattr(self.asi8, opname)
+        return func(other)
+    return wrapper
+
+class DatetimeIndex(_NumericIndex):
+    """
+    Immutable ndarray of naive datetimes stored as int64 nanoseconds since
+    the epoch. Labels are boxed into datetime objects only when accessed;
+    lookups, set operations, searchsorted and filling reindexers work on the
+    integer timestamps
+
+    Parameters
+    ----------
+    data : array-like of datetimes, or int64 nanosecond timestamps
+    copy : bool
+        Make a copy of input ndarray
+    """
+    _dtype = np.int64
+    _engine_type = _tseries.Int64Engine
+
+    _pad = staticmethod(_tseries.pad_int64)
+    _backfill = staticmethod(_tseries.backfill_int64)
+    _union = staticmethod(_tseries.union_sorted_int64)
+    _intersection = staticmethod(_tseries.intersection_sorted_int64)
+    _left_indexer = staticmethod(_tseries.left_join_indexer_int64)
+    _inner_indexer = staticmethod(_tseries.inner_join_indexer_int64)
+    _outer_indexer = staticmethod(_tseries.outer_join_indexer_int64)
+
+    def __new__(cls, data, copy=False):
+        if isinstance(data, DatetimeIndex):
+            stamps = data.asi8
+        elif (isinstance(data, np.ndarray) and
+              issubclass(data.dtype.type, np.integer)):
+            stamps = data
+        elif not hasattr(data, '__iter__'):
+            raise ValueError('DatetimeIndex(...) must be called with a '
+                             'collection of some kind, %s was passed'
+                             % repr(data))
+        else:
+            if not isinstance(data, (list, tuple, np.ndarray)):
+                data = list(data)
+            stamps = _tseries.array_datetime_to_ns(np.asarray(data,
+                                                              dtype=object))
+
+        subarr = np.array(stamps, dtype=np.int64, copy=copy)
+        return subarr.view(cls)
+
+    def __repr__(self):
+        output = str(self.__class__) + '\n'
+        if len(self) > 0:
+            output += '[%s, ..., %s]\n' % (self[0], self[-1])
+        output += 'length: %d' % len(self)
+        return output
+
+    __str__ = __repr__
+
+    @property
+    def asi8(self):
+        """
+        The labels as int64 nanoseconds since the epoch
+        """
+        return self.view(np.ndarray)
+
+    @property
+    def values(self):
+        return _tseries.array_ns_to_datetime(self.asi8)
+
+    def is_all_dates(self):
+        return True
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __contains__(self, key):
+        try:
+            self.get_loc(key)
+            return True
+        except KeyError:
+            return False
+
+    def __getitem__(self, key):
+        arr_idx = self.asi8
+        if np.isscalar(key):
+            return _tseries.ns_to_datetime(arr_idx[key])
+        else:
+            if _is_bool_indexer(key):
+                key = np.asarray(key)
+
+            return DatetimeIndex(arr_idx[key])
+
+    def take(self, *args, **kwargs):
+        return DatetimeIndex(self.asi8.take(*args, **kwargs))
+
+    __eq__ = _datetime_op('__eq__')
+    __ne__ = _datetime_op('__ne__')
+    __lt__ = _datetime_op('__lt__')
+    __gt__ = _datetime_op('__gt__')
+    __le__ = _datetime_op('__le__')
+    __ge__ = _datetime_op('__ge__')
+
+    def _key_to_ns(self, key):
+        if isinstance(key, datetime):
+            try:
+                return _tseries.datetime_to_ns(key)
+            except ValueError:
+                pass
+        else:
+            # unhashable keys raise TypeError, as for the other indexes
+            hash(key)
+        raise KeyError(key)
+
+    def get_loc(self, key):
+        return self._engine.get_loc(self._key_to_ns(key))
+
+    def searchsorted(self, key, side='left'):
+        if isinstance(key, datetime):
+            key = _tseries.datetime_to_ns(key)
+        else:
+            key = self._typed_values(key)
+        return self.asi8.searchsorted(key, side=side)
+
+    def _typed_values(self, other):
+        if isinstance(other, DatetimeIndex):
+            return other.asi8
+        if isinstance(other, Index):
+            other = other.values
+
+        values = np.asarray(other, dtype=object)
+        try:
+            return _tseries.array_datetime_to_ns(values)
+        except (TypeError, ValueError):
+            return None
+
+    def _as_object_index(self):
+        return Index(self.values)
+
+    def equals(self, other):
+        if self is other:
+            return True
+
+        if isinstance(other, DatetimeIndex):
+            return np.array_equal(self.asi8, other.asi8)
+
+        if not isinstance(other, Index):
+            return False
+
+        return np.array_equal(self.values, other)
+
+    def get_indexer(self, target, method=None):
+        method = _get_fill_method(method)
+        target = _ensure_index(target)
+        target_values = self._typed_values(target)
+
+        if target_values is None:
+            return self._as_object_index().get_indexer(target, method=method)
+
+        if method is None:
+            indexer = self._engine.get_indexer(target_values)
+            return indexer, indexer != -1
+
+        return self._get_fill_indexer(target, method)
+
+    def shift(self, periods, offset):
+        if periods == 0:
+            # OK because immutable
+            return self
+
+        delta = getattr(offset, 'delta', offset)
+        if isinstance(delta, timedelta):
+            return DatetimeIndex(self.asi8 + periods * _timedelta_ns(delta))
+
+        return DatetimeIndex(Index.shift(self, periods, offset))
+
+    def delete(self, loc):
+        return DatetimeIndex(np.delete(self.asi8, loc))
+
+    def insert(self, loc, item):
+        stamps = self.asi8
+        new_stamps = np.concatenate((stamps[:loc],
+                                     [_tseries.datetime_to_ns(item)],
+                                     stamps[loc:]))
+        return DatetimeIndex(new_stamps)
+
 class DateIndex(Index):
     pass
 
@@ -406,8 +919,8 @@ class MultiIndex(Index):
 
     def __contains__(self, key):
         try:
-            label_key = self._get_label_key(key)
-            return label_key in self.indexMap
+            self._get_tuple_loc(key)
+            return True
         except Exception:
             return False
 
@@ -433,6 +946,67 @@ class MultiIndex(Index):
     def is_sorted(self):
         raise NotImplementedError
 
+    @property
+    def is_unique(self):
+        if self._label_keys is None:
+            return len(self.indexMap) == len(self)
+        return self._label_engine.is_unique
+
+    @property
+    def is_monotonic(self):
+        """
+        True if the tuples are sorted and unique
+        """
+        sorted_levels = all(lev.is_monotonic for lev in self.levels)
+        if not sorted_levels or self._label_keys is None:
+            return Index(self.values).is_monotonic
+
+        # with sorted levels, label keys sort like the tuples
+        return self._label_engine.is_monotonic
+
+    _cached_label_keys = None
+    @property
+    def _label_keys(self):
+        """
+        int64 array combining the labels of each row into one integer,
+        ordered like the label tuples. None if the product of the level sizes
+        overflows int64
+        """
+        if self._cached_label_keys is None:
+            self._cached_label_keys = _combine_labels(self.labels,
+                                                      self.levshape)
+        if self._cached_label_keys is False:
+            return None
+        return self._cached_label_keys
+
+    _cached_label_engine = None
+    @property
+    def _label_engine(self):
+        if self._cached_label_engine is None:
+            self._cached_label_engine = _tseries.Int64Engine(self._label_keys)
+        return self._cached_label_engine
+
+    def _recode_labels(self, other):
+        """
+        Label keys of the tuples of another MultiIndex in terms of the levels
+        of this one, -1 for tuples having a value not in the levels
+        """
+        codes = []
+        mask = np.zeros(len(other), dtype=bool)
+        for lev, olev, olabels in zip(self.levels, other.levels, other.labels):
+            if lev.equals(olev):
+                codes.append(olabels)
+                continue
+
+            level_map, _ = lev.get_indexer(olev)
+            ocodes = level_map.take(olabels)
+            mask |= ocodes == -1
+            codes.append(ocodes)
+
+        keys = _combine_labels(codes, self.levshape)
+        keys[mask] = -1
+        return keys
+
     @classmethod
     def from_arrays(cls, arrays, sortorder=None):
         """
@@ -467,10 +1041,15 @@ class MultiIndex(Index):
         if self._indexMap is None:
             zipped = zip(*self.labels)
             self._indexMap = _tseries.map_indices_list(zipped)
-            self._verify_integrity()
+            if len(self._indexMap) < len(self):
+                raise Exception('Index cannot contain duplicate values!')
 
         return self._indexMap
 
+    def _verify_integrity(self):
+        # raises if there are duplicate label tuples
+        self.indexMap
+
     @property
     def nlevels(self):
         return len(self.levels)
@@ -603,24 +1182,27 @@ class MultiIndex(Index):
         -------
         (indexer, mask)
         """
-        if method:
-            method = method.upper()
+        method = _get_fill_method(method)
+
+        if not isinstance(target, MultiIndex) and len(target) > 0:
+            val = target[0]
+            if not isinstance(val, tuple) or len(val) != self.nlevels:
+                raise ValueError('can only pass MultiIndex or '
+                                 'array of tuples')
 
-        aliases = {
-            'FFILL' : 'PAD',
-            'BFILL' : 'BACKFILL'
-        }
-        method = aliases.get(method, method)
+        if (method is None and len(target) > 0 and
+            self._label_keys is not None):
+            if not isinstance(target, MultiIndex):
+                target = MultiIndex.from_tuples(target)
+
+            # look up the combined labels, no tuples needed
+            target_keys = self._recode_labels(target)
+            indexer = self._label_engine.get_indexer(target_keys)
+            return indexer, indexer != -1
 
         if isinstance(target, MultiIndex):
             target_index = target.get_tuple_index()
         else:
-            if len(target) > 0:
-                val = target[0]
-                if not isinstance(val, tuple) or len(val) != self.nlevels:
-                    raise ValueError('can only pass MultiIndex or '
-                                     'array of tuples')
-
             target_index = target
 
         self_index = self.get_tuple_index()
@@ -717,7 +1299,13 @@ class MultiIndex(Index):
     def _get_tuple_loc(self, tup):
         indexer = self._get_label_key(tup)
         try:
-            return self.indexMap[indexer]
+            if self._label_keys is None:
+                return self.indexMap[indexer]
+
+            key = 0
+            for code, size in zip(indexer, self.levshape):
+                key = key * size + code
+            return self._label_engine.get_loc(key)
         except KeyError:
             raise KeyError(str(tup))
 
@@ -793,6 +1381,10 @@ class MultiIndex(Index):
                 return False
         return True
 
+    def _join_monotonic(self, other, how):
+        # no merge kernels for tuples, keep the MultiIndex set operations
+        return self._join_general(other, how)
+
     def union(self, other):
         """
         Form the union of two MultiIndex objects
@@ -810,7 +1402,10 @@ class MultiIndex(Index):
         if len(other) == 0 or self.equals(other):
             return self
 
-        # TODO: optimize / make less wasteful
+        result = self._labels_setop(other, 'union')
+        if result is not None:
+            return result
+
         self_tuples = self.get_tuple_index()
         other_tuples = other.get_tuple_index()
         uniq_tuples = np.unique(np.concatenate((self_tuples, other_tuples)))
@@ -833,12 +1428,70 @@ class MultiIndex(Index):
         if self.equals(other):
             return self
 
-        # TODO: optimize / make less wasteful
+        result = self._labels_setop(other, 'intersection')
+        if result is not None:
+            return result
+
         self_tuples = self.get_tuple_index()
         other_tuples = other.get_tuple_index()
         uniq_tuples = sorted(set(self_tuples) & set(other_tuples))
         return MultiIndex.from_arrays(zip(*uniq_tuples), sortorder=0)
 
+    def _labels_setop(self, other, how):
+        """
+        union / intersection of the combined labels of both indexes, recoded
+        against the union of their levels. None if the levels cannot be
+        sorted or their product overflows int64
+        """
+        new_levels = []
+        self_codes = []
+        other_codes = []
+        for lev, olev, labels, olabels in zip(self.levels, other.levels,
+                                              self.labels, other.labels):
+            new_lev = lev.union(olev)
+            if not new_lev.is_monotonic:
+                return None
+
+            self_codes.append(new_lev.get_indexer(lev)[0].take(labels))
+            other_codes.append(new_lev.get_indexer(olev)[0].take(olabels))
+            new_levels.append(new_lev)
+
+        shape = [len(lev) for lev in new_levels]
+        self_keys = _combine_labels(self_codes, shape)
+        if self_keys is False:
+            return None
+        other_keys = _combine_labels(other_codes, shape)
+
+        if (Int64Index(self_keys).is_monotonic and
+            Int64Index(other_keys).is_monotonic):
+            # both sorted, merge in one pass
+            if how == 'union':
+                keys = _tseries.outer_join_indexer_int64(self_keys,
+                                                         other_keys)[0]
+            else:
+                keys = _tseries.inner_join_indexer_int64(self_keys,
+                                                         other_keys)[0]
+        elif how == 'union':
+            keys = np.unique(np.concatenate((self_keys, other_keys)))
+        else:
+            keys = np.intersect1d(self_keys, other_keys)
+
+        # only keep the level values which are used
+        new_labels = []
+        for size in reversed(shape):
+            new_labels.append(keys % size)
+            keys = keys // size
+        new_labels.reverse()
+
+        for i, labels in enumerate(new_labels):
+            used = np.bincount(labels, minlength=shape[i]) > 0
+            if not used.all():
+                new_levels[i] = new_levels[i][used]
+                labels = (used.cumsum() - 1).take(labels)
+            new_labels[i] = labels
+
+        return MultiIndex(levels=new_levels, labels=new_labels, sortorder=0)
+
     def _assert_can_do_setop(self, other):
         if not isinstance(other, MultiIndex):
             raise TypeError('can only call with other hierarchical '
@@ -869,6 +1522,39 @@ class MultiIndex(Index):
 
 NULL_INDEX = Index([])
 
+_INT64_MAX = np.iinfo(np.int64).max
+
+def _combine_labels(label_list, shape):
+    """
+    Combine labels into one int64 key per row, ordered like the tuples of
+    labels. False if the product of the level sizes overflows int64
+    """
+    size = 1
+    for n in shape:
+        size *= n
+    if size > _INT64_MAX:
+        return False
+
+    keys = np.zeros(len(label_list[0]), dtype=np.int64)
+    for labels, n in zip(label_list, shape):
+        keys *= n
+        keys += labels
+    return keys
+
+def _get_fill_method(method):
+    if method:
+        method = method.upper()
+
+    aliases = {
+        'FFILL' : 'PAD',
+        'BFILL' : 'BACKFILL'
+    }
+    return aliases.get(method, method)
+
+def _same_data(a, b):
+    return (a.__array_interface__['data'] == b.__array_interface__['data']
+            and a.shape == b.shape and a.strides == b.strides)
+
 def _sparsify(label_list):
     pivoted = zip(*label_list)
 
@@ -548,16 +548,26 @@ class BlockManager(object):
         cur_axis = self.axes[axis]
 
         new_axis, indexer, mask = cur_axis.reindex(new_axis, method)
+        return self.reindex_indexer(new_axis, indexer, axis=axis)
 
-        # TODO: deal with length-0 case? or does it fall out?
-        notmask = -mask
-        needs_masking = len(new_axis) > 0 and notmask.any()
+    def reindex_indexer(self, new_axis, indexer, axis=1):
+        """
+        Conform an axis to new_axis using a pre-computed indexer, -1 marking
+        labels to fill with NA. indexer=None means the data are already in
+        new_axis order
+        """
+        if indexer is None:
+            new_blocks = [block.copy() for block in self.blocks]
+        else:
+            # TODO: deal with length-0 case? or does it fall out?
+            notmask = indexer == -1
+            needs_masking = len(new_axis) > 0 and notmask.any()
 
-        new_blocks = []
-        for block in self.blocks:
-            newb = block.reindex_axis(indexer, notmask, needs_masking,
-                                      axis=axis)
-            new_blocks.append(newb)
+            new_blocks = []
+            for block in self.blocks:
+                newb = block.reindex_axis(indexer, notmask, needs_masking,
+                                          axis=axis)
+                new_blocks.append(newb)
 
         new_axes = list(self.axes)
         new_axes[axis] = new_axis
@@ -628,7 +638,7 @@ class BlockManager(object):
 
     def join_on(self, other, on, axis=1):
         other_axis = other.axes[axis]
-        indexer, mask = _tseries.getMergeVec(on, other_axis.indexMap)
+        indexer, mask = other_axis.get_indexer(on)
 
         # TODO: deal with length-0 case? or does it fall out?
         notmask = -mask
@@ -1177,27 +1177,21 @@ class LongPanel(Panel, DataFrame):
 
     toWide = to_wide
 
-    def toCSV(self, path):
-        def format_cols(items):
-            cols = ['Major', 'Minor'] + list(items)
-            return '"%s"' % '","'.join(cols)
-
-        def format_row(major, minor, values):
-            vals = ','.join('%.12f' % val for val in values)
-            return '%s,%s,%s' % (major, minor, vals)
-
+    def toCSV(self, path, chunksize=None):
         f = open(path, 'w')
-        self._textConvert(f, format_cols, format_row)
-        f.close()
+        cols = ['Major', 'Minor'] + list(self.items)
+        f.write('"%s"\n' % '","'.join(cols))
 
-    def _textConvert(self, buf, format_cols, format_row):
-        print >> buf, format_cols(self.items)
-
-        label_pairs = zip(self.major_axis.take(self.major_labels),
-                          self.minor_axis.take(self.minor_labels))
-        for i, (major, minor) in enumerate(label_pairs):
-            row = format_row(major, minor, self.values[i])
-            print >> buf, row
+        arrays = [np.asarray(self.major_axis).take(self.major_labels),
+                  np.asarray(self.minor_axis).take(self.minor_labels)]
+        values = self.values
+        if issubclass(values.dtype.type, (np.integer, np.bool_)):
+            # all values are written as floats
+            values = values.astype(np.float64)
+        arrays.extend(values.T)
+        common._write_csv(f, arrays, na_rep='nan', float_format='%.12f',
+                          chunksize=chunksize)
+        f.close()
 
     def swapaxes(self):
         """
@@ -1310,7 +1304,7 @@ class LongPanel(Panel, DataFrame):
         -------
         LongPanel
         """
-        idx = self.items.indexMap[item]
+        idx = self.items.get_loc(item)
         values = self.values[:, idx]
 
         distinct_values = np.array(sorted(set(values)))
@@ -1475,7 +1469,7 @@ def _get_combined_index(frames, intersect=False):
     union =  np.unique(np.concatenate(tuple(indexes)))
     return Index(union)
 
-def pivot(index, columns, values):
+def pivot(index, columns, values, aggfunc=None):
     """
     Produce 'pivot' table based on 3 columns of this DataFrame.
     Uses unique values from index / columns and fills with values.
@@ -1488,6 +1482,9 @@ def pivot(index, columns, values):
         Labels to use to make new frame's columns
     values : ndarray
         Values to use for populating new frame's values
+    aggfunc : function or string, optional
+        Used to combine the values of duplicate (index, columns) entries, e.g.
+        'mean' or np.sum. By default the last one is kept
 
     Note
     ----
@@ -1497,20 +1494,17 @@ def pivot(index, columns, values):
     -------
     DataFrame
     """
+    from pandas.core.series import _Unstacker
+
     assert(len(index) == len(columns) == len(values))
 
     if len(index) == 0:
         return DataFrame(index=[])
 
-    try:
-        longIndex = _make_long_index(index, columns)
-        valueMat = values.view(np.ndarray).reshape(len(values), 1)
-        longPanel = LongPanel(valueMat, ['foo'], longIndex)
-        longPanel = longPanel.sort()
-        return longPanel.to_wide()['foo']
-    except Exception:
-        return _slow_pivot(index, columns, values)
-
+    long_index = _make_long_index(index, columns)
+    unstacker = _Unstacker(np.asarray(values), long_index, level=1,
+                           aggfunc=aggfunc)
+    return unstacker.get_result()
 
 def make_mask(index):
     """
@@ -1524,41 +1518,12 @@ def make_mask(index):
     return mask
 
 def _make_long_index(major_values, minor_values):
-    major_axis = Index(sorted(set(major_values)))
-    minor_axis = Index(sorted(set(minor_values)))
-
-    major_labels, _ = _tseries.getMergeVec(major_values, major_axis.indexMap)
-    minor_labels, _ = _tseries.getMergeVec(minor_values, minor_axis.indexMap)
+    major_labels, major_axis = common._factorize(major_values)
+    minor_labels, minor_axis = common._factorize(minor_values)
 
     long_index = MultiIndex(levels=[major_axis, minor_axis],
                                  labels=[major_labels, minor_labels])
     return long_index
 
-def _slow_pivot(index, columns, values):
-    """
-    Produce 'pivot' table based on 3 columns of this DataFrame.
-    Uses unique values from index / columns and fills with values.
-
-    Parameters
-    ----------
-    index : string or object
-        Column name to use to make new frame's index
-    columns : string or object
-        Column name to use to make new frame's columns
-    values : string or object
-        Column name to use for populating new frame's values
-
-    Could benefit from some Cython here.
-    """
-    from itertools import izip
-    tree = {}
-    for i, (idx, col) in enumerate(izip(index, columns)):
-        if col not in tree:
-            tree[col] = {}
-        branch = tree[col]
-        branch[idx] = values[i]
-
-    return DataFrame(tree)
-
 def _monotonic(arr):
     return not (arr[1:] < arr[:-1]).any()
@@ -42,11 +42,9 @@ def _arith_method(op, name):
             if self.index.equals(other.index):
                 return Series(op(self.values, other.values), index=self.index)
 
-            new_index = self.index + other.index
-            this_reindexed = self.reindex(new_index)
-            other_reindexed = other.reindex(new_index)
+            this_reindexed, other_reindexed = self._align(other)
             arr = op(this_reindexed.values, other_reindexed.values)
-            return Series(arr, index=new_index)
+            return Series(arr, index=this_reindexed.index)
         elif isinstance(other, DataFrame):
             return NotImplemented
         else:
@@ -765,9 +763,8 @@ class Series(np.ndarray, PandasObject):
         this = self
 
         if not self.index.equals(other.index):
-            new_index = self.index + other.index
-            this = self.reindex(new_index)
-            other = other.reindex(new_index)
+            this, other = self._align(other)
+            new_index = this.index
 
         this_vals = this.values
         other_vals = other.values
@@ -838,10 +835,8 @@ class Series(np.ndarray, PandasObject):
             # save ourselves the copying in this case
             this = self
         else:
-            new_index = self.index + other.index
-
-            this = self.reindex(new_index)
-            other = other.reindex(new_index)
+            this, other = self._align(other)
+            new_index = this.index
 
         result = Series(np.where(isnull(this), other, this), index=new_index)
         return result
@@ -998,7 +993,7 @@ class Series(np.ndarray, PandasObject):
             if isinstance(arg, dict):
                 arg = Series(arg)
 
-            indexer, mask = _tseries.getMergeVec(self, arg.index.indexMap)
+            indexer, mask = arg.index.get_indexer(self.values)
             notmask = -mask
 
             new_values = arg.view(np.ndarray).take(indexer)
@@ -1061,9 +1056,23 @@ class Series(np.ndarray, PandasObject):
             return Series(nan, index=index)
 
         new_index, fill_vec, mask = self.index.reindex(index, method=method)
-        new_values = self.values.take(fill_vec)
+        return self._reindex_indexer(new_index, fill_vec)
+
+    def _reindex_indexer(self, new_index, indexer):
+        """
+        Conform to new_index using a pre-computed indexer, -1 marking labels
+        to fill with NaN. indexer=None means the values are already in
+        new_index order
+        """
+        if indexer is None:
+            return Series(self.values, index=new_index)
 
-        notmask = -mask
+        if len(self) == 0:
+            return Series(nan, index=new_index)
+
+        new_values = self.values.take(indexer)
+
+        notmask = indexer == -1
         if notmask.any():
             if issubclass(new_values.dtype.type, np.int_):
                 new_values = new_values.astype(float)
@@ -1074,6 +1083,19 @@ class Series(np.ndarray, PandasObject):
 
         return Series(new_values, index=new_index)
 
+    def _align(self, other, how='outer'):
+        """
+        Conform self and other to the join of their indexes
+
+        Returns
+        -------
+        (left, right) : (Series, Series)
+        """
+        join_index, lidx, ridx = self.index.join(other.index, how=how,
+                                                 return_indexers=True)
+        return (self._reindex_indexer(join_index, lidx),
+                other._reindex_indexer(join_index, ridx))
+
     def reindex_like(self, other, method=None):
         """
         Reindex Series to match index of another Series
@@ -1249,20 +1271,26 @@ class Series(np.ndarray, PandasObject):
 
         ax.hist(self.values)
 
-    def toCSV(self, path):
+    def toCSV(self, path, nanRep='nan', float_format=None, chunksize=None):
         """
         Write the Series to a CSV file
 
         Parameters
         ----------
-        path : string or None
-            Output filepath. If None, write to stdout
+        path : string
+            Output filepath
+        nanRep : string, default 'nan'
+            Missing data rep'n
+        float_format : string, default None
+            Format string for floating point numbers, e.g. '%.12f'
+        chunksize : int, default None
+            Number of rows to format and write at a time
         """
-        f = open(path, 'wb')
-
-        for idx, value in self.iteritems():
-            f.write(str(idx) + ',' + str(value) + '\n')
+        from pandas.core.common import _write_csv
 
+        f = open(path, 'wb')
+        _write_csv(f, [self.index.values, self.values], na_rep=nanRep,
+                   float_format=float_format, chunksize=chunksize)
         f.close()
 
     def valid(self):
@@ -1503,6 +1531,10 @@ class TimeSeries(Series):
 #-------------------------------------------------------------------------------
 # Supplementary functions
 
+# reductions giving back the value of a group of one
+_IDEMPOTENT_AGGS = ('mean', 'sum', 'min', 'max', 'first', 'last',
+                    np.mean, np.sum, np.min, np.max)
+
 class _Unstacker(object):
     """
     Helper class to unstack data / pivot with multi-level index
@@ -1511,6 +1543,9 @@ class _Unstacker(object):
     ----------
     level : int, default last level
         Level to "unstack"
+    aggfunc : function or string, optional
+        Used to combine the values of duplicate entries, otherwise the last
+        one is kept
 
     Examples
     --------
@@ -1534,7 +1569,8 @@ class _Unstacker(object):
     -------
     unstacked : DataFrame
     """
-    def __init__(self, values, index, level=-1, value_columns=None):
+    def __init__(self, values, index, level=-1, value_columns=None,
+                 aggfunc=None):
         if values.ndim == 1:
             values = values[:, np.newaxis]
         self.values = values
@@ -1552,88 +1588,123 @@ class _Unstacker(object):
         self.new_index_levels = list(index.levels)
         self.removed_level = self.new_index_levels.pop(level)
 
-        v = self.level
-        lshape = self.index.levshape
-        self.full_shape = np.prod(lshape[:v] + lshape[v+1:]), lshape[v]
+        self._make_labels()
+        if aggfunc is not None:
+            self._aggregate_duplicates(aggfunc)
 
-        self._make_sorted_values_labels()
-        self._make_selectors()
+    def _make_labels(self):
+        from pandas.core.groupby import _get_group_info
 
-    def _make_sorted_values_labels(self):
         v = self.level
-
         labs = self.index.labels
-        to_sort = labs[:v] + labs[v+1:] + [labs[v]]
-        indexer = np.lexsort(to_sort[::-1])
-
-        self.sorted_values = self.values.take(indexer, axis=0)
-        self.sorted_labels = [l.take(indexer) for l in to_sort]
+        remaining = labs[:v] + labs[v+1:]
+        shape = [len(lev) for lev in self.new_index_levels]
 
-    def _make_selectors(self):
-        new_levels = self.new_index_levels
+        # rows of the result: observed combinations of the other levels
+        row, ngroups, group_labels = _get_group_info(remaining, shape)
 
-        # make the mask
-        group_index = self.sorted_labels[0]
-        prev_stride = np.prod([len(x) for x in new_levels[1:]])
+        self.row = row
+        self.col = labs[v]
+        self.ngroups = ngroups
+        self.group_labels = group_labels
 
-        for lev, lab in zip(new_levels[1:], self.sorted_labels[1:-1]):
-            group_index = group_index * prev_stride + lab
-            prev_stride /= len(lev)
+    def _aggregate_duplicates(self, aggfunc):
+        import pandas.core.groupby as groupby
 
-        group_mask = np.zeros(self.full_shape[0], dtype=bool)
-        group_mask.put(group_index, True)
+        width = len(self.removed_level)
+        valid = (self.row != -1) & (self.col != -1)
+        key = self.row.astype(np.int64) * width + self.col
+        key = key[valid]
 
-        stride = self.index.levshape[self.level]
-        selector = self.sorted_labels[-1] + stride * group_index
-        mask = np.zeros(np.prod(self.full_shape), dtype=bool)
-        mask.put(selector, True)
+        counts = np.bincount(key, minlength=self.ngroups * width)
+        if aggfunc in _IDEMPOTENT_AGGS and not (counts > 1).any():
+            # reducing a single value gives it back
+            return
 
-        # compress labels
-        unique_groups = np.arange(self.full_shape[0])[group_mask]
-        compressor = group_index.searchsorted(unique_groups)
+        # the cells are already dense integers, number the observed ones
+        observed = counts > 0
+        comp_ids = (observed.cumsum() - 1).astype(np.int32).take(key)
+        ngroups = observed.sum()
+        values = self.values[valid]
+
+        how = {'sum' : 'add'}.get(aggfunc, aggfunc)
+        if (isinstance(how, basestring) and how in groupby._cython_functions
+            and values.dtype != np.object_):
+            values = values.astype(np.float64)
+            agged = groupby._aggregate_labels(values, comp_ids, ngroups, how)
+        else:
+            # SeriesGroupBy passes each group's values to a function, so that
+            # e.g. len works
+            agged = [Series(values[:, j]).groupby(comp_ids).agg(aggfunc).values
+                     for j in range(values.shape[1])]
+            agged = np.column_stack(agged)
 
-        self.group_mask = group_mask
-        self.group_index = group_index
-        self.mask = mask
-        self.unique_groups = unique_groups
-        self.compressor = compressor
+        key = np.flatnonzero(observed)
+        self.values = agged
+        self.row = (key // width).astype(np.int32)
+        self.col = (key % width).astype(np.int32)
 
     def get_result(self):
         from pandas.core.frame import DataFrame
 
-        # TODO: find a better way than this masking business
-
         values, mask = self.get_new_values()
         columns = self.get_new_columns()
         index = self.get_new_index()
 
         # filter out missing levels
+        mask = np.tile(mask, self.values.shape[1])
         values = values[:, mask]
         columns = columns[mask]
 
         return DataFrame(values, index=index, columns=columns)
 
     def get_new_values(self):
-        # place the values
-        length, width = self.full_shape
+        """
+        Scatter the values into a (rows x value columns * width) array
+
+        Returns
+        -------
+        (new_values, mask) : mask flags the columns of the removed level
+            which were observed. Missing cells are NaN, integer and boolean
+            data are upcast when there are some
+        """
+        width = len(self.removed_level)
+        length = self.ngroups
         stride = self.values.shape[1]
-        result_width = width * stride
 
-        new_values = np.empty((length, result_width), dtype=self.values.dtype)
-        new_mask = np.zeros((length, result_width), dtype=bool)
+        valid = (self.row != -1) & (self.col != -1)
+        key = self.row[valid].astype(np.int64) * width + self.col[valid]
+        filled = np.bincount(key, minlength=length * width) > 0
+        filled = filled.reshape((length, width))
 
-        new_values.fill(np.nan)
+        mask = filled.any(0)
+        full = filled[:, mask].all()
 
-        # is there a simpler / faster way of doing this?
-        for i in xrange(self.values.shape[1]):
-            chunk = new_values[:, i * width : (i + 1) * width]
-            mask_chunk = new_mask[:, i * width : (i + 1) * width]
+        values = self.values
+        if issubclass(values.dtype.type, np.floating):
+            values = values.astype(np.float64)
+            kernel = _tseries.unstack_float64
+        elif issubclass(values.dtype.type, np.integer):
+            if full:
+                values = values.astype(np.int64)
+                kernel = _tseries.unstack_int64
+            else:
+                values = values.astype(np.float64)
+                kernel = _tseries.unstack_float64
+        else:
+            values = values.astype(object)
+            kernel = _tseries.unstack_object
+
+        new_values = np.empty((length, width * stride), dtype=values.dtype)
+        if not full:
+            new_values.fill(np.nan)
 
-            chunk.flat[self.mask] = self.sorted_values[:, i]
-            mask_chunk.flat[self.mask] = True
+        kernel(values, self.row, self.col, new_values, width)
 
-        new_values = new_values.take(self.unique_groups, axis=0)
-        return new_values, new_mask.sum(0) > 0
+        if full and self.values.dtype == np.bool_:
+            new_values = new_values.astype(np.bool_)
+
+        return new_values, mask
 
     def get_new_columns(self):
         if self.value_columns is None:
@@ -1657,16 +1728,12 @@ class _Unstacker(object):
         return MultiIndex(levels=new_levels, labels=new_labels)
 
     def get_new_index(self):
-        result_labels = []
-        for cur in self.sorted_labels[:-1]:
-            result_labels.append(cur.take(self.compressor))
-
         # construct the new index
         if len(self.new_index_levels) == 1:
-            new_index = self.new_index_levels[0].take(self.unique_groups)
+            new_index = self.new_index_levels[0].take(self.group_labels[0])
         else:
             new_index = MultiIndex(levels=self.new_index_levels,
-                                   labels=result_labels)
+                                   labels=self.group_labels)
 
         return new_index
 
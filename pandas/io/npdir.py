@@ -0,0 +1,146 @@
+"""
+Storing DataFrame and WidePanel as a directory of NumPy .npy files, one per
+block of values, which can be loaded back as read-only memory maps. Processes
+loading the same directory this way share one copy of the data through the
+operating system's page cache
+"""
+
+import cPickle
+import os
+import uuid
+
+import numpy as np
+
+from pandas.core.frame import DataFrame
+from pandas.core.internals import BlockManager, make_block
+from pandas.core.panel import WidePanel
+
+_TYPE_MAP = {
+    DataFrame : 'frame',
+    WidePanel : 'wide'
+}
+
+_CLASSES = dict((v, k) for k, v in _TYPE_MAP.iteritems())
+
+_META_FILE = 'meta.pickle'
+
+# times to read the metadata again when a save replaced the files it names
+_LOAD_ATTEMPTS = 3
+
+def save_npdir(obj, path):
+    """
+    Save DataFrame or WidePanel to a directory holding the values of each of
+    its blocks as an .npy file, plus a pickle of the axes
+
+    Parameters
+    ----------
+    obj : DataFrame or WidePanel
+    path : string
+        Directory, created if it does not exist. The block files of each save
+        get new names, listed in the metadata file, which is renamed into place
+        last. The files of a previous save are then removed; processes having
+        them mapped keep their mappings
+    """
+    if type(obj) not in _TYPE_MAP:
+        raise ValueError('Can only save DataFrame or WidePanel, not %s'
+                         % type(obj).__name__)
+
+    data = obj._data
+    if not data.is_consolidated():
+        data = data.consolidate()
+
+    if not os.path.isdir(path):
+        os.makedirs(path)
+
+    token = uuid.uuid4().hex
+    block_files = []
+    for i, blk in enumerate(data.blocks):
+        name = 'block%d_values.%s.npy' % (i, token)
+        _replace_file(path, name, lambda f: np.save(f, blk.values))
+        block_files.append(name)
+
+    meta = {
+        'kind' : _TYPE_MAP[type(obj)],
+        'axes' : data.axes,
+        'block_items' : [blk.items for blk in data.blocks],
+        'block_files' : block_files
+    }
+
+    # until the metadata is replaced, loading still finds the previous save
+    # complete
+    _replace_file(path, _META_FILE,
+                  lambda f: cPickle.dump(meta, f,
+                                         protocol=cPickle.HIGHEST_PROTOCOL))
+
+    for name in os.listdir(path):
+        if (name.startswith('block') and name.endswith('.npy')
+            and name not in block_files):
+            os.remove(os.path.join(path, name))
+
+def load_npdir(path, mmap=True):
+    """
+    Load DataFrame or WidePanel saved with save_npdir
+
+    Parameters
+    ----------
+    path : string
+        Directory
+    mmap : boolean, default True
+        Memory-map the files of the blocks read-only instead of reading them.
+        The blocks are then views of the mappings, without copying, and values
+        are only read from disk when accessed. Blocks of object dtype are
+        always read
+
+    Returns
+    -------
+    obj : DataFrame or WidePanel
+        Read-only if memory-mapped, use copy() to get a modifiable object
+    """
+    for attempt in xrange(_LOAD_ATTEMPTS):
+        f = open(os.path.join(path, _META_FILE), 'rb')
+        try:
+            meta = cPickle.load(f)
+        finally:
+            f.close()
+
+        try:
+            values = [_load_values(os.path.join(path, name), mmap)
+                      for name in meta['block_files']]
+            break
+        except IOError:
+            # removed by a save since the metadata was read
+            if attempt == _LOAD_ATTEMPTS - 1:
+                raise
+
+    axes = meta['axes']
+    items = axes[0]
+
+    blocks = [make_block(vals, blk_items, items)
+              for vals, blk_items in zip(values, meta['block_items'])]
+
+    klass = _CLASSES[meta['kind']]
+    return klass(BlockManager(blocks, axes))
+
+def _load_values(filename, mmap):
+    if mmap:
+        try:
+            # plain ndarray view on the mapping, not a memmap, so that results
+            # of operations on it are ordinary arrays
+            return np.load(filename, mmap_mode='r').view(np.ndarray)
+        except ValueError:
+            # arrays of Python objects are pickled, can't be mapped
+            pass
+
+    return np.load(filename)
+
+def _replace_file(path, name, write):
+    filename = os.path.join(path, name)
+    temp = filename + '.tmp'
+
+    f = open(temp, 'wb')
+    try:
+        write(f)
+    finally:
+        f.close()
+
+    os.rename(temp, filename)
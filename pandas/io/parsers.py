@@ -3,7 +3,7 @@ Module contains tools for processing files into DataFrames or other objects
 """
 
 from datetime import datetime
-from itertools import izip
+from itertools import izip, islice, chain
 import re
 import string
 
@@ -11,9 +11,11 @@ import numpy as np
 
 from pandas.core.index import Index
 from pandas.core.frame import DataFrame
+import pandas._tseries as _tseries
 
 def read_csv(filepath_or_buffer, header=0, skiprows=None, index_col=0,
-             na_values=None, date_parser=None):
+             na_values=None, date_parser=None, engine='python',
+             chunksize=None, iterator=False, usecols=None, dtype=None):
     """
     Read CSV file into DataFrame
 
@@ -33,6 +35,25 @@ def read_csv(filepath_or_buffer, header=0, skiprows=None, index_col=0,
     date_parser : function
         Function to use for converting dates to strings. Defaults to
         dateutil.parser
+    engine : {'python', 'c'}, default 'python'
+        Parser engine to use. The 'c' engine tokenizes the file and converts
+        each column in compiled code, and is much faster on large files
+    chunksize : int, default None
+        Return TextParser object yielding DataFrames of chunksize rows
+    iterator : boolean, default False
+        Return TextParser object for reading the file piecewise with its
+        get_chunk method. A file opened from a path is closed when no rows
+        are left, or by the close method
+    usecols : list-like, default None
+        Column names or positions (0-indexed) to parse. Other columns are
+        discarded during tokenization by the 'c' engine
+    dtype : dict, default None
+        Column name or position -> dtype, e.g. {'a' : np.float64}. Skips
+        type inference for those columns
+
+    Returns
+    -------
+    parsed : DataFrame, or TextParser if chunksize or iterator passed
     """
     import csv
 
@@ -45,20 +66,33 @@ def read_csv(filepath_or_buffer, header=0, skiprows=None, index_col=0,
         except Exception: # pragma: no cover
             f = open(filepath_or_buffer, 'r')
 
-    reader = csv.reader(f, dialect='excel')
-
-    if skiprows is not None:
-        skiprows = set(skiprows)
-        lines = [l for i, l in enumerate(reader) if i not in skiprows]
+    if engine == 'c':
+        data = _tseries.TextReader(f, delimiter=',', quotechar='"',
+                                   na_values=_get_na_values(na_values),
+                                   skiprows=skiprows)
+    elif engine == 'python':
+        data = _skip_rows(csv.reader(f, dialect='excel'), skiprows)
     else:
-        lines = [l for l in reader]
-    f.close()
-    return _simple_parser(lines, header=header, indexCol=index_col,
-                          na_values=na_values, date_parser=date_parser)
+        raise ValueError('Unrecognized parser engine: %s' % engine)
+
+    parser = TextParser(data, header=header, index_col=index_col,
+                        na_values=na_values, date_parser=date_parser,
+                        chunksize=chunksize, usecols=usecols, dtype=dtype)
+    if f is not filepath_or_buffer:
+        parser._source = f
+
+    if chunksize is not None or iterator:
+        return parser
+
+    try:
+        return parser.read()
+    finally:
+        f.close()
 
 def read_table(filepath_or_buffer, sep='\t', header=0, skiprows=None,
                index_col=0, na_values=None, names=None,
-               date_parser=None):
+               date_parser=None, engine='python', chunksize=None,
+               iterator=False, usecols=None, dtype=None):
     """
     Read delimited file into DataFrame
 
@@ -79,6 +113,25 @@ def read_table(filepath_or_buffer, sep='\t', header=0, skiprows=None,
     date_parser : function
         Function to use for converting dates to strings. Defaults to
         dateutil.parser
+    engine : {'python', 'c'}, default 'python'
+        Parser engine to use. The 'c' engine requires sep to be a single
+        character and falls back to the 'python' engine otherwise
+    chunksize : int, default None
+        Return TextParser object yielding DataFrames of chunksize rows
+    iterator : boolean, default False
+        Return TextParser object for reading the file piecewise with its
+        get_chunk method. A file opened from a path is closed when no rows
+        are left, or by the close method
+    usecols : list-like, default None
+        Column names or positions (0-indexed) to parse. Other columns are
+        discarded during tokenization by the 'c' engine
+    dtype : dict, default None
+        Column name or position -> dtype, e.g. {'a' : np.float64}. Skips
+        type inference for those columns
+
+    Returns
+    -------
+    parsed : DataFrame, or TextParser if chunksize or iterator passed
     """
     if hasattr(filepath_or_buffer, 'read'):
         reader = filepath_or_buffer
@@ -89,16 +142,38 @@ def read_table(filepath_or_buffer, sep='\t', header=0, skiprows=None,
         except Exception: # pragma: no cover
             reader = open(filepath_or_buffer, 'r')
 
-    if skiprows is not None:
-        skiprows = set(skiprows)
-        lines = [l for i, l in enumerate(reader) if i not in skiprows]
+    if engine == 'c' and len(sep) == 1:
+        data = _tseries.TextReader(reader, delimiter=sep, quotechar=None,
+                                   strip_trailing=True,
+                                   na_values=_get_na_values(na_values),
+                                   skiprows=skiprows)
+    elif engine in ('python', 'c'):
+        data = (re.split(sep, l.rstrip())
+                for l in _skip_rows(reader, skiprows))
     else:
-        lines = [l for l in reader]
+        raise ValueError('Unrecognized parser engine: %s' % engine)
+
+    parser = TextParser(data, header=header, index_col=index_col,
+                        names=names, na_values=na_values,
+                        date_parser=date_parser, chunksize=chunksize,
+                        usecols=usecols, dtype=dtype)
+    if reader is not filepath_or_buffer:
+        parser._source = reader
 
-    lines = [re.split(sep, l.rstrip()) for l in lines]
-    return _simple_parser(lines, header=header, indexCol=index_col,
-                          colNames=names, na_values=na_values,
-                          date_parser=date_parser)
+    if chunksize is not None or iterator:
+        return parser
+
+    try:
+        return parser.read()
+    finally:
+        parser.close()
+
+def _skip_rows(rows, skiprows):
+    if skiprows is None:
+        return iter(rows)
+
+    skiprows = set(skiprows)
+    return (l for i, l in enumerate(rows) if i not in skiprows)
 
 def _simple_parser(lines, colNames=None, header=0, indexCol=0,
                    na_values=None, date_parser=None, parse_dates=True):
@@ -107,71 +182,391 @@ def _simple_parser(lines, colNames=None, header=0, indexCol=0,
 
     Should be replaced by np.genfromtxt eventually?
     """
-    if header is not None:
-        columns = []
-        for i, c in enumerate(lines[header]):
-            if c == '':
-                columns.append('Unnamed: %d' % i)
-            else:
-                columns.append(c)
-
-        content = lines[header+1:]
-
-        counts = {}
-        for i, col in enumerate(columns):
-            cur_count = counts.get(col, 0)
-            if cur_count > 0:
-                columns[i] = '%s.%d' % (col, cur_count)
-            counts[col] = cur_count + 1
-    else:
-        ncols = len(lines[0])
-        if not colNames:
-            columns = ['X.%d' % (i + 1) for i in range(ncols)]
+    parser = TextParser(iter(lines), header=header, index_col=indexCol,
+                        names=colNames, na_values=na_values,
+                        date_parser=date_parser, parse_dates=parse_dates)
+    return parser.read()
+
+class TextParser(object):
+    """
+    Converts rows of delimited data into DataFrame objects, either all at
+    once or a chunk of rows at a time. Returned by read_csv and read_table
+    when passed a chunksize or iterator=True
+
+    Parameters
+    ----------
+    data : iterator of lists, or pandas._tseries.TextReader
+        Source of rows. Lists of values are converted in Python, while a
+        TextReader tokenizes and converts columns in compiled code
+    header : int, default 0
+        Row to use for the column labels of the parsed DataFrame
+    index_col : int, default 0
+        Column to use as the row labels of the DataFrame. Pass None if there is
+        no such column
+    names : list, default None
+        Column labels to use when header is None
+    na_values : list-like, default None
+        List of additional strings to recognize as NA/NaN
+    date_parser : function
+        Function to use for converting dates to strings. Defaults to
+        dateutil.parser
+    parse_dates : boolean, default True
+        Attempt to parse the index as dates
+    chunksize : int, default None
+        Number of rows in each DataFrame produced when iterating
+    usecols : list-like, default None
+        Column names or positions (0-indexed) to parse, all others are
+        discarded. The index column is always parsed
+    dtype : dict, default None
+        Column name or position -> dtype. Type inference is skipped for these
+        columns and values which cannot be converted raise an exception
+
+    Notes
+    -----
+    Column and index dtypes are inferred from the first chunk read and
+    carried forward: later chunks are upcast to them (int64 to float64,
+    anything to object), and their index is only parsed as dates or
+    converted to integers if that of the previous chunks was. When a later
+    chunk needs a wider dtype, e.g. float64 for an int64 column with an NA
+    value, the wider dtype is carried forward from then on, but chunks
+    already returned keep theirs. Pass dtype to have the same dtype in every
+    chunk
+    """
+    def __init__(self, data, header=0, index_col=0, names=None,
+                 na_values=None, date_parser=None, parse_dates=True,
+                 chunksize=None, usecols=None, dtype=None):
+        self.data = data
+        self.header = header
+        self.index_col = index_col
+        self.names = names
+        self.na_values = na_values
+        self.date_parser = date_parser
+        self.parse_dates = parse_dates
+        self.chunksize = chunksize
+
+        self._engine_c = isinstance(data, _tseries.TextReader)
+        self._ncols = None
+        self._dtypes = None
+        self._index_dtype = None
+        self._parse_index_dates = parse_dates
+        self._rows_read = 0
+
+        # file opened for the parser by read_csv or read_table
+        self._source = None
+
+        self.columns = self._read_header()
+        self._implicit_index = self._infer_implicit_index()
+
+        self._usecols = None
+        if usecols is not None:
+            self._usecols = sorted(set(self._position(c) for c in usecols))
+            if index_col is not None:
+                idx = 0 if self._implicit_index else index_col
+                if idx not in self._usecols:
+                    self._usecols = sorted(self._usecols + [idx])
+
+            if self._engine_c:
+                self.data.set_usecols(self._usecols)
+
+        self._dtype = {}
+        if dtype is not None:
+            for c, typ in dtype.iteritems():
+                self._dtype[self._position(c)] = np.dtype(typ)
+
+    def __iter__(self):
+        try:
+            while True:
+                yield self.get_chunk(self.chunksize)
+        except StopIteration:
+            pass
+
+    def close(self):
+        """
+        Close the file read_csv or read_table opened from a path for this
+        parser. Done when iterating or get_chunk finds no more rows
+        """
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+    def read(self):
+        """
+        Parse all remaining rows into a single DataFrame
+        """
+        try:
+            return self.get_chunk()
+        except StopIteration:
+            raise Exception('No content to parse')
+
+    def get_chunk(self, rows=None):
+        """
+        Parse the next rows into a DataFrame
+
+        Parameters
+        ----------
+        rows : int, default None
+            Number of rows to read, or all remaining rows if None
+
+        Returns
+        -------
+        chunk : DataFrame
+        """
+        arrays = self._read_arrays(rows)
+        if len(arrays) == 0 or len(arrays[0]) == 0:
+            self.close()
+            raise StopIteration
+
+        nrows = len(arrays[0])
+
+        if self._ncols is None:
+            self._setup_columns(arrays)
+
+        # keep the column layout of the first chunk
+        for i in range(len(arrays), self._ncols):
+            arrays.append(np.repeat(np.nan, nrows))
+        del arrays[self._ncols:]
+
+        columns = list(self._labels)
+
+        if self._index_loc is not None:
+            index = arrays.pop(self._index_loc)
+            columns.pop(self._index_loc)
+
+            if self._parse_index_dates:
+                parsed = _try_parse_dates(index, parser=self.date_parser)
+                self._parse_index_dates = parsed is not index
+                index = parsed
+
+            index = np.array(index, dtype=object)
+            if self._index_dtype != np.object_:
+                index = _maybe_convert_int(index)
+            self._index_dtype = index.dtype
+        else:
+            index = np.arange(self._rows_read, self._rows_read + nrows)
+
+        arrays = self._coerce_dtypes(arrays)
+        self._rows_read += nrows
+
+        # data beyond the last labeled column is dropped
+        data = dict((c, values) for c, values in izip(columns, arrays)
+                    if c is not None)
+        columns = [c for c in columns if c is not None]
+        return DataFrame(data=data, columns=columns, index=Index(index))
+
+    def _read_header(self):
+        if self.header is None:
+            if self.names:
+                return list(self.names)
+            return None
+
+        if self._engine_c:
+            rows = self.data.read_rows(self.header + 1)
+        else:
+            rows = list(islice(self.data, self.header + 1))
+
+        if len(rows) <= self.header: # pragma: no cover
+            raise Exception('No content to parse')
+
+        return _clean_header(rows[self.header])
+
+    def _infer_implicit_index(self):
+        # header one field shorter than the data, first column is the index
+        if self.header is None or self.index_col != 0:
+            return False
+
+        if self._engine_c:
+            nfields = self.data.peek_nfields()
+        else:
+            try:
+                first = self.data.next()
+            except StopIteration:
+                return False
+            self.data = chain([first], self.data)
+            nfields = len(first)
+
+        return nfields == len(self.columns) + 1
+
+    def _position(self, col):
+        """
+        Position of the column in the file given its label or position
+        """
+        if isinstance(col, (int, long, np.integer)):
+            return int(col)
+
+        if self.columns is None:
+            raise ValueError('Columns can only be selected by position when '
+                             'there is no header')
+        if col not in self.columns:
+            raise ValueError('No column named %s' % str(col))
+
+        pos = self.columns.index(col)
+        if self._implicit_index:
+            pos += 1
+        return pos
+
+    def _loc(self, pos):
+        """
+        Location of file column pos among the arrays being parsed
+        """
+        if self._usecols is None:
+            return pos
+        return self._usecols.index(pos)
+
+    def _setup_columns(self, arrays):
+        if self._usecols is None:
+            # all labeled columns, even if no row has that many fields
+            nlabels = 0
+            if self.columns is not None:
+                nlabels = len(self.columns) + int(self._implicit_index)
+            self._ncols = max(len(arrays), nlabels)
+            positions = range(self._ncols)
         else:
-            assert(len(colNames) == ncols)
-            columns = colNames
-        content = lines
+            self._ncols = len(self._usecols)
+            positions = self._usecols
 
-    zipped_content = zip(*content)
+        if self.columns is None:
+            self.columns = ['X.%d' % (i + 1)
+                            for i in range(max(positions) + 1)]
+        elif self.header is None and self._usecols is None:
+            assert(len(self.columns) == self._ncols)
 
-    if len(content) == 0: # pragma: no cover
-        raise Exception('No content to parse')
+        if self._implicit_index:
+            labels = [None] + self.columns
+        else:
+            labels = self.columns
 
-    # no index column specified, so infer that's what is wanted
-    if indexCol is not None:
-        if indexCol == 0 and len(content[0]) == len(columns) + 1:
-            index = zipped_content[0]
-            zipped_content = zipped_content[1:]
+        self._labels = [labels[p] if p < len(labels) else None
+                        for p in positions]
+
+        if self.index_col is None:
+            self._index_loc = None
+        elif self._implicit_index:
+            self._index_loc = 0
+        else:
+            self._index_loc = self._loc(self.index_col)
+
+    def _read_arrays(self, rows):
+        if self.index_col is None:
+            raw = ()
+        elif self._implicit_index:
+            raw = (0,)
         else:
-            index = zipped_content.pop(indexCol)
-            columns.pop(indexCol)
+            raw = (self._loc(self.index_col),)
+
+        dtypes = dict((self._loc(pos), typ)
+                      for pos, typ in self._dtype.iteritems()
+                      if self._usecols is None or pos in self._usecols)
+
+        if self._engine_c:
+            return self.data.read(rows=rows, raw=raw, dtypes=dtypes)
 
-        if parse_dates:
-            index = _try_parse_dates(index, parser=date_parser)
+        if rows is None:
+            content = list(self.data)
+        else:
+            content = list(islice(self.data, rows))
+
+        # pad short rows with NA fields like the C tokenizer, zip would drop
+        # the columns they are missing
+        width = max([len(row) for row in content] or [0])
+        content = [row if len(row) == width
+                   else list(row) + [''] * (width - len(row))
+                   for row in content]
+
+        zipped_content = zip(*content)
+        if self._usecols is not None:
+            zipped_content = [zipped_content[p] for p in self._usecols
+                              if p < len(zipped_content)]
+
+        data = dict((i, values) for i, values in enumerate(zipped_content)
+                    if i not in raw and i not in dtypes)
+        data = _floatify(data, na_values=self.na_values)
+        data = _convert_to_ndarrays(data)
+
+        na_values = _get_na_values(self.na_values)
+        for i, typ in dtypes.iteritems():
+            if i < len(zipped_content):
+                data[i] = _cast_values(zipped_content[i], typ, na_values)
+
+        return [data[i] if i in data else values
+                for i, values in enumerate(zipped_content)]
+
+    def _coerce_dtypes(self, arrays):
+        if self._dtypes is None:
+            self._dtypes = [values.dtype for values in arrays]
+            return arrays
+
+        result = [_upcast(values, dtype)
+                  for values, dtype in izip(arrays, self._dtypes)]
+        self._dtypes = [values.dtype for values in result]
+        return result
+
+def _upcast(values, dtype):
+    """
+    Cast values to dtype, or both to a dtype holding either without loss
+    """
+    if values.dtype == dtype:
+        return values
 
-        index = _maybe_convert_int(np.array(index, dtype=object))
+    numeric = (np.integer, np.floating)
+    if (issubclass(values.dtype.type, numeric) and
+        issubclass(dtype.type, numeric)):
+        dtype = np.float64
     else:
-        index = np.arange(len(content))
+        dtype = np.object_
+
+    return values.astype(dtype)
+
+def _cast_values(values, dtype, na_values):
+    if issubclass(dtype.type, np.integer):
+        for val in values:
+            if val in na_values:
+                raise ValueError('Integer column has NA values')
+        return np.array([int(val) for val in values], dtype=dtype)
+
+    values = [np.nan if val in na_values else val for val in values]
+    if issubclass(dtype.type, np.floating):
+        return np.array([float(val) for val in values], dtype=dtype)
+
+    result = np.empty(len(values), dtype=object)
+    result[:] = values
+    if dtype == np.object_:
+        return result
+    return result.astype(dtype)
+
+def _clean_header(names):
+    columns = []
+    for i, c in enumerate(names):
+        if c == '':
+            columns.append('Unnamed: %d' % i)
+        else:
+            columns.append(c)
+
+    counts = {}
+    for i, col in enumerate(columns):
+        cur_count = counts.get(col, 0)
+        if cur_count > 0:
+            columns[i] = '%s.%d' % (col, cur_count)
+        counts[col] = cur_count + 1
 
-    data = dict(izip(columns, zipped_content))
-    data = _floatify(data, na_values=na_values)
-    data = _convert_to_ndarrays(data)
-    return DataFrame(data=data, columns=columns, index=Index(index))
+    return columns
+
+# common NA values
+# no longer excluding inf representations
+# '1.#INF','-1.#INF', '1.#INF000000',
+_NA_VALUES = set(['-1.#IND', '1.#QNAN', '1.#IND', '-1.#QNAN',
+                  '#N/A N/A', 'NA', '#NA', 'NULL', 'NaN',
+                  'nan', ''])
+
+def _get_na_values(na_values):
+    if na_values is None:
+        return _NA_VALUES
+    return set(list(na_values)) | _NA_VALUES
 
 def _floatify(data_dict, na_values=None):
     """
 
     """
-    # common NA values
-    # no longer excluding inf representations
-    # '1.#INF','-1.#INF', '1.#INF000000',
-    NA_VALUES = set(['-1.#IND', '1.#QNAN', '1.#IND', '-1.#QNAN',
-                     '#N/A N/A', 'NA', '#NA', 'NULL', 'NaN',
-                     'nan', ''])
-    if na_values is None:
-        na_values = NA_VALUES
-    else:
-        na_values = set(list(na_values)) | NA_VALUES
+    na_values = _get_na_values(na_values)
 
     def _convert_float(val):
         if val in na_values:
@@ -29,6 +29,7 @@ _NAME_MAP = {
     'time_series' : 'TimeSeries',
     'frame' : 'DataFrame',
     'frame_table' : 'DataFrame (Table)',
+    'frame_columnar' : 'DataFrame (Columnar)',
     'wide' : 'WidePanel',
     'wide_table' : 'WidePanel (Table)',
     'long' : 'LongPanel',
@@ -64,7 +65,10 @@ class HDFStore(object):
 
     DataFrame and WidePanel can be stored in Table format, which is slower to
     read and write but can be searched and manipulated more like an SQL
-    table. See HDFStore.put for more information
+    table. DataFrame can also be stored in columnar format, one extendable array
+    per column, so that selecting a few columns reads only those, with an
+    indexed table of the index and chosen data columns to select rows on. See
+    HDFStore.put for more information
 
     Parameters
     ----------
@@ -201,7 +205,8 @@ class HDFStore(object):
         except AttributeError:
             raise
 
-    def select(self, key, where=None):
+    def select(self, key, where=None, start=None, stop=None, iterator=False,
+               chunksize=None):
         """
         Retrieve pandas object stored in file, optionally based on where
         criteria
@@ -212,7 +217,10 @@ class HDFStore(object):
         where : list, optional
 
            Must be a list of dict objects of the following forms. Selection can
-           be performed on the 'index' or 'column' fields.
+           be performed on the 'index' or 'column' fields, and for columnar
+           frames on the data columns (see put). The criteria are evaluated by
+           PyTables in the file, using the indexes created on these fields
+           when the table was written
 
            Comparison op
                {'field' : 'index',
@@ -227,15 +235,56 @@ class HDFStore(object):
                {'field' : 'index',
                 'value' : [v1, v2, v3]}
 
+        start : int, optional
+            First stored row to consider. For tables a row holds the values
+            for one index value and column, for columnar frames one index value
+        stop : int, optional
+            Stored row to stop before
+        iterator : boolean, default False
+            Return an iterator yielding the selection a chunk at a time, each
+            chunk read separately. Chunks without any selected rows are
+            skipped
+        chunksize : int, default None
+            Return an iterator yielding the selection from chunks of about
+            chunksize stored rows (50000 if only iterator is passed). For
+            tables a chunk is a range of index values, in increasing order,
+            holding all rows of those values, also when they were appended
+            separately. For columnar frames a chunk is consecutive stored rows
+
+        Returns
+        -------
+        obj : type of object stored in file, or iterator of them if chunksize
+            or iterator passed
         """
         group = getattr(self.handle.root, key, None)
-        if 'table' not in group._v_attrs.pandas_type:
+        if not (_is_table_type(group) or _is_columnar_type(group)):
             raise Exception('can only select on objects written as tables')
         if group is not None:
-            return self._read_group(group, where)
+            handler = self._get_handler(op='read',
+                                        kind=group._v_attrs.pandas_type)
+            if chunksize is not None or iterator:
+                return self._iter_select(group, handler, where, start, stop,
+                                         chunksize or 50000)
+            return handler(group, where, start=start, stop=stop)
+
+    def _iter_select(self, group, handler, where, start, stop, chunksize):
+        if _is_columnar_type(group):
+            chunks = _row_chunks(group.index.nrows, start, stop, chunksize)
+            for chunk_start, chunk_stop in chunks:
+                result = handler(group, where, start=chunk_start,
+                                 stop=chunk_stop)
+                if 0 not in result.shape:
+                    yield result
+        else:
+            for index_range in _index_chunks(group.table, chunksize):
+                result = handler(group, where, start=start, stop=stop,
+                                 index_range=index_range)
+                if 0 not in result.shape:
+                    yield result
 
     def put(self, key, value, table=False, append=False,
-            compression=None):
+            compression=None, chunksize=50000, columnar=False,
+            data_columns=None):
         """
         Store object in HDFStore
 
@@ -254,9 +303,22 @@ class HDFStore(object):
             Use a compression algorithm to compress the data
             If None, the compression settings specified in the ctor will
             be used.
+        chunksize : int, default 50000
+            For table data structures, the number of table rows (one per index
+            value and column) handed to PyTables at a time
+        columnar : boolean, default False
+            Write a DataFrame as one extendable (and compressible) array per
+            column plus an indexed table of the index. Can be appended to and
+            selected from like a Table, reading only the arrays of the
+            selected columns
+        data_columns : list, default None
+            For columnar frames, columns whose values are also stored in the
+            indexed table of the index when the frame is written, so that
+            select criteria can be made on them
         """
         self._write_to_group(key, value, table=table, append=append,
-                             comp=compression)
+                             comp=compression, chunksize=chunksize,
+                             columnar=columnar, data_columns=data_columns)
 
     def _get_handler(self, op, kind):
         return getattr(self,'_%s_%s' % (op, kind))
@@ -281,9 +343,12 @@ class HDFStore(object):
             self.handle.removeNode(self.handle.root, key, recursive=True)
         else:
             group = getattr(self.handle.root, key)
+            if not _is_table_type(group):
+                raise Exception('can only remove rows from objects written '
+                                'as tables')
             self._delete_from_table(group, where)
 
-    def append(self, key, value):
+    def append(self, key, value, chunksize=50000):
         """
         Append to Table in file. Node must already exist and be Table
         format.
@@ -292,16 +357,49 @@ class HDFStore(object):
         ----------
         key : object
         value : {Series, DataFrame, WidePanel, LongPanel}
+        chunksize : int, default 50000
+            Number of table rows handed to PyTables at a time
 
         Notes
         -----
         Does *not* check if data being appended overlaps with existing
-        data in the table, so be careful
+        data in the table, so be careful. PyTables adds the rows appended to
+        the indexes of the table incrementally, see create_table_index
+        """
+        self._write_to_group(key, value, table=True, append=True,
+                             chunksize=chunksize)
+
+    def create_table_index(self, key):
         """
-        self._write_to_group(key, value, table=True, append=True)
+        Rebuild the indexes on the index and column fields of a Table, or on
+        the index and data columns of a columnar frame, as completely sorted
+        indexes. Rows appended after the table was written are only partially
+        sorted into them, which makes lookups slower after many appends
+
+        Parameters
+        ----------
+        key : object
+        """
+        group = getattr(self.handle.root, key)
+        if _is_table_type(group):
+            table, names = group.table, ('index', 'column')
+        elif _is_columnar_type(group):
+            table, names = group.index, group.index.colnames
+        else:
+            raise Exception('can only index objects written as tables')
+
+        for name in names:
+            column = getattr(table.cols, name)
+            if column.is_indexed:
+                column.reIndex()
+            else:
+                column.createCSIndex()
+
+        self.handle.flush()
 
     def _write_to_group(self, key, value, table=False, append=False,
-                        comp=None):
+                        comp=None, chunksize=50000, columnar=False,
+                        data_columns=None):
         root = self.handle.root
         if key not in root._v_children:
             group = self.handle.createGroup(root, key)
@@ -309,11 +407,20 @@ class HDFStore(object):
             group = getattr(root, key)
 
         kind = _TYPE_MAP[type(value)]
-        if table or (append and _is_table_type(group)):
+        if columnar or (append and _is_columnar_type(group)):
+            if kind != 'frame':
+                raise ValueError('Only DataFrame can be stored in columnar '
+                                 'format')
+            kind = 'frame_columnar'
+            handler = self._get_handler(op='write', kind=kind)
+            wrapper = lambda value: handler(group, value, append=append,
+                                            comp=comp,
+                                            data_columns=data_columns)
+        elif table or (append and _is_table_type(group)):
             kind = '%s_table' % kind
             handler = self._get_handler(op='write', kind=kind)
             wrapper = lambda value: handler(group, value, append=append,
-                                            comp=comp)
+                                            comp=comp, chunksize=chunksize)
         else:
             if append:
                 raise ValueError('Can only append to Tables')
@@ -373,7 +480,8 @@ class HDFStore(object):
 
         return BlockManager(blocks, axes)
 
-    def _write_frame_table(self, group, df, append=False, comp=None):
+    def _write_frame_table(self, group, df, append=False, comp=None,
+                           chunksize=50000):
         mat = df.values
         values = mat.reshape((1,) + mat.shape)
 
@@ -383,7 +491,110 @@ class HDFStore(object):
 
         self._write_table(group, items=['value'],
                           index=df.index, columns=df.columns,
-                          values=values, append=append, compression=comp)
+                          values=values, append=append, compression=comp,
+                          chunksize=chunksize)
+
+    def _write_frame_columnar(self, group, df, append=False, comp=None,
+                              data_columns=None):
+        index_converted, index_kind, index_t = _convert_index(df.index)
+        filters = self._get_filters(comp)
+
+        created = not (append and 'index' in group)
+        if not created:
+            columns = _read_index(group, 'columns')
+            if list(columns) != list(df.columns):
+                raise ValueError('Columns must match those already stored')
+            if index_kind != group._v_attrs.index_kind:
+                raise ValueError('Index must be of the same kind as the one '
+                                 'already stored')
+        else:
+            columns = list(df.columns)
+            positions = []
+            for col in data_columns or []:
+                if col not in columns:
+                    raise ValueError('No column named %s' % str(col))
+                positions.append(columns.index(col))
+
+            for name in list(group._v_children):
+                self.handle.removeNode(group, name, recursive=True)
+
+            self._write_index(group, 'columns', df.columns)
+            group._v_attrs.index_kind = index_kind
+            group._v_attrs.data_columns = positions
+
+            # the index and the data columns, one row per index value
+            description = {'index' : index_t}
+            for i in positions:
+                dtype = df[columns[i]].values.dtype
+                description['data%d' % i] = _tables().Col.from_dtype(dtype)
+            self.handle.createTable(group, 'index', description,
+                                    filters=filters, expectedrows=len(df))
+
+            for i, col in enumerate(df.columns):
+                self._create_earray(group, 'column%d' % i, df[col].values,
+                                    filters, expectedrows=len(df))
+
+        table = group.index
+        rows = np.empty(len(df), dtype=table.dtype)
+        rows['index'] = index_converted
+        for i in group._v_attrs.data_columns:
+            values = df[df.columns[i]].values
+            if not np.can_cast(values.dtype, table.dtype['data%d' % i]):
+                raise ValueError('Cannot append values of dtype %s to stored '
+                                 'values of dtype %s'
+                                 % (values.dtype, table.dtype['data%d' % i]))
+            rows['data%d' % i] = values
+        table.append(rows)
+
+        for i, col in enumerate(df.columns):
+            _append_earray(getattr(group, 'column%d' % i), df[col].values)
+
+        if created:
+            _create_table_indexes(table, table.colnames)
+
+        self.handle.flush()
+
+    def _create_earray(self, group, key, values, filters, expectedrows):
+        try:
+            atom = _tables().Atom.from_dtype(values.dtype)
+        except ValueError:
+            raise ValueError('Cannot store values of dtype %s in columnar '
+                             'format' % values.dtype)
+
+        self.handle.createEArray(group, key, atom, shape=(0,),
+                                 filters=filters, expectedrows=expectedrows)
+
+    def _read_frame_columnar(self, group, where=None, start=None,
+                             stop=None):
+        table = group.index
+        columns = _read_index(group, 'columns')
+
+        rows, positions = _columnar_selection(group, columns, where,
+                                              start, stop)
+
+        if isinstance(rows, slice):
+            index = table.read(start=rows.start, stop=rows.stop,
+                               field='index')
+        else:
+            index = table.readCoordinates(rows, field='index')
+        index = _unconvert_index(index, group._v_attrs.index_kind)
+
+        data = {}
+        for i in positions:
+            data[columns[i]] = _read_rows(getattr(group, 'column%d' % i),
+                                          rows)
+
+        return DataFrame(data, index=index, columns=columns[positions])
+
+    def _get_filters(self, compression):
+        if compression:
+            complevel = self.complevel
+            if complevel is None:
+                complevel = 9
+            return _tables().Filters(complevel=complevel,
+                                     complib=compression,
+                                     fletcher32=self.fletcher32)
+        return self.filters
 
     def _write_wide(self, group, panel):
         panel._consolidate_inplace()
@@ -392,13 +603,17 @@ class HDFStore(object):
     def _read_wide(self, group, where=None):
         return WidePanel(self._read_block_manager(group))
 
-    def _write_wide_table(self, group, panel, append=False, comp=None):
+    def _write_wide_table(self, group, panel, append=False, comp=None,
+                          chunksize=50000):
         self._write_table(group, items=panel.items, index=panel.major_axis,
                           columns=panel.minor_axis, values=panel.values,
-                          append=append, compression=comp)
+                          append=append, compression=comp,
+                          chunksize=chunksize)
 
-    def _read_wide_table(self, group, where=None):
-        return self._read_panel_table(group, where)
+    def _read_wide_table(self, group, where=None, start=None, stop=None,
+                         index_range=None):
+        return self._read_panel_table(group, where, start=start, stop=stop,
+                                      index_range=index_range)
 
     def _write_long(self, group, panel, append=False):
         self._write_index(group, 'major_axis', panel.major_axis)
@@ -457,7 +672,8 @@ class HDFStore(object):
             self.handle.createArray(group, key, value)
 
     def _write_table(self, group, items=None, index=None, columns=None,
-                     values=None, append=False, compression=None):
+                     values=None, append=False, compression=None,
+                     chunksize=50000):
         """ need to check for conform to the existing table:
             e.g. columns should match """
         # create dict of types
@@ -469,7 +685,8 @@ class HDFStore(object):
             if 'table' in group:
                 self.handle.removeNode(group, 'table')
 
-        if 'table' not in group:
+        created = 'table' not in group
+        if created:
             # create the table
             desc = {'index'  : index_t,
                     'column' : col_t,
@@ -478,15 +695,9 @@ class HDFStore(object):
             options = {'name' : 'table',
                        'description' : desc}
 
-            if compression:
-                complevel = self.complevel
-                if complevel is None:
-                    complevel = 9
-                options['filters'] = _tables().Filters(complevel=complevel,
-                                                       complib=compression,
-                                                       fletcher32=self.fletcher32)
-            elif self.filters is not None:
-                options['filters'] = self.filters
+            filters = self._get_filters(compression)
+            if filters is not None:
+                options['filters'] = filters
 
             table = self.handle.createTable(group, **options)
         else:
@@ -498,24 +709,25 @@ class HDFStore(object):
         table._v_attrs.columns_kind = cols_kind
         table._v_attrs.fields = list(items)
 
-        # add the rows
-        try:
-            for i, index in enumerate(index_converted):
-                for c, col in enumerate(columns_converted):
-                    v = values[:, i, c]
-
-                    # don't store the row if all values are np.nan
-                    if np.isnan(v).all():
-                        continue
+        # add the rows, in order of index then column, as records built a
+        # chunk of index values at a time. The indexes on the index and column
+        # fields are updated by PyTables as rows are added
+        ncols = len(columns_converted)
+        step = max(chunksize // max(ncols, 1), 1)
 
-                    row = table.row
-                    row['index'] = index
-                    row['column'] = col
-
-                    # create the values array
-                    row['values'] = v
-                    row.append()
+        try:
+            for start in xrange(0, len(index_converted), step):
+                stop = start + step
+                records = _table_records(table, index_converted[start:stop],
+                                         columns_converted,
+                                         values[:, start:stop])
+                if len(records):
+                    table.append(records)
             self.handle.flush()
+
+            # indexed once written, PyTables then adds the rows appended later
+            if created:
+                _create_table_indexes(table)
         except (ValueError), detail: # pragma: no cover
             print "value_error in _write_table -> %s" % str(detail)
             try:
@@ -546,15 +758,19 @@ class HDFStore(object):
         values = _read_array(group, 'values')
         return DataFrame(values, index=index, columns=columns)
 
-    def _read_frame_table(self, group, where=None):
-        return self._read_panel_table(group, where)['value']
+    def _read_frame_table(self, group, where=None, start=None, stop=None,
+                          index_range=None):
+        return self._read_panel_table(group, where, start=start, stop=stop,
+                                      index_range=index_range)['value']
 
-    def _read_panel_table(self, group, where=None):
+    def _read_panel_table(self, group, where=None, start=None, stop=None,
+                          index_range=None):
         from pandas.core.panel import _make_long_index
         table = getattr(group, 'table')
 
         # create the selection
-        sel = Selection(table, where)
+        sel = Selection(table, where, start=start, stop=stop,
+                        index_range=index_range)
         sel.select()
         fields = table._v_attrs.fields
 
@@ -570,9 +786,6 @@ class HDFStore(object):
         lp = lp.sortlevel(level=0)
         wp = lp.to_wide()
 
-        if sel.column_filter:
-            new_minor = sorted(set(wp.minor_axis) & sel.column_filter)
-            wp = wp.reindex(minor=new_minor)
         return wp
 
     def _delete_from_table(self, group, where = None):
@@ -581,14 +794,112 @@ class HDFStore(object):
         # create the selection
         s = Selection(table,where)
         s.select_coords()
+        coords = s.values
+
+        # delete the runs of consecutive rows in reverse order, so that the
+        # coordinates of the runs before stay valid, and rebuild the indexes
+        # once at the end rather than after every run
+        breaks = (np.diff(coords) != 1).nonzero()[0] + 1
+        starts = np.r_[0, breaks]
+        stops = np.r_[breaks, len(coords)]
+
+        if len(coords):
+            table.autoIndex = False
+            try:
+                for i in reversed(xrange(len(starts))):
+                    table.removeRows(coords[starts[i]],
+                                     coords[stops[i] - 1] + 1)
+            finally:
+                table.autoIndex = True
+            table.reIndexDirty()
 
-        # delete the rows in reverse order
-        l = list(s.values)
-        l.reverse()
-        for c in l:
-            table.removeRows(c)
         self.handle.flush()
-        return len(s.values)
+        return len(coords)
+
+def _create_table_indexes(table, names=('index', 'column')):
+    """
+    Completely sorted indexes on the fields selections are made on, so that
+    PyTables can look up the rows matching a condition instead of scanning
+    """
+    for name in names:
+        column = getattr(table.cols, name)
+        if not column.is_indexed:
+            column.createCSIndex()
+
+def _row_chunks(nrows, start, stop, chunksize):
+    """
+    (start, stop) of consecutive chunks of chunksize rows
+    """
+    start, stop, _ = slice(start, stop).indices(nrows)
+    return [(i, min(i + chunksize, stop))
+            for i in xrange(start, stop, chunksize)]
+
+def _index_chunks(table, chunksize):
+    """
+    Split the stored index values of a table into consecutive ranges
+    (low, high), low <= index < high with high None for the last one,
+    holding about chunksize rows each. The rows of an index value are
+    scattered over the table when appended separately, so the values are
+    read in sorted order, from the completely sorted index if there is one
+    """
+    column = table.cols.index
+    if column.is_indexed and column.index.is_CSI:
+        read = lambda start, stop: table.readSorted('index', field='index',
+                                                    start=start, stop=stop)
+    else:
+        values = np.sort(table.read(field='index'))
+        read = lambda start, stop: values[start:stop]
+
+    nrows = table.nrows
+    pos = 0
+    while pos < nrows:
+        low = read(pos, pos + 1)[0]
+        end = _sorted_chunk_end(read, pos + chunksize, nrows, chunksize)
+        if end < nrows:
+            high = read(end, end + 1)[0]
+        else:
+            high = None
+
+        yield low, high
+        pos = end
+
+def _sorted_chunk_end(read, end, stop, step):
+    """
+    Move the end of a chunk of sorted index values forward past the values
+    equal to the last one of the chunk, looking at step values at a time
+    """
+    if end >= stop:
+        return stop
+
+    last = read(end - 1, end)[0]
+    while end < stop:
+        ahead = read(end, min(end + step, stop))
+        different = (ahead != last).nonzero()[0]
+        if len(different):
+            return end + different[0]
+        end += len(ahead)
+
+    return end
+
+def _table_records(table, index, columns, values):
+    """
+    Rows of a long-format table for values (items x index x columns), one per
+    (index, column) pair, skipping the pairs where all the values are NaN
+    """
+    nitems, nindex, ncols = values.shape
+
+    # index x columns, then items
+    values = values.transpose((1, 2, 0)).reshape((nindex * ncols, nitems))
+
+    # don't store the row if all values are np.nan
+    mask = -np.isnan(values).all(axis=1)
+
+    records = np.empty(mask.sum(), dtype=table.dtype)
+    records['index'] = np.repeat(index, ncols)[mask]
+    records['column'] = np.tile(columns, nindex)[mask]
+    records['values'] = values[mask].reshape(records['values'].shape)
+
+    return records
 
 def _convert_index(index):
     # Let's assume the index is homogeneous
@@ -678,10 +989,102 @@ def _is_table_type(group):
         # new node, e.g.
         return False
 
+def _is_columnar_type(group):
+    try:
+        return group._v_attrs.pandas_type == 'frame_columnar'
+    except AttributeError:
+        return False
+
+def _append_earray(node, values):
+    if not np.can_cast(values.dtype, node.atom.dtype):
+        raise ValueError('Cannot append values of dtype %s to stored values '
+                         'of dtype %s' % (values.dtype, node.atom.dtype))
+    node.append(np.asarray(values, dtype=node.atom.dtype))
+
+def _read_rows(node, rows):
+    """
+    Read the rows (slice or sorted positions) of an array node, reading the
+    span from the first to the last position
+    """
+    if isinstance(rows, slice):
+        return node[rows]
+
+    if len(rows) == 0:
+        return np.empty(0, dtype=node.atom.dtype)
+
+    start = rows[0]
+    return node[start : rows[-1] + 1].take(rows - start)
+
+def _convert_value(value, kind):
+    if kind == 'datetime':
+        return time.mktime(value.timetuple())
+    elif kind == 'string':
+        return str(value)
+    return value
+
+def _columnar_selection(group, columns, where, start, stop):
+    """
+    The rows, a slice or sorted positions, and the positions of the columns
+    matching the where criteria (see HDFStore.select) of a columnar frame.
+    Criteria on the index and the data columns are evaluated by PyTables on
+    the indexed table of the index
+    """
+    fields = {}
+    for i in group._v_attrs.data_columns:
+        fields[columns[i]] = ('data%d' % i, None)
+    fields['index'] = ('index', group._v_attrs.index_kind)
+
+    row_where = []
+    selected = None
+    for c in where or []:
+        if c['field'] != 'column':
+            row_where.append(c)
+            continue
+
+        value = c['value']
+        if c.get('op', None) == 'in' or isinstance(value, (list, np.ndarray)):
+            values = set(value)
+        else:
+            values = set([value])
+        if selected is not None:
+            values &= selected
+        selected = values
+
+    if row_where:
+        sel = Selection(group.index, row_where, start=start, stop=stop,
+                        fields=fields)
+        sel.select_coords()
+        rows = sel.values
+    else:
+        start, stop, _ = slice(start, stop).indices(group.index.nrows)
+        rows = slice(start, stop)
+
+    positions = np.arange(len(columns))
+    if selected is not None:
+        positions = np.array([i for i, c in enumerate(columns)
+                              if c in selected], dtype=int)
+
+    return rows, positions
+
+# beyond this many values, membership in a set is pushed down as the range
+# of the values and tested exactly on the rows read
+_MAX_OR_TERMS = 61
+
+# table attribute holding the kind of the values of each field
+_FIELD_KINDS = {
+    'index' : 'index_kind',
+    'column' : 'columns_kind'
+}
+
 class Selection(object):
     """
     Carries out a selection operation on a tables.Table object.
 
+    The criteria are compiled into one condition evaluated by PyTables, which
+    uses the indexes on the index and column fields. Comparisons and small
+    sets of values become terms of the condition, large sets the range they
+    span plus a membership test on the rows read
+
     Parameters
     ----------
     table : tables.Table
@@ -699,17 +1102,41 @@ class Selection(object):
         Match a set of values
            {'field' : 'index',
             'value' : [v1, v2, v3]}
+    start : int, optional
+        First row of the table to consider
+    stop : int, optional
+        Row of the table to stop before
+    index_range : tuple, optional
+        (low, high) stored index values, selecting low <= index < high. high
+        is None for no upper bound
+    fields : dict, optional
+        Field of the criteria -> (name of the column of the table, kind of
+        its values). Defaults to the index and column fields
     """
-    def __init__(self, table, where=None):
+    def __init__(self, table, where=None, start=None, stop=None,
+                 index_range=None, fields=None):
         self.table = table
         self.where = where
-        self.column_filter = None
+        if fields is None:
+            fields = dict((field, (field, getattr(table._v_attrs, kind)))
+                          for field, kind in _FIELD_KINDS.iteritems())
+        self.fields = fields
+        self.start, self.stop, _ = slice(start, stop).indices(table.nrows)
         self.the_condition = None
         self.conditions = []
+        self.filters = []
         self.values = None
+        if index_range is not None:
+            low, high = index_range
+            self.conditions.append('(index >= %r)' % low)
+            if high is not None:
+                self.conditions.append('(index < %r)' % high)
         if where:
             self.generate(where)
 
+        if len(self.conditions):
+            self.the_condition = '(' + ' & '.join(self.conditions) + ')'
+
     def generate(self, where):
         # and condictions
         for c in where:
@@ -717,42 +1144,62 @@ class Selection(object):
             value = c['value']
             field = c['field']
 
-            if field == 'index' and isinstance(value, datetime):
-                value = time.mktime(value.timetuple())
-                self.conditions.append('(%s %s %s)' % (field,op,value))
-            else:
-                self.generate_multiple_conditions(op,value,field)
-
-        if len(self.conditions):
-            self.the_condition = '(' + ' & '.join(self.conditions) + ')'
+            if field not in self.fields:
+                raise ValueError('Can only select on the fields %s'
+                                 % ', '.join(sorted(map(str, self.fields))))
 
-    def generate_multiple_conditions(self, op, value, field):
+            name, kind = self.fields[field]
 
-        if op and op == 'in' or isinstance(value, (list, np.ndarray)):
-            if len(value) <= 61:
-                l = '(' + ' | '.join([ "(%s == '%s')" % (field,v)
-                                       for v in value ]) + ')'
-                self.conditions.append(l)
+            if op == 'in' or isinstance(value, (list, np.ndarray)):
+                values = [_convert_value(v, kind) for v in value]
+                self.generate_multiple_conditions(values, name)
             else:
-                self.column_filter = set(value)
+                if op is None:
+                    op = '=='
+                self.conditions.append('(%s %s %r)' %
+                                       (name, op, _convert_value(value, kind)))
+
+    def generate_multiple_conditions(self, values, field):
+        values = sorted(set(values))
+
+        if 0 < len(values) <= _MAX_OR_TERMS:
+            l = '(' + ' | '.join([ "(%s == %r)" % (field,v)
+                                   for v in values ]) + ')'
+            self.conditions.append(l)
         else:
-            if op is None:
-                op = '=='
-            self.conditions.append('(%s %s "%s")' % (field,op,value))
+            if len(values):
+                self.conditions.append('((%s >= %r) & (%s <= %r))' %
+                                       (field, values[0], field, values[-1]))
+            self.filters.append((field, values))
 
     def select(self):
         """
         generate the selection
         """
         if self.the_condition:
-            self.values = self.table.readWhere(self.the_condition)
-
+            values = self.table.readWhere(self.the_condition,
+                                          start=self.start, stop=self.stop)
         else:
-            self.values = self.table.read()
+            values = self.table.read(start=self.start, stop=self.stop)
+
+        for field, allowed in self.filters:
+            values = values[np.in1d(values[field], allowed)]
+
+        self.values = values
 
     def select_coords(self):
         """
         generate the selection
         """
-        self.values = self.table.getWhereList(self.the_condition)
+        if self.the_condition:
+            coords = self.table.getWhereList(self.the_condition,
+                                             start=self.start,
+                                             stop=self.stop, sort=True)
+        else:
+            coords = np.arange(self.start, self.stop)
+
+        for field, allowed in self.filters:
+            values = self.table.readCoordinates(coords, field=field)
+            coords = coords[np.in1d(values, allowed)]
 
+        self.values = coords
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from pandas import DataFrame
+from pandas.io.npdir import save_npdir, load_npdir
+import pandas.util.testing as tm
+
+class TestNpdir(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_frame(self):
+        df = tm.makeTimeDataFrame()
+        save_npdir(df, self.path)
+
+        result = load_npdir(self.path)
+        tm.assert_frame_equal(result, df)
+
+        # views of the read-only mapping
+        values = result._data.blocks[0].values
+        self.assert_(type(values) is np.ndarray)
+        self.assert_(not values.flags.writeable)
+        self.assert_(isinstance(values.base, np.memmap))
+
+        result = load_npdir(self.path, mmap=False)
+        tm.assert_frame_equal(result, df)
+        self.assert_(result._data.blocks[0].values.flags.writeable)
+
+        tm.assert_frame_equal(load_npdir(self.path) * 2, df * 2)
+
+    def test_mixed_frame(self):
+        df = tm.makeDataFrame()
+        df['int'] = np.arange(len(df))
+        df['bool'] = df['A'] > 0
+        df['obj'] = 'foo'
+        save_npdir(df, self.path)
+
+        result = load_npdir(self.path)
+        tm.assert_frame_equal(result, df)
+        self.assertEqual(len(result._data.blocks), 4)
+
+    def test_wide_panel(self):
+        wp = tm.makeWidePanel()
+        save_npdir(wp, self.path)
+        tm.assert_panel_equal(load_npdir(self.path), wp)
+
+    def test_replace(self):
+        df = tm.makeTimeDataFrame()
+        save_npdir(df, self.path)
+        mapped = load_npdir(self.path)
+
+        other = DataFrame(np.random.randn(10, 2), columns=['a', 'b'])
+        save_npdir(other, self.path)
+        tm.assert_frame_equal(load_npdir(self.path), other)
+
+        # the previous files stay mapped
+        tm.assert_frame_equal(mapped, df)
+
+        # files of the previous save, which had more blocks, are removed
+        df['int'] = np.arange(len(df))
+        save_npdir(df, self.path)
+        save_npdir(other, self.path)
+        blocks = [name for name in os.listdir(self.path)
+                  if name.endswith('.npy')]
+        self.assertEqual(len(blocks), 1)
+        tm.assert_frame_equal(load_npdir(self.path), other)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, save_npdir, tm.makeTimeSeries(),
+                          self.path)
+        self.assertRaises(ValueError, save_npdir,
+                          tm.makeWidePanel().to_long(), self.path)
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
+                   exit=False)
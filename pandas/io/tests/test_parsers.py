@@ -119,6 +119,235 @@ c,4,5
         self.assert_(df.values.dtype == np.float64)
         assert_frame_equal(df, df2)
 
+    def test_c_engine(self):
+        for path in (self.csv1, self.csv2):
+            expected = read_csv(path)
+            assert_frame_equal(read_csv(path, engine='c'), expected)
+            assert_frame_equal(read_table(path, sep=',', engine='c'),
+                               expected)
+
+    def test_c_engine_na_values_skiprows(self):
+        data = """A,B,C
+ignore,this,row
+1,NA,3
+-1.#IND,5,baz
+7,8,NaN
+"""
+        expected = read_csv(StringIO(data), index_col=None,
+                            na_values=['baz'], skiprows=[1])
+        df = read_csv(StringIO(data), index_col=None, na_values=['baz'],
+                      skiprows=[1], engine='c')
+        assert_frame_equal(df, expected)
+
+        df2 = read_table(StringIO(data), sep=',', index_col=None,
+                         na_values=['baz'], skiprows=[1], engine='c')
+        assert_frame_equal(df2, expected)
+
+    def test_c_engine_quoting_mixed_type(self):
+        data = """A,B,C
+"a,b",1,2
+"say ""hi"" now",3.5,
+c,4,5
+"""
+        df = read_csv(StringIO(data), index_col=None, engine='c')
+        self.assertEqual(list(df['A']), ['a,b', 'say "hi" now', 'c'])
+        self.assert_(df['B'].dtype == np.float64)
+        self.assert_(df['C'].dtype == np.float64)
+        self.assert_(np.isnan(df['C'][1]))
+
+        expected = read_csv(StringIO(data), index_col=None)
+        assert_frame_equal(df, expected)
+
+    def test_c_engine_no_header(self):
+        data = """1\t2\t3\t4\t5\t
+6\t7\t8\t9\t10
+11\t12\t13\t14\t15
+"""
+        names = ['foo', 'bar', 'baz', 'quux', 'panda']
+        df = read_table(StringIO(data), index_col=None, header=None,
+                        names=names, engine='c')
+        expected = read_table(StringIO(data), index_col=None, header=None,
+                              names=names)
+        assert_frame_equal(df, expected)
+        self.assert_(df['foo'].dtype == np.int64)
+
+    def test_c_engine_ragged_rows(self):
+        # short rows are padded with NA, columns no row has are kept
+        for data in ('a,b,c\n1,2,3\n4,5\n6\n', 'a,b,c\n1\n4,5\n'):
+            expected = read_csv(StringIO(data), index_col=None)
+            self.assert_(np.array_equal(expected.columns, ['a', 'b', 'c']))
+            self.assert_(np.isnan(expected['c'][1]))
+
+            df = read_csv(StringIO(data), index_col=None, engine='c')
+            assert_frame_equal(df, expected)
+
+    def test_text_reader_chunk_boundaries(self):
+        from pandas._tseries import TextReader
+        data = 'a,b\r\n1,"x\r\ny"\n\n3,4\r5,6'
+        reader = TextReader(StringIO(data), chunk_bytes=3)
+        self.assertEqual(reader.read_rows(1), [['a', 'b']])
+        result = reader.read()
+        assert_almost_equal(result[0], [1, 3, 5])
+        assert_almost_equal(result[1], ['x\r\ny', 4., 6.])
+
+    def test_read_chunksize(self):
+        data = """index,A,B,C,D
+foo,2,3,4,5
+bar,7,8,9,10
+baz,12,13,14,15
+qux,12,13,14,15
+foo2,12,13,14,15
+bar2,12,13,14,15
+"""
+        for engine in ('python', 'c'):
+            reader = read_csv(StringIO(data), chunksize=2, engine=engine)
+            df = read_csv(StringIO(data), engine=engine)
+
+            chunks = list(reader)
+            self.assertEqual(len(chunks), 3)
+            assert_frame_equal(chunks[0], df[:2])
+            assert_frame_equal(chunks[1], df[2:4])
+            assert_frame_equal(chunks[2], df[4:])
+
+            reader = read_table(StringIO(data), sep=',', chunksize=4,
+                                engine=engine)
+            chunks = list(reader)
+            assert_frame_equal(chunks[0], df[:4])
+            assert_frame_equal(chunks[1], df[4:])
+
+    def test_iterator(self):
+        data = """A,B,C
+1,2,3
+4,5,6
+7,8.5,
+10,11,12
+"""
+        for engine in ('python', 'c'):
+            reader = read_csv(StringIO(data), index_col=None, iterator=True,
+                              engine=engine)
+            chunk = reader.get_chunk(2)
+            self.assert_(np.array_equal(chunk.index, [0, 1]))
+            self.assert_(chunk['B'].dtype == np.int64)
+
+            # dtypes match the first chunk where possible
+            chunk = reader.get_chunk(1)
+            self.assert_(np.array_equal(chunk.index, [2]))
+            self.assert_(chunk['A'].dtype == np.int64)
+            self.assert_(chunk['B'].dtype == np.float64)
+            self.assert_(np.isnan(chunk['C'][2]))
+
+            # and stay float64 once widened
+            chunk = reader.get_chunk()
+            self.assert_(np.array_equal(chunk.index, [3]))
+            self.assert_(chunk['A'].dtype == np.int64)
+            self.assert_(chunk['B'].dtype == np.float64)
+            self.assert_(chunk['C'].dtype == np.float64)
+            self.assertRaises(StopIteration, reader.get_chunk, 1)
+
+            reader = read_csv(StringIO(data), index_col=None, chunksize=3,
+                              engine=engine)
+            chunks = list(reader)
+            self.assert_(chunks[0]['C'].dtype == np.float64)
+            self.assert_(chunks[1]['C'].dtype == np.float64)
+
+            # once the index is not dates, later chunks are not parsed
+            reader = read_csv(StringIO('A,B\n1,2\n4,5\nfoo,8\n10,11\n'),
+                              chunksize=1, engine=engine)
+            types = [type(chunk.index[0]) for chunk in reader]
+            self.assertEqual(types, [datetime, datetime, str, str])
+
+            reader = read_csv(StringIO(data), index_col=None, chunksize=1,
+                              dtype={'B' : np.float64}, engine=engine)
+            for chunk in reader:
+                self.assert_(chunk['B'].dtype == np.float64)
+
+    def test_iterator_closes_file(self):
+        for engine in ('python', 'c'):
+            reader = read_csv(self.csv1, chunksize=2, engine=engine)
+            source = reader._source
+            self.assert_(not source.closed)
+            list(reader)
+            self.assert_(source.closed)
+
+            reader = read_table(self.csv1, sep=',', iterator=True,
+                                engine=engine)
+            source = reader._source
+            reader.get_chunk(1)
+            reader.close()
+            self.assert_(source.closed)
+
+            # files passed in are left to the caller
+            f = open(self.csv1)
+            list(read_csv(f, chunksize=2, engine=engine))
+            self.assert_(not f.closed)
+            f.close()
+
+    def test_usecols(self):
+        data = """index,A,B,C,D
+foo,2,3,4,5
+bar,7,8,9,10
+baz,12,13,14,15
+"""
+        for engine in ('python', 'c'):
+            expected = read_csv(StringIO(data), engine=engine)
+
+            df = read_csv(StringIO(data), usecols=['B', 'D'], engine=engine)
+            assert_frame_equal(df, expected.ix[:, ['B', 'D']])
+
+            df = read_csv(StringIO(data), usecols=[2, 4], engine=engine)
+            assert_frame_equal(df, expected.ix[:, ['B', 'D']])
+
+            df = read_csv(StringIO(data), usecols=['C'], index_col=None,
+                          engine=engine)
+            self.assert_(np.array_equal(df.columns, ['C']))
+            self.assert_(np.array_equal(df['C'], [4, 9, 14]))
+
+            chunks = list(read_csv(StringIO(data), usecols=['A'],
+                                   chunksize=2, engine=engine))
+            assert_frame_equal(chunks[1], expected.ix[2:, ['A']])
+
+        # implicit index, header one field shorter than the data
+        data = """A,B,C
+foo,1,2,3
+bar,4,5,6
+"""
+        for engine in ('python', 'c'):
+            df = read_csv(StringIO(data), usecols=['C'], engine=engine)
+            self.assert_(np.array_equal(df.index, ['foo', 'bar']))
+            self.assert_(np.array_equal(df['C'], [3, 6]))
+
+        data = """1\t2\t3\t
+4\t5\t6\t
+"""
+        for engine in ('python', 'c'):
+            df = read_table(StringIO(data), header=None, index_col=None,
+                            usecols=[0, 2], engine=engine)
+            self.assert_(np.array_equal(df.columns, ['X.1', 'X.3']))
+            assert_almost_equal(df.values, [[1, 3], [4, 6]])
+
+    def test_dtype(self):
+        data = """A,B,C
+1,2,3
+4,NA,6
+7,8,9
+"""
+        for engine in ('python', 'c'):
+            df = read_csv(StringIO(data), index_col=None, engine=engine,
+                          dtype={'A' : np.float64, 'C' : object})
+            self.assert_(df['A'].dtype == np.float64)
+            self.assert_(df['B'].dtype == np.float64)
+            self.assert_(df['C'].dtype == np.object_)
+            self.assertEqual(list(df['C']), ['3', '6', '9'])
+
+            df = read_csv(StringIO(data), index_col=None, engine=engine,
+                          dtype={0 : np.float64})
+            self.assert_(df['A'].dtype == np.float64)
+            self.assert_(df['C'].dtype == np.int64)
+
+            self.assertRaises(ValueError, read_csv, StringIO(data),
+                              index_col=None, engine=engine,
+                              dtype={'B' : np.int64})
+
     def test_excel_table(self):
         pth = os.path.join(self.dirpath, 'test.xls')
         xls = ExcelFile(pth)
@@ -102,6 +102,26 @@ class TesttHDFStore(unittest.TestCase):
         self.store.append('c', df[10:])
         tm.assert_frame_equal(self.store['c'], df)
 
+    def test_append_chunksize(self):
+        df = tm.makeTimeDataFrame()
+
+        # all-NaN rows are not stored
+        df.values[3, 1] = np.nan
+        df.values[12, 0] = np.nan
+
+        self.store.put('c', df[:10], table=True, chunksize=7)
+        self.store.append('c', df[10:], chunksize=7)
+        self.assertEquals(len(self.store.handle.root.c.table),
+                          df.count().sum())
+        tm.assert_frame_equal(self.store['c'], df)
+
+        wp = tm.makeWidePanel()
+        wp.values[:, 2, 1] = np.nan
+        self.store.put('wp', wp, table=True, chunksize=3)
+        self.assertEquals(len(self.store.handle.root.wp.table),
+                          len(wp.major_axis) * len(wp.minor_axis) - 1)
+        tm.assert_panel_equal(self.store['wp'], wp)
+
     def test_remove(self):
         ts = tm.makeTimeSeries()
         df = tm.makeDataFrame()
@@ -270,6 +290,119 @@ class TesttHDFStore(unittest.TestCase):
         self.assertRaises(Exception, self.store.select,
                           'frame', [crit1, crit2])
 
+    def test_frame_columnar(self):
+        df = tm.makeTimeDataFrame()
+        df['int'] = np.arange(len(df))
+        df['bool'] = df['A'] > 0
+        df.values[3, 1] = np.nan
+
+        self.store.put('frame', df[:10], columnar=True)
+        self.store.append('frame', df[10:])
+        tm.assert_frame_equal(self.store['frame'], df)
+
+        self.store.put('frame', df, columnar=True, compression='zlib')
+        tm.assert_frame_equal(self.store['frame'], df)
+
+        # columns must match
+        self.assertRaises(ValueError, self.store.append, 'frame',
+                          df.ix[:, ['A', 'B']])
+
+        # only DataFrame
+        self.assertRaises(ValueError, self.store.put, 'wp',
+                          tm.makeWidePanel(), columnar=True)
+
+        self.assertRaises(Exception, self.store.remove, 'frame',
+                          [{'field' : 'column', 'value' : 'A'}])
+
+        df = DataFrame(np.random.randn(50, 10))
+        self.store.put('frame', df, columnar=True)
+        tm.assert_frame_equal(self.store['frame'], df)
+
+    def test_frame_columnar_select(self):
+        df = tm.makeTimeDataFrame()
+        self.store.put('frame', df, columnar=True)
+        date = df.index[len(df) // 2]
+
+        crit1 = {
+            'field' : 'index',
+            'op' : '>=',
+            'value' : date
+        }
+        crit2 = {
+            'field' : 'column',
+            'value' : ['A', 'D']
+        }
+        crit3 = {
+            'field' : 'column',
+            'value' : 'A'
+        }
+        crit4 = {
+            'field' : 'index',
+            'value' : [df.index[3], df.index[7]]
+        }
+
+        result = self.store.select('frame', [crit1, crit2])
+        expected = df.ix[date:, ['A', 'D']]
+        tm.assert_frame_equal(result, expected)
+
+        result = self.store.select('frame', [crit3])
+        expected = df.ix[:, ['A']]
+        tm.assert_frame_equal(result, expected)
+
+        result = self.store.select('frame', [crit4])
+        expected = df.reindex([df.index[3], df.index[7]])
+        tm.assert_frame_equal(result, expected)
+
+    def test_frame_columnar_data_columns(self):
+        df = tm.makeTimeDataFrame()
+        df['int'] = np.arange(len(df))
+        self.store.put('frame', df[:10], columnar=True,
+                       data_columns=['A', 'int'])
+        self.store.append('frame', df[10:])
+        tm.assert_frame_equal(self.store['frame'], df)
+
+        crit1 = {
+            'field' : 'A',
+            'op' : '>',
+            'value' : 0
+        }
+        crit2 = {
+            'field' : 'int',
+            'value' : range(0, 30, 3)
+        }
+        crit3 = {
+            'field' : 'column',
+            'value' : ['B', 'int']
+        }
+        crit4 = {
+            'field' : 'index',
+            'op' : '<',
+            'value' : df.index[20]
+        }
+
+        result = self.store.select('frame', [crit1])
+        tm.assert_frame_equal(result, df[df['A'] > 0])
+
+        result = self.store.select('frame', [crit1, crit2, crit3, crit4])
+        mask = ((df['A'] > 0) & (df['int'] % 3 == 0) &
+                (df['int'] < 20))
+        tm.assert_frame_equal(result, df.ix[mask, ['B', 'int']])
+
+        # more values than are combined into one condition
+        crit2['value'] = range(0, 30, 2) * 5 + range(100, 200)
+        result = self.store.select('frame', [crit2], start=5)
+        tm.assert_frame_equal(result, df[5:][df['int'][5:] % 2 == 0])
+
+        # criteria only on the index and data columns
+        crit1['field'] = 'B'
+        self.assertRaises(ValueError, self.store.select, 'frame', [crit1])
+        self.assertRaises(ValueError, self.store.put, 'frame', df,
+                          columnar=True, data_columns=['E'])
+
+        self.store.create_table_index('frame')
+        table = self.store.handle.root.frame.index
+        self.assert_(table.cols.data0.is_indexed)
+
     def test_select_filter_corner(self):
         df = DataFrame(np.random.randn(50, 100))
         df.index = ['%.3d' % c for c in df.index]
@@ -283,6 +416,120 @@ class TesttHDFStore(unittest.TestCase):
         result = self.store.select('frame', [crit])
         tm.assert_frame_equal(result, df.ix[:, df.columns[:75]])
 
+    def test_select_index_set(self):
+        df = DataFrame(np.random.randn(200, 3), columns=['A', 'B', 'C'],
+                       index=DateRange('1/1/2000', periods=200))
+        self.store.put('frame', df, table=True)
+
+        # more values than are expanded into the condition
+        dates = list(df.index[10:160:2])
+        crit = {
+            'field' : 'index',
+            'value' : dates
+        }
+        result = self.store.select('frame', [crit])
+        tm.assert_frame_equal(result, df.reindex(dates))
+
+        self.store.remove('frame', where=[crit])
+        expected = df.reindex(df.index - dates)
+        tm.assert_frame_equal(self.store['frame'], expected)
+
+    def test_select_start_stop(self):
+        df = tm.makeTimeDataFrame()
+        self.store.put('frame', df, table=True)
+
+        # one table row per index value and column
+        result = self.store.select('frame', start=8, stop=20)
+        tm.assert_frame_equal(result, df[2:5])
+
+        crit = {
+            'field' : 'column',
+            'value' : ['A', 'C']
+        }
+        result = self.store.select('frame', [crit], start=8)
+        tm.assert_frame_equal(result, df.ix[2:, ['A', 'C']])
+
+        self.store.put('frame', df, columnar=True)
+        result = self.store.select('frame', [crit], start=5, stop=10)
+        tm.assert_frame_equal(result, df.ix[5:10, ['A', 'C']])
+
+    def test_select_iterator(self):
+        df = tm.makeTimeDataFrame()
+        self.store.put('frame', df, table=True)
+
+        # chunks end on whole index values, 4 table rows each
+        chunks = list(self.store.select('frame', chunksize=7))
+        self.assertEqual([len(c) for c in chunks], [2] * 15)
+        result = reduce(DataFrame.append, chunks)
+        tm.assert_frame_equal(result, df)
+
+        crit = {
+            'field' : 'column',
+            'value' : ['A', 'C']
+        }
+        chunks = list(self.store.select('frame', [crit], iterator=True))
+        self.assertEqual(len(chunks), 1)
+        tm.assert_frame_equal(chunks[0], df.ix[:, ['A', 'C']])
+
+        # chunks without selected rows are skipped
+        crit = {
+            'field' : 'index',
+            'op' : '<',
+            'value' : df.index[5]
+        }
+        chunks = list(self.store.select('frame', [crit], chunksize=8))
+        self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+
+        wp = tm.makeWidePanel()
+        self.store.put('wp', wp, table=True)
+        chunks = list(self.store.select('wp', chunksize=40))
+        self.assertEqual(len(chunks), 3)
+        tm.assert_panel_equal(chunks[1], wp.truncate(before=wp.major_axis[10],
+                                                     after=wp.major_axis[19]))
+
+        # rows of an index value appended separately are in the same chunk
+        self.store.put('frame', df.ix[:, ['A', 'B']], table=True)
+        self.store.append('frame', df.ix[:, ['C', 'D']])
+        chunks = list(self.store.select('frame', chunksize=7))
+        self.assertEqual([len(c) for c in chunks], [2] * 15)
+        result = reduce(DataFrame.append, chunks)
+        tm.assert_frame_equal(result, df)
+
+        self.store.put('frame', df, columnar=True)
+        chunks = list(self.store.select('frame', chunksize=7))
+        self.assertEqual(len(chunks), 5)
+        result = reduce(DataFrame.append, chunks)
+        tm.assert_frame_equal(result, df)
+
+    def test_table_indexes(self):
+        df = tm.makeTimeDataFrame()
+        self.store.put('frame', df[:10], table=True)
+        self.store.append('frame', df[10:])
+
+        table = self.store.handle.root.frame.table
+        for name in ('index', 'column'):
+            column = getattr(table.cols, name)
+            self.assert_(column.is_indexed)
+
+        # appended rows are indexed without sorting the index again
+        crit = {
+            'field' : 'index',
+            'value' : df.index[20]
+        }
+        result = self.store.select('frame', [crit])
+        tm.assert_frame_equal(result, df[20:21])
+
+        self.store.create_table_index('frame')
+        for name in ('index', 'column'):
+            column = getattr(table.cols, name)
+            self.assert_(column.index.is_CSI)
+
+        result = self.store.select('frame', [crit])
+        tm.assert_frame_equal(result, df[20:21])
+
+        self.store['series'] = tm.makeTimeSeries()
+        self.assertRaises(Exception, self.store.create_table_index, 'series')
+
     def _check_roundtrip(self, obj, comparator):
         store = HDFStore(self.scratchpath, 'w')
         try:
@@ -211,147 +211,340 @@ def group_labels2(ndarray[object] values):
 
     return reverse, labels
 
-ctypedef double_t (* agg_func)(double_t *out, int32_t *counts, double_t *values,
-                               int32_t *labels, int start, int end,
-                               Py_ssize_t offset)
-
-cdef agg_func get_agg_func(object how):
-    if how == 'add':
-        return _group_add
-    elif how == 'mean':
-        return _group_mean
+#-------------------------------------------------------------------------------
+# One-pass reductions by group label. values is (rows x columns), labels give
+# the group of each row (-1 to skip it) and out is (groups x columns). NaN
+# values are excluded, a group without any observations gives NaN. counts
+# receives the number of rows in each group
 
 @cython.boundscheck(False)
-def group_aggregate(ndarray[double_t] values, list label_list,
-                    object shape, how='add'):
+@cython.wraparound(False)
+def group_add(ndarray[float64_t, ndim=2] out,
+              ndarray[int32_t] counts,
+              ndarray[float64_t, ndim=2] values,
+              ndarray[int32_t] labels):
     cdef:
-        list sorted_labels
-        ndarray result, counts
-        agg_func func
-
-    func = get_agg_func(how)
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] sumx, nobs
 
-    values, sorted_labels = _group_reorder(values, label_list)
-    result = np.empty(shape, dtype=np.float64)
-    result.fill(nan)
+    nobs = np.zeros_like(out)
+    sumx = np.zeros_like(out)
 
-    counts = np.zeros(shape, dtype=np.int32)
+    N, K = (<object> values).shape
 
-    if not values.flags.c_contiguous:
-        values = values.copy()
+    for i from 0 <= i < N:
+        lab = labels[i]
+        if lab < 0:
+            continue
 
-    _aggregate_group(<double_t*> result.data,
-                     <int32_t*> counts.data,
-                     <double_t*> values.data,
-                     sorted_labels, 0, len(values),
-                     shape, 0, 0, func)
+        counts[lab] += 1
+        for j from 0 <= j < K:
+            val = values[i, j]
 
-    return result, counts
+            # not nan
+            if val == val:
+                nobs[lab, j] += 1
+                sumx[lab, j] += val
 
-def _group_reorder(values, label_list):
-    indexer = np.lexsort(label_list[::-1])
-    sorted_labels = [labels.take(indexer) for labels in label_list]
-    sorted_values = values.take(indexer)
-    return sorted_values, sorted_labels
+    for i from 0 <= i < len(counts):
+        for j from 0 <= j < K:
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = sumx[i, j]
 
-cdef void _aggregate_group(double_t *out, int32_t *counts, double_t *values,
-                           list labels, int start, int end, tuple shape,
-                           Py_ssize_t which, Py_ssize_t offset,
-                           agg_func func):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_prod(ndarray[float64_t, ndim=2] out,
+               ndarray[int32_t] counts,
+               ndarray[float64_t, ndim=2] values,
+               ndarray[int32_t] labels):
     cdef:
-        ndarray[int32_t] axis
-        cdef Py_ssize_t stride
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] prodx, nobs
 
-    # time to actually aggregate
-    if which == len(labels) - 1:
-        axis = labels[which]
+    nobs = np.zeros_like(out)
+    prodx = np.ones_like(out)
 
-        while axis[start] == -1 and start < end:
-            start += 1
-        func(out, counts, values, <int32_t*> axis.data, start, end, offset)
-    else:
-        axis = labels[which][start:end]
-        stride = np.prod(shape[which+1:])
-        # get group counts on axisp
-        edges = axis.searchsorted(np.arange(1, shape[which] + 1), side='left')
-        # print edges, axis
-
-        left = axis.searchsorted(0) # ignore NA values coded as -1
-
-        # aggregate each subgroup
-        for right in edges:
-            _aggregate_group(out, counts, values, labels, start + left,
-                             start + right, shape, which + 1, offset, func)
-            offset += stride
-            left = right
-
-# TODO: aggregate multiple columns in single pass
-
-cdef double_t _group_add(double_t *out, int32_t *counts, double_t *values,
-                         int32_t *labels, int start, int end,
-                         Py_ssize_t offset):
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j from 0 <= j < K:
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                nobs[lab, j] += 1
+                prodx[lab, j] *= val
+
+    for i from 0 <= i < len(counts):
+        for j from 0 <= j < K:
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = prodx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_mean(ndarray[float64_t, ndim=2] out,
+               ndarray[int32_t] counts,
+               ndarray[float64_t, ndim=2] values,
+               ndarray[int32_t] labels):
     cdef:
-        Py_ssize_t i, it = start
-        int32_t lab
-        int32_t count = 0, tot = 0
-        double_t val, cum = 0
-
-    while it < end:
-        i = labels[it]
-        val = values[it]
-        tot += 1
-
-        # not nan
-        if val == val:
-            count += 1
-            cum += val
+        Py_ssize_t i, j, N, K, lab
+        float64_t val, count
+        ndarray[float64_t, ndim=2] sumx, nobs
+
+    nobs = np.zeros_like(out)
+    sumx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        lab = labels[i]
+        if lab < 0:
+            continue
 
-        if it == end - 1 or labels[it + 1] > i:
+        counts[lab] += 1
+        for j from 0 <= j < K:
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                nobs[lab, j] += 1
+                sumx[lab, j] += val
+
+    for i from 0 <= i < len(counts):
+        for j from 0 <= j < K:
+            count = nobs[i, j]
             if count == 0:
-                out[offset + i] = nan
+                out[i, j] = nan
             else:
-                out[offset + i] = cum
+                out[i, j] = sumx[i, j] / count
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_var(ndarray[float64_t, ndim=2] out,
+              ndarray[int32_t] counts,
+              ndarray[float64_t, ndim=2] values,
+              ndarray[int32_t] labels):
+    '''
+    Unbiased (ddof=1) variance, accumulated with Welford's updates so large
+    offsets in the data do not cost precision
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val, ct, delta
+        ndarray[float64_t, ndim=2] nobs, meanx, ssqdm
+
+    nobs = np.zeros_like(out)
+    meanx = np.zeros_like(out)
+    ssqdm = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        lab = labels[i]
+        if lab < 0:
+            continue
 
-            counts[offset + i] = tot
+        counts[lab] += 1
+        for j from 0 <= j < K:
+            val = values[i, j]
 
-            count = 0
-            cum = 0
-            tot = 0
+            # not nan
+            if val == val:
+                nobs[lab, j] += 1
+                delta = val - meanx[lab, j]
+                meanx[lab, j] += delta / nobs[lab, j]
+                ssqdm[lab, j] += delta * (val - meanx[lab, j])
 
-        it += 1
+    for i from 0 <= i < len(counts):
+        for j from 0 <= j < K:
+            ct = nobs[i, j]
+            if ct < 2:
+                out[i, j] = nan
+            else:
+                out[i, j] = ssqdm[i, j] / (ct - 1)
 
-cdef double_t _group_mean(double_t *out, int32_t *counts, double_t *values,
-                          int32_t *labels, int start, int end,
-                          Py_ssize_t offset):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min(ndarray[float64_t, ndim=2] out,
+              ndarray[int32_t] counts,
+              ndarray[float64_t, ndim=2] values,
+              ndarray[int32_t] labels):
     cdef:
-        Py_ssize_t i, it = start
-        int32_t lab
-        int32_t count = 0, tot = 0
-        double_t val, cum = 0
-
-    while it < end:
-        i = labels[it]
-        val = values[it]
-        tot += 1
-
-        # not nan
-        if val == val:
-            count += 1
-            cum += val
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] minx, nobs
 
-        if it == end - 1 or labels[it + 1] > i:
-            if count == 0:
-                out[offset + i] = nan
+    nobs = np.zeros_like(out)
+    minx = np.empty_like(out)
+    minx.fill(np.inf)
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j from 0 <= j < K:
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                nobs[lab, j] += 1
+                if val < minx[lab, j]:
+                    minx[lab, j] = val
+
+    for i from 0 <= i < len(counts):
+        for j from 0 <= j < K:
+            if nobs[i, j] == 0:
+                out[i, j] = nan
             else:
-                out[offset + i] = cum / count
+                out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max(ndarray[float64_t, ndim=2] out,
+              ndarray[int32_t] counts,
+              ndarray[float64_t, ndim=2] values,
+              ndarray[int32_t] labels):
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] maxx, nobs
+
+    nobs = np.zeros_like(out)
+    maxx = np.empty_like(out)
+    maxx.fill(-np.inf)
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j from 0 <= j < K:
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                nobs[lab, j] += 1
+                if val > maxx[lab, j]:
+                    maxx[lab, j] = val
+
+    for i from 0 <= i < len(counts):
+        for j from 0 <= j < K:
+            if nobs[i, j] == 0:
+                out[i, j] = nan
+            else:
+                out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count(ndarray[float64_t, ndim=2] out,
+                ndarray[int32_t] counts,
+                ndarray[float64_t, ndim=2] values,
+                ndarray[int32_t] labels):
+    '''
+    Number of non-NaN values, zero rather than NaN for empty groups
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+
+    out[:] = 0
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j from 0 <= j < K:
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                out[lab, j] += 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_first(ndarray[float64_t, ndim=2] out,
+                ndarray[int32_t] counts,
+                ndarray[float64_t, ndim=2] values,
+                ndarray[int32_t] labels):
+    '''
+    First non-NaN value of each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] nobs
+
+    nobs = np.zeros_like(out)
+    out[:] = nan
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        lab = labels[i]
+        if lab < 0:
+            continue
+
+        counts[lab] += 1
+        for j from 0 <= j < K:
+            val = values[i, j]
+
+            # not nan
+            if val == val and nobs[lab, j] == 0:
+                nobs[lab, j] = 1
+                out[lab, j] = val
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last(ndarray[float64_t, ndim=2] out,
+               ndarray[int32_t] counts,
+               ndarray[float64_t, ndim=2] values,
+               ndarray[int32_t] labels):
+    '''
+    Last non-NaN value of each group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+
+    out[:] = nan
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        lab = labels[i]
+        if lab < 0:
+            continue
 
-            counts[offset + i] = tot
+        counts[lab] += 1
+        for j from 0 <= j < K:
+            val = values[i, j]
 
-            count = 0
-            cum = 0
-            tot = 0
+            # not nan
+            if val == val:
+                out[lab, j] = val
 
-        it += 1
 
 def _result_shape(label_list):
     # assumed sorted
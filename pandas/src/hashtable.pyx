@@ -0,0 +1,662 @@
+from cpython cimport (PyObject, Py_INCREF, Py_XDECREF, PyObject_Hash,
+                      PyObject_RichCompareBool, Py_EQ)
+
+#-------------------------------------------------------------------------------
+# Open-addressing hash tables mapping int64, float64 or object keys to integer
+# locations. Keys live in typed arrays rather than a dict of boxed objects
+
+cdef inline Py_ssize_t _table_size(Py_ssize_t size_hint):
+    # power of two, kept at most half full
+    cdef Py_ssize_t n = 8
+    while n < 2 * size_hint:
+        n <<= 1
+    return n
+
+cdef inline uint64_t _mix64(uint64_t h):
+    # MurmurHash3 finalizer
+    h ^= h >> 33
+    h *= 0xff51afd7ed558ccdULL
+    h ^= h >> 33
+    h *= 0xc4ceb9fe1a85ec53ULL
+    h ^= h >> 33
+    return h
+
+cdef inline uint64_t _float64_hash(float64_t val):
+    cdef uint64_t bits
+    if val != val:
+        return 0
+    if val == 0:
+        # -0.0 == 0.0
+        val = 0
+    bits = (<uint64_t*> &val)[0]
+    return _mix64(bits)
+
+cdef inline bint _float64_eq(float64_t a, float64_t b):
+    return a == b or (a != a and b != b)
+
+cdef class HashTable:
+    cdef:
+        ndarray flags_arr, locs_arr
+        uint8_t *flags
+        Py_ssize_t *locs
+        Py_ssize_t n_buckets, count
+
+    def __len__(self):
+        return self.count
+
+    cdef _alloc(self, Py_ssize_t n_buckets):
+        self.flags_arr = np.zeros(n_buckets, dtype=np.uint8)
+        self.locs_arr = np.empty(n_buckets, dtype=np.intp)
+        self.flags = <uint8_t*> self.flags_arr.data
+        self.locs = <Py_ssize_t*> self.locs_arr.data
+        self.n_buckets = n_buckets
+        self.count = 0
+
+cdef class Int64HashTable(HashTable):
+    '''
+    Maps int64 keys to locations
+    '''
+    cdef:
+        ndarray keys_arr
+        int64_t *keys
+
+    def __init__(self, Py_ssize_t size_hint=1):
+        self._resize(_table_size(size_hint))
+
+    cdef _resize(self, Py_ssize_t n_buckets):
+        cdef:
+            Py_ssize_t i, n_old = self.n_buckets
+            ndarray old_flags = self.flags_arr
+            ndarray old_keys = self.keys_arr
+            ndarray old_locs = self.locs_arr
+
+        self._alloc(n_buckets)
+        self.keys_arr = np.empty(n_buckets, dtype=np.int64)
+        self.keys = <int64_t*> self.keys_arr.data
+
+        for i from 0 <= i < n_old:
+            if (<uint8_t*> old_flags.data)[i]:
+                self._insert((<int64_t*> old_keys.data)[i],
+                             (<Py_ssize_t*> old_locs.data)[i])
+
+    cdef inline Py_ssize_t _bucket(self, int64_t key):
+        cdef:
+            Py_ssize_t mask = self.n_buckets - 1
+            Py_ssize_t i = <Py_ssize_t> (_mix64(<uint64_t> key) & mask)
+        while self.flags[i] and self.keys[i] != key:
+            i = (i + 1) & mask
+        return i
+
+    cdef inline _insert(self, int64_t key, Py_ssize_t loc):
+        cdef Py_ssize_t i = self._bucket(key)
+        if not self.flags[i]:
+            self.flags[i] = 1
+            self.keys[i] = key
+            self.count += 1
+        self.locs[i] = loc
+
+    cpdef set_item(self, int64_t key, Py_ssize_t loc):
+        if 2 * (self.count + 1) > self.n_buckets:
+            self._resize(2 * self.n_buckets)
+        self._insert(key, loc)
+
+    cpdef get_item(self, int64_t key):
+        cdef Py_ssize_t i = self._bucket(key)
+        if not self.flags[i]:
+            raise KeyError(key)
+        return self.locs[i]
+
+    def __contains__(self, int64_t key):
+        return self.flags[self._bucket(key)] == 1
+
+    def map_locations(self, ndarray[int64_t] values):
+        cdef Py_ssize_t i, n = len(values)
+        for i from 0 <= i < n:
+            self.set_item(values[i], i)
+
+    def get_labels(self, ndarray[int64_t] values):
+        '''
+        Factorize values: label each one with the location of its first
+        occurrence among all keys added to this table so far, adding new keys
+        as they appear. Labels are shared across calls
+        '''
+        cdef:
+            Py_ssize_t i, j, n = len(values)
+            ndarray[int32_t] labels = np.empty(n, dtype=np.int32)
+            Py_ssize_t count
+            int64_t val
+
+        for i from 0 <= i < n:
+            val = values[i]
+            j = self._bucket(val)
+            if self.flags[j]:
+                labels[i] = self.locs[j]
+            else:
+                count = self.count
+                self.set_item(val, count)
+                labels[i] = count
+        return labels
+
+    def lookup(self, ndarray[int64_t] values):
+        '''
+        Locations of values, -1 where not present
+        '''
+        cdef:
+            Py_ssize_t i, j, n = len(values)
+            ndarray[int32_t] result = np.empty(n, dtype=np.int32)
+
+        for i from 0 <= i < n:
+            j = self._bucket(values[i])
+            if self.flags[j]:
+                result[i] = self.locs[j]
+            else:
+                result[i] = -1
+        return result
+
+cdef class Float64HashTable(HashTable):
+    '''
+    Maps float64 keys to locations. NaN keys are considered equal
+    '''
+    cdef:
+        ndarray keys_arr
+        float64_t *keys
+
+    def __init__(self, Py_ssize_t size_hint=1):
+        self._resize(_table_size(size_hint))
+
+    cdef _resize(self, Py_ssize_t n_buckets):
+        cdef:
+            Py_ssize_t i, n_old = self.n_buckets
+            ndarray old_flags = self.flags_arr
+            ndarray old_keys = self.keys_arr
+            ndarray old_locs = self.locs_arr
+
+        self._alloc(n_buckets)
+        self.keys_arr = np.empty(n_buckets, dtype=np.float64)
+        self.keys = <float64_t*> self.keys_arr.data
+
+        for i from 0 <= i < n_old:
+            if (<uint8_t*> old_flags.data)[i]:
+                self._insert((<float64_t*> old_keys.data)[i],
+                             (<Py_ssize_t*> old_locs.data)[i])
+
+    cdef inline Py_ssize_t _bucket(self, float64_t key):
+        cdef:
+            Py_ssize_t mask = self.n_buckets - 1
+            Py_ssize_t i = <Py_ssize_t> (_float64_hash(key) & mask)
+        while self.flags[i] and not _float64_eq(self.keys[i], key):
+            i = (i + 1) & mask
+        return i
+
+    cdef inline _insert(self, float64_t key, Py_ssize_t loc):
+        cdef Py_ssize_t i = self._bucket(key)
+        if not self.flags[i]:
+            self.flags[i] = 1
+            self.keys[i] = key
+            self.count += 1
+        self.locs[i] = loc
+
+    cpdef set_item(self, float64_t key, Py_ssize_t loc):
+        if 2 * (self.count + 1) > self.n_buckets:
+            self._resize(2 * self.n_buckets)
+        self._insert(key, loc)
+
+    cpdef get_item(self, float64_t key):
+        cdef Py_ssize_t i = self._bucket(key)
+        if not self.flags[i]:
+            raise KeyError(key)
+        return self.locs[i]
+
+    def __contains__(self, float64_t key):
+        return self.flags[self._bucket(key)] == 1
+
+    def map_locations(self, ndarray[float64_t] values):
+        cdef Py_ssize_t i, n = len(values)
+        for i from 0 <= i < n:
+            self.set_item(values[i], i)
+
+    def get_labels(self, ndarray[float64_t] values):
+        '''
+        Factorize values: label each one with the location of its first
+        occurrence among all keys added to this table so far, adding new keys
+        as they appear. Labels are shared across calls, NaN is labeled -1
+        '''
+        cdef:
+            Py_ssize_t i, j, n = len(values)
+            ndarray[int32_t] labels = np.empty(n, dtype=np.int32)
+            Py_ssize_t count
+            float64_t val
+
+        for i from 0 <= i < n:
+            val = values[i]
+            if val != val:
+                labels[i] = -1
+                continue
+
+            j = self._bucket(val)
+            if self.flags[j]:
+                labels[i] = self.locs[j]
+            else:
+                count = self.count
+                self.set_item(val, count)
+                labels[i] = count
+        return labels
+
+    def lookup(self, ndarray[float64_t] values):
+        '''
+        Locations of values, -1 where not present
+        '''
+        cdef:
+            Py_ssize_t i, j, n = len(values)
+            ndarray[int32_t] result = np.empty(n, dtype=np.int32)
+
+        for i from 0 <= i < n:
+            j = self._bucket(values[i])
+            if self.flags[j]:
+                result[i] = self.locs[j]
+            else:
+                result[i] = -1
+        return result
+
+cdef class PyObjectHashTable(HashTable):
+    '''
+    Maps hashable Python objects to locations
+    '''
+    cdef:
+        ndarray keys_arr, hashes_arr
+        PyObject **keys
+        long *hashes
+
+    def __init__(self, Py_ssize_t size_hint=1):
+        self._resize(_table_size(size_hint))
+
+    cdef _resize(self, Py_ssize_t n_buckets):
+        cdef:
+            Py_ssize_t i, n_old = self.n_buckets
+            ndarray old_flags = self.flags_arr
+            ndarray old_keys = self.keys_arr
+            ndarray old_hashes = self.hashes_arr
+            ndarray old_locs = self.locs_arr
+
+        self._alloc(n_buckets)
+        # object arrays start out filled with None
+        self.keys_arr = np.empty(n_buckets, dtype=object)
+        self.hashes_arr = np.empty(n_buckets, dtype=np.long)
+        self.keys = <PyObject**> self.keys_arr.data
+        self.hashes = <long*> self.hashes_arr.data
+
+        for i from 0 <= i < n_old:
+            if (<uint8_t*> old_flags.data)[i]:
+                self._insert(<object> (<PyObject**> old_keys.data)[i],
+                             (<long*> old_hashes.data)[i],
+                             (<Py_ssize_t*> old_locs.data)[i])
+
+    cdef Py_ssize_t _bucket(self, object key, long h) except -1:
+        cdef:
+            Py_ssize_t mask = self.n_buckets - 1
+            Py_ssize_t i = <Py_ssize_t> (_mix64(<uint64_t> h) & mask)
+            object existing
+
+        while self.flags[i]:
+            if self.hashes[i] == h:
+                existing = <object> self.keys[i]
+                if (existing is key or
+                    PyObject_RichCompareBool(existing, key, Py_EQ)):
+                    break
+            i = (i + 1) & mask
+        return i
+
+    cdef _insert(self, object key, long h, Py_ssize_t loc):
+        cdef Py_ssize_t i = self._bucket(key, h)
+        if not self.flags[i]:
+            Py_INCREF(key)
+            Py_XDECREF(self.keys[i])
+            self.keys[i] = <PyObject*> key
+            self.hashes[i] = h
+            self.flags[i] = 1
+            self.count += 1
+        self.locs[i] = loc
+
+    cpdef set_item(self, object key, Py_ssize_t loc):
+        cdef long h = PyObject_Hash(key)
+        if 2 * (self.count + 1) > self.n_buckets:
+            self._resize(2 * self.n_buckets)
+        self._insert(key, h, loc)
+
+    cpdef get_item(self, object key):
+        cdef Py_ssize_t i = self._bucket(key, PyObject_Hash(key))
+        if not self.flags[i]:
+            raise KeyError(key)
+        return self.locs[i]
+
+    def __contains__(self, object key):
+        return self.flags[self._bucket(key, PyObject_Hash(key))] == 1
+
+    def map_locations(self, ndarray[object] values):
+        cdef Py_ssize_t i, n = len(values)
+        for i from 0 <= i < n:
+            self.set_item(values[i], i)
+
+    def get_labels(self, ndarray[object] values):
+        '''
+        Factorize values: label each one with the location of its first
+        occurrence among all keys added to this table so far, adding new keys
+        as they appear. Labels are shared across calls, None and NaN are
+        labeled -1
+        '''
+        cdef:
+            Py_ssize_t i, j, n = len(values)
+            ndarray[int32_t] labels = np.empty(n, dtype=np.int32)
+            Py_ssize_t count
+            object val
+
+        for i from 0 <= i < n:
+            val = values[i]
+            if val is None or val != val:
+                labels[i] = -1
+                continue
+
+            j = self._bucket(val, PyObject_Hash(val))
+            if self.flags[j]:
+                labels[i] = self.locs[j]
+            else:
+                count = self.count
+                self.set_item(val, count)
+                labels[i] = count
+        return labels
+
+    def lookup(self, ndarray[object] values):
+        '''
+        Locations of values, -1 where not present
+        '''
+        cdef:
+            Py_ssize_t i, j, n = len(values)
+            ndarray[int32_t] result = np.empty(n, dtype=np.int32)
+            object val
+
+        for i from 0 <= i < n:
+            val = values[i]
+            j = self._bucket(val, PyObject_Hash(val))
+            if self.flags[j]:
+                result[i] = self.locs[j]
+            else:
+                result[i] = -1
+        return result
+
+#-------------------------------------------------------------------------------
+# Index engines
+
+# below this size a hash table is cheap to build and faster to probe than
+# binary search
+_SIZE_CUTOFF = 1000000
+
+cdef class IndexEngine:
+    '''
+    Label lookups for a 1-d array of unique labels. Nothing is computed until
+    the first lookup. For large strictly increasing arrays no hash table is
+    built and binary search is used instead
+    '''
+    cdef readonly:
+        ndarray values
+        object mapping
+        bint initialized, unique, binary_search
+
+    cdef:
+        int monotonic
+
+    def __init__(self, ndarray values):
+        self.values = values
+        self.initialized = 0
+        self.mapping = None
+        self.monotonic = -1
+
+    property is_unique:
+
+        def __get__(self):
+            self._initialize()
+            return self.unique
+
+    property is_monotonic:
+        # True if the labels are strictly increasing
+
+        def __get__(self):
+            if self.monotonic == -1:
+                if self.initialized and self.binary_search:
+                    self.monotonic = 1
+                else:
+                    self.monotonic = self._is_strictly_increasing()
+            return self.monotonic == 1
+
+    cdef _initialize(self):
+        if self.initialized:
+            return
+
+        self.binary_search = (len(self.values) >= _SIZE_CUTOFF and
+                              self.is_monotonic)
+        if self.binary_search:
+            self.unique = 1
+        else:
+            self.mapping = self._make_table()
+            self.unique = len(self.mapping) == len(self.values)
+        self.initialized = 1
+
+    cdef _ensure_unique(self):
+        self._initialize()
+        if not self.unique:
+            raise Exception('Index cannot contain duplicate values!')
+
+    cdef _get_mapping(self):
+        if self.mapping is None:
+            self.mapping = self._make_table()
+        return self.mapping
+
+    cdef bint _is_strictly_increasing(self) except -1:
+        raise NotImplementedError
+
+    cdef _make_table(self):
+        raise NotImplementedError
+
+    cdef _check_key(self, object val):
+        # coerce val to the table's key type or raise KeyError
+        return val
+
+    def __contains__(self, object val):
+        self._ensure_unique()
+        if not self.binary_search:
+            try:
+                val = self._check_key(val)
+            except KeyError:
+                return False
+            return val in self.mapping
+
+        try:
+            self.get_loc(val)
+            return True
+        except KeyError:
+            return False
+
+    cpdef get_loc(self, object val):
+        cdef object loc
+
+        self._ensure_unique()
+        if self.binary_search:
+            # unhashable keys raise TypeError like a dict lookup
+            PyObject_Hash(val)
+            try:
+                loc = self.values.searchsorted(val, side='left')
+            except TypeError:
+                # not comparable with the labels
+                raise KeyError(val)
+            else:
+                if not isinstance(loc, ndarray):
+                    if loc < len(self.values) and self.values[loc] == val:
+                        return loc
+                    raise KeyError(val)
+
+        return self._get_mapping().get_item(self._check_key(val))
+
+    def get_indexer(self, ndarray values):
+        '''
+        Locations of the passed labels, -1 where not present
+
+        Returns
+        -------
+        indexer : ndarray (int32)
+        '''
+        self._ensure_unique()
+        if self.binary_search:
+            try:
+                return self._get_indexer_monotonic(values)
+            except (TypeError, ValueError):
+                # mixed types, look up one at a time
+                return IndexEngine._lookup(self, values)
+
+        return self._lookup(values)
+
+    cdef _get_indexer_monotonic(self, ndarray values):
+        cdef Py_ssize_t n = len(self.values)
+
+        if n == 0:
+            return np.repeat(np.int32(-1), len(values))
+
+        loc = self.values.searchsorted(values, side='left')
+        loc = np.minimum(loc, n - 1)
+        found = np.asarray(self.values.take(loc) == values, dtype=bool)
+        if found.shape != loc.shape:
+            raise TypeError('elementwise comparison failed')
+
+        return np.where(found, loc, -1).astype(np.int32)
+
+    cdef _lookup(self, ndarray values):
+        # slow path for values of a different type than the labels
+        cdef:
+            Py_ssize_t i, n = len(values)
+            ndarray[int32_t] result = np.empty(n, dtype=np.int32)
+
+        for i from 0 <= i < n:
+            try:
+                result[i] = self.get_loc(values[i])
+            except (KeyError, TypeError):
+                result[i] = -1
+        return result
+
+cdef _lookup_converted(IndexEngine engine, ndarray values, dtype, kinds):
+    # hash lookup of values cast to the table's key type. Object arrays are
+    # cast if possible, values changed by the cast are not found
+    cdef ndarray converted, result
+
+    if issubclass(values.dtype.type, kinds):
+        return engine._get_mapping().lookup(np.asarray(values, dtype=dtype))
+
+    if values.dtype == np.object_:
+        try:
+            converted = values.astype(dtype)
+        except (TypeError, ValueError):
+            pass
+        else:
+            result = engine._get_mapping().lookup(converted)
+            result[converted != values] = -1
+            return result
+
+    return IndexEngine._lookup(engine, values)
+
+cdef class Int64Engine(IndexEngine):
+
+    def __init__(self, ndarray values):
+        IndexEngine.__init__(self, np.asarray(values, dtype=np.int64))
+
+    cdef bint _is_strictly_increasing(self) except -1:
+        cdef:
+            Py_ssize_t i, n = len(self.values)
+            int64_t *data = <int64_t*> self.values.data
+
+        if not is_contiguous(self.values):
+            self.values = self.values.copy()
+            data = <int64_t*> self.values.data
+
+        for i from 1 <= i < n:
+            if data[i] <= data[i - 1]:
+                return 0
+        return 1
+
+    cdef _make_table(self):
+        cdef Int64HashTable table = Int64HashTable(len(self.values))
+        table.map_locations(self.values)
+        return table
+
+    cdef _check_key(self, object val):
+        PyObject_Hash(val)
+        if isinstance(val, (int, long, np.integer)):
+            return val
+        if isinstance(val, (float, np.floating)):
+            try:
+                if val == int(val):
+                    return int(val)
+            except (OverflowError, ValueError):
+                pass
+        raise KeyError(val)
+
+    cdef _lookup(self, ndarray values):
+        return _lookup_converted(self, values, np.int64, np.integer)
+
+cdef class Float64Engine(IndexEngine):
+
+    def __init__(self, ndarray values):
+        IndexEngine.__init__(self, np.asarray(values, dtype=np.float64))
+
+    cdef bint _is_strictly_increasing(self) except -1:
+        cdef:
+            Py_ssize_t i, n = len(self.values)
+            float64_t *data
+
+        if not is_contiguous(self.values):
+            self.values = self.values.copy()
+        data = <float64_t*> self.values.data
+
+        for i from 1 <= i < n:
+            # fails for NaN too
+            if not data[i] > data[i - 1]:
+                return 0
+        return 1
+
+    cdef _make_table(self):
+        cdef Float64HashTable table = Float64HashTable(len(self.values))
+        table.map_locations(self.values)
+        return table
+
+    cdef _check_key(self, object val):
+        PyObject_Hash(val)
+        if isinstance(val, (int, long, float, np.number)):
+            return val
+        raise KeyError(val)
+
+    cdef _lookup(self, ndarray values):
+        return _lookup_converted(self, values, np.float64,
+                                 (np.integer, np.floating))
+
+cdef class ObjectEngine(IndexEngine):
+
+    def __init__(self, ndarray values):
+        IndexEngine.__init__(self, np.asarray(values, dtype=object))
+
+    cdef bint _is_strictly_increasing(self) except -1:
+        cdef:
+            Py_ssize_t i, n = len(self.values)
+            ndarray[object] values = self.values
+
+        try:
+            for i from 1 <= i < n:
+                if not values[i - 1] < values[i]:
+                    return 0
+        except (TypeError, ValueError):
+            return 0
+        return 1
+
+    cdef _make_table(self):
+        cdef PyObjectHashTable table = PyObjectHashTable(len(self.values))
+        table.map_locations(self.values)
+        return table
+
+    cdef _lookup(self, ndarray values):
+        return (<PyObjectHashTable> self._get_mapping()).lookup(
+            np.asarray(values, dtype=object))
@@ -44,3 +44,182 @@ def array_to_datetime(ndarray[int64_t, ndim=1] arr):
         result[i] = to_datetime(arr[i])
 
     return result
+
+#-------------------------------------------------------------------------------
+# int64 nanoseconds since the epoch, full microsecond precision
+
+cdef int64_t _NS_PER_DAY = 86400000000000LL
+
+# int64 nanoseconds span roughly 1677-09-21 to 2262-04-11
+cdef int64_t _MAX_DAYS = 106750
+
+cdef inline int64_t _days_from_civil(int64_t y, int64_t m, int64_t d):
+    # days since 1970-01-01 in the proleptic Gregorian calendar
+    cdef int64_t era, yoe, doy, doe
+
+    if m <= 2:
+        y -= 1
+    era = y // 400
+    yoe = y - era * 400
+    if m > 2:
+        doy = (153 * (m - 3) + 2) // 5 + d - 1
+    else:
+        doy = (153 * (m + 9) + 2) // 5 + d - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+cdef inline int64_t _datetime_to_ns(object dt) except? -1:
+    cdef int64_t days
+
+    if not PyDateTime_Check(dt):
+        raise TypeError('%s is not a datetime' % repr(dt))
+    if dt.tzinfo is not None:
+        raise ValueError('time zone aware datetimes are not supported')
+
+    days = _days_from_civil(PyDateTime_GET_YEAR(dt), PyDateTime_GET_MONTH(dt),
+                            PyDateTime_GET_DAY(dt))
+    if days > _MAX_DAYS or days < -_MAX_DAYS:
+        raise ValueError('%s is out of range for nanosecond timestamps' % dt)
+
+    return ((((days * 24 + PyDateTime_DATE_GET_HOUR(dt)) * 60
+              + PyDateTime_DATE_GET_MINUTE(dt)) * 60
+             + PyDateTime_DATE_GET_SECOND(dt)) * 1000000000LL
+            + PyDateTime_DATE_GET_MICROSECOND(dt) * 1000LL)
+
+cdef inline object _ns_to_datetime(int64_t stamp):
+    cdef int64_t z, era, doe, yoe, doy, mp, y, m, d, rem
+
+    z = stamp // _NS_PER_DAY
+    rem = stamp - z * _NS_PER_DAY
+
+    z += 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    y = yoe + era * 400
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    if mp < 10:
+        m = mp + 3
+    else:
+        m = mp - 9
+    if m <= 2:
+        y += 1
+
+    rem = rem // 1000
+    return pydatetime(y, m, d, rem // 3600000000LL,
+                      (rem // 60000000LL) % 60, (rem // 1000000LL) % 60,
+                      rem % 1000000LL)
+
+def datetime_to_ns(object dt):
+    '''
+    Convert a naive datetime to int64 nanoseconds since the epoch
+    '''
+    return _datetime_to_ns(dt)
+
+def ns_to_datetime(int64_t stamp):
+    '''
+    Convert int64 nanoseconds since the epoch to a datetime
+    '''
+    return _ns_to_datetime(stamp)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def array_datetime_to_ns(ndarray[object] arr):
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        ndarray[int64_t] result = np.empty(n, dtype=np.int64)
+
+    for i from 0 <= i < n:
+        result[i] = _datetime_to_ns(arr[i])
+
+    return result
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def array_ns_to_datetime(ndarray[int64_t] arr):
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    for i from 0 <= i < n:
+        result[i] = _ns_to_datetime(arr[i])
+
+    return result
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def format_csv_column(ndarray values, object na_rep='',
+                      object float_format=None):
+    '''
+    Convert an array to strings for delimited output. NaN and None become
+    na_rep, floats are formatted with float_format if given and everything
+    else with str
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+        ndarray[object] result = np.empty(n, dtype=object)
+        ndarray[float64_t] fvalues
+        ndarray[int64_t] ivalues
+        ndarray[object] ovalues
+        float64_t fval
+        object val
+
+    if values.dtype == np.float64:
+        fvalues = values
+        for i from 0 <= i < n:
+            fval = fvalues[i]
+            if fval != fval:
+                result[i] = na_rep
+            elif float_format is None:
+                result[i] = str(fval)
+            else:
+                result[i] = float_format % fval
+    elif values.dtype == np.int64:
+        ivalues = values
+        for i from 0 <= i < n:
+            result[i] = str(ivalues[i])
+    else:
+        ovalues = values.astype(object)
+        for i from 0 <= i < n:
+            val = ovalues[i]
+            if val is None or (PyFloat_Check(val) and val != val):
+                result[i] = na_rep
+            elif float_format is not None and PyFloat_Check(val):
+                result[i] = float_format % val
+            else:
+                result[i] = str(val)
+
+    return result
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def write_csv_rows(list columns, object f, object sep=','):
+    '''
+    Write the rows formed by a list of equal-length arrays of strings to the
+    file-like f with a single write call
+    '''
+    cdef:
+        Py_ssize_t i, j, n, ncols = len(columns)
+        ndarray[object, ndim=2] values
+        list lines, row
+
+    if ncols == 0:
+        return
+
+    n = len(columns[0])
+    values = np.empty((n, ncols), dtype=object)
+    for j from 0 <= j < ncols:
+        values[:, j] = columns[j]
+
+    lines = []
+    row = [None] * ncols
+    for i from 0 <= i < n:
+        for j from 0 <= j < ncols:
+            row[j] = values[i, j]
+        lines.append(sep.join(row))
+
+    # trailing newline
+    lines.append('')
+    f.write('\n'.join(lines))
@@ -0,0 +1,126 @@
+#-------------------------------------------------------------------------------
+# Hash joins on factorized keys. Keys on both sides are labeled 0..ngroups-1
+# (-1 for NA, which never matches) and the right side is bucketed by label
+# with a counting sort, so a join costs O(n + m + size of the result)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def groupsort_indexer(ndarray[int32_t] labels, Py_ssize_t ngroups):
+    '''
+    Counting sort of labels
+
+    Returns
+    -------
+    (indexer, counts) : indexer orders the positions by label, NA (-1) first
+        and stably within each label. counts[0] is the number of NA labels,
+        counts[k + 1] the number labeled k
+    '''
+    cdef:
+        Py_ssize_t i, loc, n = len(labels)
+        ndarray[int64_t] indexer = np.empty(n, dtype=np.int64)
+        ndarray[int64_t] counts = np.zeros(ngroups + 1, dtype=np.int64)
+        ndarray[int64_t] where = np.empty(ngroups + 1, dtype=np.int64)
+
+    for i from 0 <= i < n:
+        counts[labels[i] + 1] += 1
+
+    where[0] = 0
+    for i from 1 <= i < ngroups + 1:
+        where[i] = where[i - 1] + counts[i - 1]
+
+    for i from 0 <= i < n:
+        loc = labels[i] + 1
+        indexer[where[loc]] = i
+        where[loc] += 1
+
+    return indexer, counts
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef _hash_join(ndarray[int32_t] left, ndarray[int32_t] right,
+                Py_ssize_t ngroups, bint keep_left, bint keep_right):
+    cdef:
+        Py_ssize_t i, j, k, lab, pos, start, rc, count = 0
+        Py_ssize_t nleft = len(left), nright = len(right)
+        ndarray[int64_t] rsorter, rcounts, rstarts
+        ndarray[uint8_t] lseen = np.zeros(ngroups, dtype=np.uint8)
+        ndarray[int64_t] lindexer, rindexer
+
+    rsorter, rcounts = groupsort_indexer(right, ngroups)
+    rstarts = np.empty(ngroups + 1, dtype=np.int64)
+    rstarts[0] = 0
+    for i from 1 <= i < ngroups + 1:
+        rstarts[i] = rstarts[i - 1] + rcounts[i - 1]
+
+    # size the result
+    for i from 0 <= i < nleft:
+        lab = left[i]
+        rc = 0
+        if lab != -1:
+            rc = rcounts[lab + 1]
+            lseen[lab] = 1
+        if rc > 0:
+            count += rc
+        elif keep_left:
+            count += 1
+
+    if keep_right:
+        for j from 0 <= j < nright:
+            lab = right[j]
+            if lab == -1 or not lseen[lab]:
+                count += 1
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+
+    # rows of left in order, each followed by its matches in right order
+    pos = 0
+    for i from 0 <= i < nleft:
+        lab = left[i]
+        rc = 0
+        if lab != -1:
+            rc = rcounts[lab + 1]
+        if rc > 0:
+            start = rstarts[lab + 1]
+            for k from 0 <= k < rc:
+                lindexer[pos] = i
+                rindexer[pos] = rsorter[start + k]
+                pos += 1
+        elif keep_left:
+            lindexer[pos] = i
+            rindexer[pos] = -1
+            pos += 1
+
+    # then the unmatched rows of right
+    if keep_right:
+        for j from 0 <= j < nright:
+            lab = right[j]
+            if lab == -1 or not lseen[lab]:
+                lindexer[pos] = -1
+                rindexer[pos] = j
+                pos += 1
+
+    return lindexer, rindexer
+
+def left_outer_join(ndarray[int32_t] left, ndarray[int32_t] right,
+                    Py_ssize_t ngroups):
+    '''
+    Join indexers keeping every row of left, in order, with its matches in
+    right (-1 if there are none)
+    '''
+    return _hash_join(left, right, ngroups, True, False)
+
+def inner_join(ndarray[int32_t] left, ndarray[int32_t] right,
+               Py_ssize_t ngroups):
+    '''
+    Join indexers for the rows of left having matches in right, in left order
+    '''
+    return _hash_join(left, right, ngroups, False, False)
+
+def full_outer_join(ndarray[int32_t] left, ndarray[int32_t] right,
+                    Py_ssize_t ngroups):
+    '''
+    Join indexers keeping every row of left, as left_outer_join, followed by
+    the rows of right without a match in left (-1 in the left indexer)
+    '''
+    return _hash_join(left, right, ngroups, True, True)
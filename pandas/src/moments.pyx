@@ -73,63 +73,107 @@ def median(ndarray arr):
                 kth_smallest(arr, n / 2 - 1)) / 2
 
 #-------------------------------------------------------------------------------
-# Rolling sum
+# The rolling kernels below run over one contiguous column through raw
+# pointers. 2-d input is laid out column-major once and all of its columns are
+# done in a single C loop, instead of calling into Cython once per column.
+#
+# A window is given by the position of its first observation for each row,
+# start[i] <= i. Fixed windows have start[i] = max(i - win + 1, 0), windows
+# spanning a length of time (see window_starts) have starts moving forward
+# by varying amounts. Either way each value enters and leaves a window once
 
-def roll_sum(ndarray[double_t] input, int win, int minp):
-    cdef double val, prev, sum_x = 0
-    cdef int nobs = 0, i
-    cdef int N = len(input)
+ctypedef int (*roll_f)(double_t *input, double_t *output, Py_ssize_t N,
+                       int64_t *start, int minp) except -1
 
-    cdef ndarray[double_t] output = np.empty(N, dtype=float)
+cdef ndarray _fixed_starts(Py_ssize_t N, int win):
+    cdef:
+        Py_ssize_t i
+        ndarray[int64_t] start = np.empty(N, dtype=np.int64)
 
-    if minp > N:
-        minp = N + 1
+    for i from 0 <= i < N:
+        start[i] = int_max(i - win + 1, 0)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    return start
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            sum_x += val
+cdef ndarray _get_starts(Py_ssize_t N, int win, object start):
+    if start is None:
+        return _fixed_starts(N, win)
 
-        output[i] = NaN
+    start = np.ascontiguousarray(start, dtype=np.int64)
+    if len(start) != N:
+        raise ValueError('start must have one entry per row')
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+    return start
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                sum_x -= prev
-                nobs -= 1
+cdef ndarray _roll_columns(ndarray input, int win, int minp, roll_f func,
+                           object start):
+    cdef:
+        ndarray values, output, starts
+        Py_ssize_t j, N, K = 1
 
-        if val == val:
-            nobs += 1
-            sum_x += val
+    values = np.asfortranarray(input, dtype=np.float64)
+    output = np.empty_like(values)
 
-        if nobs >= minp:
-            output[i] = sum_x
-        else:
-            output[i] = NaN
+    N = len(values)
+    if values.ndim == 2:
+        K = values.shape[1]
+
+    starts = _get_starts(N, win, start)
+
+    for j from 0 <= j < K:
+        func(<double_t*> values.data + j * N,
+             <double_t*> output.data + j * N, N,
+             <int64_t*> starts.data, minp)
 
     return output
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def window_starts(ndarray[int64_t] stamps, ndarray[int64_t] lower):
+    '''
+    Window starts for time-based windows, by walking two pointers forward
+
+    Parameters
+    ----------
+    stamps : int64 ndarray
+        Observation times, sorted
+    lower : int64 ndarray
+        Exclusive lower bound of the window ending at each observation, sorted
+
+    Returns
+    -------
+    start : int64 ndarray
+        Position of the first observation later than lower[i], for each i
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, n = len(stamps)
+        ndarray[int64_t] start = np.empty(n, dtype=np.int64)
+
+    for i from 0 <= i < n:
+        while j < i and stamps[j] <= lower[i]:
+            j += 1
+        start[i] = j
+
+    return start
+
 #-------------------------------------------------------------------------------
-# Rolling mean
+# Rolling sum
 
-def roll_mean(ndarray[double_t] input,
-               int win, int minp):
+cdef int _roll_sum(double_t *input, double_t *output, Py_ssize_t N,
+                   int64_t *start, int minp) except -1:
     cdef double val, prev, sum_x = 0
-    cdef int nobs = 0, i
-    cdef int N = len(input)
+    cdef int nobs = 0
+    cdef Py_ssize_t i, j = 0
 
-    cdef ndarray[double_t] output = np.empty(N, dtype=float)
-
-    if minp > N:
-        minp = N + 1
+    for i from 0 <= i < N:
+        # drop the values which left the window
+        while j < start[i]:
+            prev = input[j]
+            if prev == prev:
+                sum_x -= prev
+                nobs -= 1
+            j += 1
 
-    for i from 0 <= i < minp - 1:
         val = input[i]
 
         # Not NaN
@@ -137,51 +181,68 @@ def roll_mean(ndarray[double_t] input,
             nobs += 1
             sum_x += val
 
-        output[i] = NaN
+        if nobs >= minp:
+            output[i] = sum_x
+        else:
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+    return 0
+
+def roll_sum(ndarray input, int win, int minp, start=None):
+    '''
+    Moving sum of a 1-d array or of each column of a 2-d array. Pass start
+    (see window_starts) for windows of varying length, win is then ignored
+    '''
+    return _roll_columns(input, win, minp, _roll_sum, start)
+
+#-------------------------------------------------------------------------------
+# Rolling mean
+
+cdef int _roll_mean(double_t *input, double_t *output, Py_ssize_t N,
+                    int64_t *start, int minp) except -1:
+    cdef double val, prev, sum_x = 0
+    cdef int nobs = 0
+    cdef Py_ssize_t i, j = 0
 
-        if i > win - 1:
-            prev = input[i - win]
+    for i from 0 <= i < N:
+        while j < start[i]:
+            prev = input[j]
             if prev == prev:
                 sum_x -= prev
                 nobs -= 1
+            j += 1
+
+        val = input[i]
 
+        # Not NaN
         if val == val:
             nobs += 1
             sum_x += val
 
-        if nobs >= minp:
+        if nobs >= minp and nobs > 0:
             output[i] = sum_x / nobs
         else:
             output[i] = NaN
 
-    return output
-
-#-------------------------------------------------------------------------------
-# Exponentially weighted moving average
+    return 0
 
-def ewma(ndarray[double_t] input, double_t com):
+def roll_mean(ndarray input, int win, int minp, start=None):
     '''
-    Compute exponentially-weighted moving average using center-of-mass.
-
-    Parameters
-    ----------
-    input : ndarray (float64 type)
-    com : float64
-
-    Returns
-    -------
-    y : ndarray
+    Moving mean of a 1-d array or of each column of a 2-d array. Pass start
+    (see window_starts) for windows of varying length, win is then ignored
     '''
+    return _roll_columns(input, win, minp, _roll_mean, start)
 
-    cdef double cur, prev, neww, oldw, adj
-    cdef int i
-    cdef int N = len(input)
+#-------------------------------------------------------------------------------
+# Exponentially weighted moving average
 
-    cdef ndarray[double_t] output = np.empty(N, dtype=float)
+cdef void _ewma(double_t *input, double_t *output, Py_ssize_t N,
+                double_t com, int minp):
+    cdef double cur, prev, neww, oldw, adj
+    cdef Py_ssize_t i, first = -1
 
+    if N == 0:
+        return
 
     neww = 1. / (1. + com)
     oldw = 1. - neww
@@ -207,155 +268,160 @@ def ewma(ndarray[double_t] input, double_t com):
 
         if cur == cur:
             adj *= oldw
+            if first == -1:
+                first = i
 
-    return output
+    # no value for minp periods starting at the first observation
+    if first == -1:
+        first = 0
 
-#-------------------------------------------------------------------------------
-# Rolling variance
+    for i from first <= i < int_min(first + minp, N):
+        output[i] = NaN
 
-def roll_var(ndarray[double_t] input, int win, int minp):
-    cdef double val, prev, sum_x = 0, sum_xx = 0, nobs = 0
-    cdef int i
-    cdef int N = len(input)
+def ewma(ndarray input, double_t com, int minp=0):
+    '''
+    Compute exponentially-weighted moving average using center-of-mass.
 
-    cdef ndarray[double_t] output = np.empty(N, dtype=float)
+    Parameters
+    ----------
+    input : ndarray (float64 type), 1-d or 2-d (by column)
+    com : float64
+    minp : int, default 0
+        Number of periods from the first valid value to leave NaN
 
-    if minp > N:
-        minp = N + 1
+    Returns
+    -------
+    y : ndarray
+    '''
+    cdef:
+        ndarray values, output
+        Py_ssize_t j, N, K = 1
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    values = np.asfortranarray(input, dtype=np.float64)
+    output = np.empty_like(values)
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            sum_x += val
-            sum_xx += val * val
+    N = len(values)
+    if values.ndim == 2:
+        K = values.shape[1]
 
-        output[i] = NaN
+    for j from 0 <= j < K:
+        _ewma(<double_t*> values.data + j * N,
+              <double_t*> output.data + j * N, N, com, minp)
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+    return output
+
+#-------------------------------------------------------------------------------
+# Rolling variance
+
+cdef int _roll_var(double_t *input, double_t *output, Py_ssize_t N,
+                   int64_t *start, int minp) except -1:
+    cdef double val, prev, sum_x = 0, sum_xx = 0, nobs = 0
+    cdef Py_ssize_t i, j = 0
 
-        if i > win - 1:
-            prev = input[i - win]
+    for i from 0 <= i < N:
+        while j < start[i]:
+            prev = input[j]
             if prev == prev:
                 sum_x -= prev
                 sum_xx -= prev * prev
                 nobs -= 1
+            j += 1
 
+        val = input[i]
+
+        # Not NaN
         if val == val:
             nobs += 1
             sum_x += val
             sum_xx += val * val
 
-        if nobs >= minp:
+        if nobs >= minp and nobs > 1:
             output[i] = (nobs * sum_xx - sum_x * sum_x) / (nobs * nobs - nobs)
         else:
             output[i] = NaN
 
-    return output
+    return 0
+
+def roll_var(ndarray input, int win, int minp, start=None):
+    '''
+    Unbiased moving variance of a 1-d array or of each column of a 2-d array.
+    Pass start (see window_starts) for windows of varying length
+    '''
+    return _roll_columns(input, win, minp, _roll_var, start)
 
 #-------------------------------------------------------------------------------
 # Rolling skewness
 
-def roll_skew(ndarray[double_t] input, int win, int minp):
+cdef int _roll_skew(double_t *input, double_t *output, Py_ssize_t N,
+                    int64_t *start, int minp) except -1:
     cdef double val, prev
     cdef double x = 0, xx = 0, xxx = 0
-    cdef int nobs = 0, i
-    cdef int N = len(input)
-
-    cdef ndarray[double_t] output = np.empty(N, dtype=float)
+    cdef int nobs = 0
+    cdef Py_ssize_t i, j = 0
 
     # 3 components of the skewness equation
     cdef double A, B, C, R
 
-    if minp > N:
-        minp = N + 1
-
-    for i from 0 <= i < minp - 1:
-        val = input[i]
-
-        # Not NaN
-        if val == val:
-            nobs += 1
-            x += val
-            xx += val * val
-            xxx += val * val * val
-
-        output[i] = NaN
-
-    for i from minp - 1 <= i < N:
-        val = input[i]
-
-        if i > win - 1:
-            prev = input[i - win]
+    for i from 0 <= i < N:
+        while j < start[i]:
+            prev = input[j]
             if prev == prev:
                 x -= prev
                 xx -= prev * prev
                 xxx -= prev * prev * prev
 
                 nobs -= 1
+            j += 1
 
+        val = input[i]
+
+        # Not NaN
         if val == val:
             nobs += 1
             x += val
             xx += val * val
             xxx += val * val * val
 
-        if nobs >= minp:
+        if nobs >= minp and nobs > 2:
             A = x / nobs
             B = xx / nobs - A * A
             C = xxx / nobs - A * A * A - 3 * A * B
 
             R = sqrt(B)
 
-            output[i] = ((sqrt(nobs * (nobs - 1.)) * C) /
-                         ((nobs-2) * R * R * R))
+            if R == 0:
+                output[i] = NaN
+            else:
+                output[i] = ((sqrt(nobs * (nobs - 1.)) * C) /
+                             ((nobs-2) * R * R * R))
         else:
             output[i] = NaN
 
-    return output
+    return 0
+
+def roll_skew(ndarray input, int win, int minp, start=None):
+    '''
+    Unbiased moving skewness of a 1-d array or of each column of a 2-d array.
+    Pass start (see window_starts) for windows of varying length
+    '''
+    return _roll_columns(input, win, minp, _roll_skew, start)
 
 #-------------------------------------------------------------------------------
 # Rolling kurtosis
 
-
-def roll_kurt(ndarray[double_t] input,
-               int win, int minp):
+cdef int _roll_kurt(double_t *input, double_t *output, Py_ssize_t N,
+                    int64_t *start, int minp) except -1:
     cdef double val, prev
     cdef double x = 0, xx = 0, xxx = 0, xxxx = 0
-    cdef int nobs = 0, i
-    cdef int N = len(input)
-
-    cdef ndarray[double_t] output = np.empty(N, dtype=float)
+    cdef int nobs = 0
+    cdef Py_ssize_t i, j = 0
 
     # 5 components of the kurtosis equation
     cdef double A, B, C, D, R, K
 
-    if minp > N:
-        minp = N + 1
-
-    for i from 0 <= i < minp - 1:
-        val = input[i]
-
-        # Not NaN
-        if val == val:
-            nobs += 1
-
-            # seriously don't ask me why this is faster
-            x += val
-            xx += val * val
-            xxx += val * val * val
-            xxxx += val * val * val * val
-
-        output[i] = NaN
-
-    for i from minp - 1 <= i < N:
-        val = input[i]
-
-        if i > win - 1:
-            prev = input[i - win]
+    for i from 0 <= i < N:
+        while j < start[i]:
+            prev = input[j]
             if prev == prev:
                 x -= prev
                 xx -= prev * prev
@@ -363,15 +429,21 @@ def roll_kurt(ndarray[double_t] input,
                 xxxx -= prev * prev * prev * prev
 
                 nobs -= 1
+            j += 1
 
+        val = input[i]
+
+        # Not NaN
         if val == val:
             nobs += 1
+
+            # seriously don't ask me why this is faster
             x += val
             xx += val * val
             xxx += val * val * val
             xxxx += val * val * val * val
 
-        if nobs >= minp:
+        if nobs >= minp and nobs > 3:
             A = x / nobs
             R = A * A
             B = xx / nobs - R
@@ -380,176 +452,238 @@ def roll_kurt(ndarray[double_t] input,
             R = R * A
             D = xxxx / nobs - R - 6*B*A*A - 4*C*A
 
-            K = (nobs * nobs - 1.)*D/(B*B) - 3*((nobs-1.)**2)
-            K = K / ((nobs - 2.)*(nobs-3.))
+            if B == 0:
+                output[i] = NaN
+            else:
+                K = (nobs * nobs - 1.)*D/(B*B) - 3*((nobs-1.)**2)
+                K = K / ((nobs - 2.)*(nobs-3.))
 
-            output[i] = K
+                output[i] = K
         else:
             output[i] = NaN
 
-    return output
-
-#-------------------------------------------------------------------------------
-# Rolling median, min, max
-
-ctypedef double_t (* skiplist_f)(object sl, int n, int p)
+    return 0
 
-cdef _roll_skiplist_op(ndarray arg, int win, int minp, skiplist_f op):
-    cdef ndarray[double_t] input = arg
-    cdef double val, prev, midpoint
-    cdef IndexableSkiplist skiplist
-    cdef int nobs = 0, i
+def roll_kurt(ndarray input, int win, int minp, start=None):
+    '''
+    Unbiased moving kurtosis of a 1-d array or of each column of a 2-d array.
+    Pass start (see window_starts) for windows of varying length
+    '''
+    return _roll_columns(input, win, minp, _roll_kurt, start)
 
-    cdef int N = len(input)
-    cdef ndarray[double_t] output = np.empty(N, dtype=float)
+#-------------------------------------------------------------------------------
+# Rolling median, quantile
 
-    skiplist = IndexableSkiplist(win)
+cdef int _roll_order_stat(double_t *input, double_t *output, Py_ssize_t N,
+                          int64_t *start, int minp, skiplist_t *skiplist,
+                          double quantile, bint median) except -1:
+    cdef:
+        double val, prev
+        int nobs = 0, midpoint
+        Py_ssize_t i, j = 0
 
-    if minp > N:
-        minp = N + 1
+    for i from 0 <= i < N:
+        while j < start[i]:
+            prev = input[j]
+            if prev == prev:
+                skiplist_remove(skiplist, prev)
+                nobs -= 1
+            j += 1
 
-    for i from 0 <= i < minp - 1:
         val = input[i]
 
         # Not NaN
         if val == val:
             nobs += 1
-            skiplist.insert(val)
-
-        output[i] = NaN
-
-    for i from minp - 1 <= i < N:
-        val = input[i]
-
-        if i > win - 1:
-            prev = input[i - win]
-
-            if prev == prev:
-                skiplist.remove(prev)
-                nobs -= 1
+            skiplist_insert(skiplist, val)
+
+        if nobs >= minp and nobs > 0:
+            if median:
+                midpoint = nobs / 2
+                if nobs % 2:
+                    output[i] = skiplist_get(skiplist, midpoint)
+                else:
+                    output[i] = (skiplist_get(skiplist, midpoint) +
+                                 skiplist_get(skiplist, midpoint - 1)) / 2
+            else:
+                output[i] = skiplist_get(skiplist,
+                                         <int> (quantile * (nobs - 1)))
+        else:
+            output[i] = NaN
 
+    # empty it for the next column
+    for j from j <= j < N:
+        val = input[j]
         if val == val:
-            nobs += 1
-            skiplist.insert(val)
+            skiplist_remove(skiplist, val)
 
-        output[i] = op(skiplist, nobs, minp)
+    return 0
+
+cdef ndarray _roll_skiplist_op(ndarray input, int win, int minp,
+                               double quantile, bint median, object start):
+    cdef:
+        ndarray values, output, starts
+        Py_ssize_t j, N, K = 1
+        skiplist_t *skiplist
+
+    values = np.asfortranarray(input, dtype=np.float64)
+    output = np.empty_like(values)
+
+    N = len(values)
+    if values.ndim == 2:
+        K = values.shape[1]
+
+    starts = _get_starts(N, win, start)
+    if start is not None:
+        win = N
+
+    skiplist = skiplist_init(int_min(win, N))
+    try:
+        for j from 0 <= j < K:
+            _roll_order_stat(<double_t*> values.data + j * N,
+                             <double_t*> output.data + j * N, N,
+                             <int64_t*> starts.data, minp,
+                             skiplist, quantile, median)
+    finally:
+        skiplist_destroy(skiplist)
 
     return output
 
-def roll_median(ndarray input, int win, int minp):
+def roll_median(ndarray input, int win, int minp, start=None):
     '''
     O(N log(window)) implementation using skip list
     '''
-    return _roll_skiplist_op(input, win, minp, _get_median)
+    return _roll_skiplist_op(input, win, minp, 0.5, True, start)
 
-# Unfortunately had to resort to some hackery here, would like for
-# Cython to be able to get this right.
-
-cdef double_t _get_median(object sl, int nobs, int minp):
-    cdef int midpoint
-    cdef IndexableSkiplist skiplist = <IndexableSkiplist> sl
-    if nobs >= minp:
-        midpoint = nobs / 2
-        if nobs % 2:
-            return skiplist.get(midpoint)
-        else:
-            return (skiplist.get(midpoint) +
-                    skiplist.get(midpoint - 1)) / 2
-    else:
-        return NaN
-
-def roll_max(ndarray input, int win, int minp):
+def roll_quantile(ndarray input, int win, int minp, double quantile,
+                  start=None):
     '''
     O(N log(window)) implementation using skip list
     '''
-    return _roll_skiplist_op(input, win, minp, _get_max)
+    return _roll_skiplist_op(input, win, minp, quantile, False, start)
 
-cdef double_t _get_max(object skiplist, int nobs, int minp):
-    if nobs >= minp:
-        return <IndexableSkiplist> skiplist.get(nobs - 1)
-    else:
-        return NaN
+#-------------------------------------------------------------------------------
+# Rolling min, max
 
-def roll_min(ndarray input, int win, int minp):
-    '''
-    O(N log(window)) implementation using skip list
-    '''
-    return _roll_skiplist_op(input, win, minp, _get_min)
+cdef int _roll_minmax(double_t *input, double_t *output, Py_ssize_t N,
+                      int64_t *start, int minp, bint is_max) except -1:
+    # positions of the candidates for the extreme value of the window, their
+    # values monotonic from the front. Each position goes in and out once
+    cdef:
+        double val
+        int nobs = 0
+        Py_ssize_t i, j = 0, head = 0, tail = 0
+        int64_t *deque
 
-cdef double_t _get_min(object skiplist, int nobs, int minp):
-    if nobs >= minp:
-        return <IndexableSkiplist> skiplist.get(0)
-    else:
-        return NaN
+    if N == 0:
+        return 0
 
-def roll_quantile(ndarray[float64_t, cast=True] input, int win,
-                  int minp, double quantile):
-   '''
-   O(N log(window)) implementation using skip list
-   '''
-   cdef double val, prev, midpoint
-   cdef IndexableSkiplist skiplist
-   cdef int nobs = 0, i
-   cdef int N = len(input)
-   cdef ndarray[double_t] output = np.empty(N, dtype=float)
+    deque = <int64_t*> malloc(N * sizeof(int64_t))
+    if deque == NULL:
+        raise MemoryError()
 
-   skiplist = IndexableSkiplist(win)
+    for i from 0 <= i < N:
+        while j < start[i]:
+            if input[j] == input[j]:
+                nobs -= 1
+            j += 1
 
-   if minp > N:
-       minp = N + 1
+        while head < tail and deque[head] < start[i]:
+            head += 1
 
-   for i from 0 <= i < minp - 1:
-       val = input[i]
+        val = input[i]
 
-       # Not NaN
-       if val == val:
-           nobs += 1
-           skiplist.insert(val)
+        # Not NaN
+        if val == val:
+            nobs += 1
+            if is_max:
+                while head < tail and input[deque[tail - 1]] <= val:
+                    tail -= 1
+            else:
+                while head < tail and input[deque[tail - 1]] >= val:
+                    tail -= 1
+            deque[tail] = i
+            tail += 1
+
+        if nobs >= minp and head < tail:
+            output[i] = input[deque[head]]
+        else:
+            output[i] = NaN
 
-       output[i] = NaN
+    free(deque)
+    return 0
+
+cdef int _roll_max(double_t *input, double_t *output, Py_ssize_t N,
+                   int64_t *start, int minp) except -1:
+    return _roll_minmax(input, output, N, start, minp, True)
+
+cdef int _roll_min(double_t *input, double_t *output, Py_ssize_t N,
+                   int64_t *start, int minp) except -1:
+    return _roll_minmax(input, output, N, start, minp, False)
+
+def roll_max(ndarray input, int win, int minp, start=None):
+    '''
+    O(N) implementation using a monotonic deque
+    '''
+    return _roll_columns(input, win, minp, _roll_max, start)
 
-   for i from minp - 1 <= i < N:
-       val = input[i]
+def roll_min(ndarray input, int win, int minp, start=None):
+    '''
+    O(N) implementation using a monotonic deque
+    '''
+    return _roll_columns(input, win, minp, _roll_min, start)
 
-       if i > win - 1:
-           prev = input[i - win]
+def roll_generic(ndarray input, int win, int minp, object func, start=None):
+    '''
+    Apply func to each window of a 1-d array or of each column of a 2-d array
+    '''
+    cdef:
+        ndarray values, output
+        Py_ssize_t j
 
-           if prev == prev:
-               skiplist.remove(prev)
-               nobs -= 1
+    values = np.asfortranarray(input, dtype=np.float64)
+    if start is not None:
+        start = _get_starts(len(values), win, start)
 
-       if val == val:
-           nobs += 1
-           skiplist.insert(val)
+    if values.ndim == 1:
+        return _roll_generic(values, win, minp, func, start)
 
-       if nobs >= minp:
-           idx = int((quantile / 1.) * (nobs - 1))
-           output[i] = skiplist.get(idx)
-       else:
-           output[i] = NaN
+    output = np.empty_like(values)
+    for j from 0 <= j < values.shape[1]:
+        output[:, j] = _roll_generic(values[:, j], win, minp, func, start)
 
-   return output
+    return output
 
-def roll_generic(ndarray[float64_t, cast=True] input, int win,
-                 int minp, object func):
+cdef _roll_generic(ndarray[float64_t, cast=True] input, int win,
+                   int minp, object func, object start):
     cdef ndarray[double_t] output, counts, bufarr
+    cdef ndarray[int64_t] starts
     cdef Py_ssize_t i, n
     cdef float64_t *buf, *oldbuf
 
     if not input.flags.c_contiguous:
         input = input.copy('C')
 
-    buf = <float64_t*> input.data
-
     n = len(input)
     output = np.empty(n, dtype=float)
-    counts = roll_sum(np.isfinite(input).astype(float), win, minp)
+    counts = roll_sum(np.isfinite(input).astype(float), win, minp, start)
+
+    if start is not None:
+        starts = start
+        for i from 0 <= i < n:
+            if counts[i] >= minp:
+                output[i] = func(input[starts[i] : i + 1])
+            else:
+                output[i] = NaN
+
+        return output
+
+    buf = <float64_t*> input.data
 
     bufarr = np.empty(win, dtype=float)
     oldbuf = <float64_t*> bufarr.data
 
-    n = len(input)
-    for i from 0 <= i < win:
+    for i from 0 <= i < int_min(win, n):
         if counts[i] >= minp:
             output[i] = func(input[int_max(i - win + 1, 0) : i + 1])
         else:
@@ -566,3 +700,218 @@ def roll_generic(ndarray[float64_t, cast=True] input, int win,
     bufarr.data = <char*> oldbuf
 
     return output
+
+#-------------------------------------------------------------------------------
+# Streaming versions of the moving window functions. They keep the last
+# window of values (or O(1) state for ewma) and the running sums, so each
+# update only costs the number of new values. The outputs match those of the
+# functions above over the whole history
+
+cdef class RollingSum:
+    '''
+    Moving sum fed a few values at a time
+
+    Parameters
+    ----------
+    window : int
+    min_periods : int, default window
+        Minimum number of observations in window required to have a value
+
+    Examples
+    --------
+    >>> acc = RollingSum(20)
+    >>> acc.update(values) --> moving sum at each of values
+    >>> acc.update(more_values) --> and at each of more_values
+    '''
+    cdef:
+        readonly int window, min_periods
+        ndarray buf
+        Py_ssize_t pos, nseen
+        double nobs, sum_x, sum_xx
+
+    def __init__(self, int window, min_periods=None):
+        if window < 1:
+            raise ValueError('window must be positive')
+
+        if min_periods is None:
+            min_periods = window
+
+        self.window = window
+        self.min_periods = min_periods
+        self.buf = np.empty(window, dtype=np.float64)
+        self.pos = 0
+        self.nseen = 0
+        self.nobs = 0
+        self.sum_x = 0
+        self.sum_xx = 0
+
+    cdef double _value(self):
+        return self.sum_x
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update(self, values):
+        '''
+        Add values to the end of the series
+
+        Returns
+        -------
+        y : ndarray, the statistic for the window ending at each new value
+        '''
+        cdef:
+            ndarray[double_t] input, output
+            ndarray[double_t] buf = self.buf
+            double val, prev
+            Py_ssize_t i, n
+
+        input = np.atleast_1d(np.asarray(values, dtype=np.float64)).ravel()
+        n = len(input)
+        output = np.empty(n, dtype=np.float64)
+
+        for i from 0 <= i < n:
+            val = input[i]
+
+            if self.nseen >= self.window:
+                prev = buf[self.pos]
+                if prev == prev:
+                    self.sum_x -= prev
+                    self.sum_xx -= prev * prev
+                    self.nobs -= 1
+
+            # Not NaN
+            if val == val:
+                self.nobs += 1
+                self.sum_x += val
+                self.sum_xx += val * val
+
+            buf[self.pos] = val
+            self.pos = (self.pos + 1) % self.window
+            self.nseen += 1
+
+            if self.nobs >= self.min_periods:
+                output[i] = self._value()
+            else:
+                output[i] = NaN
+
+        return output
+
+    def __reduce__(self):
+        state = (self.buf, self.pos, self.nseen, self.nobs, self.sum_x,
+                 self.sum_xx)
+        return type(self), (self.window, self.min_periods), state
+
+    def __setstate__(self, state):
+        buf, self.pos, self.nseen, self.nobs, self.sum_x, self.sum_xx = state
+        self.buf = np.array(buf, dtype=np.float64)
+
+cdef class RollingMean(RollingSum):
+    '''
+    Moving mean fed a few values at a time, see RollingSum
+    '''
+    cdef double _value(self):
+        if self.nobs == 0:
+            return NaN
+        return self.sum_x / self.nobs
+
+cdef class RollingVar(RollingSum):
+    '''
+    Unbiased moving variance fed a few values at a time, see RollingSum
+    '''
+    def __init__(self, int window, min_periods=None):
+        if min_periods is not None:
+            min_periods = max(2, min_periods)
+        RollingSum.__init__(self, window, min_periods)
+
+    cdef double _value(self):
+        cdef double nobs = self.nobs
+        if nobs < 2:
+            return NaN
+        return ((nobs * self.sum_xx - self.sum_x * self.sum_x) /
+                (nobs * nobs - nobs))
+
+cdef class EWMA:
+    '''
+    Exponentially-weighted moving average fed a few values at a time, with
+    O(1) state
+
+    Parameters
+    ----------
+    com : float64, optional
+        Center of mass
+    span : float64, optional
+        Specify decay in terms of span instead, com = (span - 1) / 2
+    min_periods : int, default 0
+        Number of periods from the first valid value to leave NaN
+    '''
+    cdef:
+        readonly double com
+        readonly int min_periods
+        double prev, adj
+        Py_ssize_t since_first
+
+    def __init__(self, com=None, span=None, int min_periods=0):
+        if span is not None:
+            if com is not None:
+                raise Exception("com and span are mutually exclusive")
+            com = (span - 1) / 2.
+        elif com is None:
+            raise Exception("Must pass either com or span")
+
+        self.com = com
+        self.min_periods = min_periods
+        self.prev = NaN
+        self.adj = 1. - 1. / (1. + com)
+        self.since_first = -1
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def update(self, values):
+        '''
+        Add values to the end of the series
+
+        Returns
+        -------
+        y : ndarray, the average up to each new value
+        '''
+        cdef:
+            ndarray[double_t] input, output
+            double cur, neww, oldw
+            Py_ssize_t i, n
+
+        input = np.atleast_1d(np.asarray(values, dtype=np.float64)).ravel()
+        n = len(input)
+        output = np.empty(n, dtype=np.float64)
+
+        neww = 1. / (1. + self.com)
+        oldw = 1. - neww
+
+        for i from 0 <= i < n:
+            cur = input[i]
+
+            if cur == cur:
+                if self.prev == self.prev:
+                    self.prev = oldw * self.prev + neww * cur
+                else:
+                    self.prev = neww * cur
+
+                if self.since_first == -1:
+                    self.since_first = 0
+
+            output[i] = self.prev / (1. - self.adj)
+
+            if cur == cur:
+                self.adj *= oldw
+
+            if self.since_first != -1:
+                if self.since_first < self.min_periods:
+                    output[i] = NaN
+                self.since_first += 1
+
+        return output
+
+    def __reduce__(self):
+        state = (self.prev, self.adj, self.since_first)
+        return type(self), (self.com, None, self.min_periods), state
+
+    def __setstate__(self, state):
+        self.prev, self.adj, self.since_first = state
@@ -0,0 +1,747 @@
+#-------------------------------------------------------------------------------
+# Delimited text tokenizer, used by the 'c' engine in pandas.io.parsers
+
+from libc.stdlib cimport realloc, strtod, strtoll
+from libc.string cimport memmove, strcmp
+from libc.errno cimport errno, ERANGE
+
+from cpython cimport PyString_FromString, PyString_AsString, PyString_Size
+
+# tokenizer states
+cdef enum:
+    START_RECORD
+    START_FIELD
+    IN_FIELD
+    IN_QUOTED_FIELD
+    QUOTE_IN_QUOTED_FIELD
+    EAT_CRNL
+
+cdef inline bint _to_double(char *word, double *out):
+    '''
+    Parse a complete field as a double. Trailing whitespace is permitted to
+    match the behavior of float(), hex literals are rejected
+    '''
+    cdef char *end
+    cdef char *p
+
+    out[0] = strtod(word, &end)
+    if end == word:
+        return 0
+
+    p = end
+    while p[0] == c' ' or p[0] == c'\t':
+        p += 1
+    if p[0] != 0:
+        return 0
+
+    p = word
+    while p < end:
+        if p[0] == c'x' or p[0] == c'X':
+            return 0
+        p += 1
+
+    return 1
+
+cdef inline bint _to_int64(char *word, int64_t *out):
+    '''
+    Parse a complete field as a base 10 int64, failing on overflow
+    '''
+    global errno
+    cdef char *end
+
+    errno = 0
+    out[0] = strtoll(word, &end, 10)
+    if end == word or errno == ERANGE:
+        return 0
+
+    while end[0] == c' ' or end[0] == c'\t':
+        end += 1
+
+    return end[0] == 0
+
+cdef class TextReader:
+    '''
+    Tokenizes delimited text from a file-like object into NUL-terminated
+    fields held in a single C buffer, then converts whole columns at a time
+    into float64, int64 or object arrays
+
+    Parameters
+    ----------
+    source : file-like object
+        Anything with a read(nbytes) method returning a string
+    delimiter : single character string, default ','
+    quotechar : single character string or None, default '"'
+        None disables quote processing
+    strip_trailing : boolean, default False
+        Strip trailing whitespace from each line (read_table semantics)
+    na_values : iterable of strings
+        Fields equal to one of these are converted to NaN
+    skiprows : iterable of ints
+        Row numbers (0-indexed) to discard during tokenization
+    chunk_bytes : int, default 262144
+        Number of bytes requested from the source per read
+
+    Notes
+    -----
+    Passing usecols to set_usecols discards all other fields as they are
+    tokenized, so that column positions in read are relative to the kept
+    columns
+    '''
+    cdef:
+        object source
+        char delimiter, quotechar
+        bint strip_trailing, eof
+        int state
+        public Py_ssize_t chunk_bytes
+
+        # NUL-terminated field data
+        char *stream
+        Py_ssize_t stream_len, stream_cap
+
+        # offsets of each field into stream
+        Py_ssize_t *words
+        Py_ssize_t words_len, words_cap
+
+        # index of first word and number of words per line
+        Py_ssize_t *line_start
+        Py_ssize_t *line_fields
+        Py_ssize_t lines, lines_cap
+
+        # in-progress line and field
+        Py_ssize_t line_word_start, field_start
+        Py_ssize_t record
+
+        # field positions to keep, and position of the in-progress field
+        char *usecols
+        Py_ssize_t usecols_len, field_index
+        bint last_kept
+
+        set skiprows
+
+        # NA strings, with the first characters recorded for quick rejection
+        list na_list
+        char **na_strings
+        Py_ssize_t n_na
+        char na_first[256]
+
+    def __cinit__(self):
+        self.stream = NULL
+        self.words = NULL
+        self.line_start = NULL
+        self.line_fields = NULL
+        self.na_strings = NULL
+        self.usecols = NULL
+
+    def __init__(self, object source, delimiter=',', quotechar='"',
+                 strip_trailing=False, na_values=None, skiprows=None,
+                 chunk_bytes=262144):
+        cdef Py_ssize_t i
+
+        if len(delimiter) != 1:
+            raise ValueError('delimiter must be a single character')
+
+        self.source = source
+        self.delimiter = (<char*> delimiter)[0]
+        if quotechar is None:
+            self.quotechar = 0
+        else:
+            self.quotechar = (<char*> quotechar)[0]
+        self.strip_trailing = strip_trailing
+        self.chunk_bytes = chunk_bytes
+        self.eof = 0
+        self.state = START_RECORD
+
+        self.stream_len = self.words_len = self.lines = 0
+        self.stream_cap = self.words_cap = self.lines_cap = 0
+        self.line_word_start = self.field_start = self.record = 0
+        self.usecols_len = self.field_index = 0
+        self.last_kept = 1
+
+        if skiprows is None:
+            self.skiprows = set()
+        else:
+            self.skiprows = set(skiprows)
+
+        if na_values is None:
+            na_values = []
+        self.na_list = [str(v) for v in na_values]
+        self.n_na = len(self.na_list)
+        self.na_strings = <char**> realloc(NULL,
+                                           (self.n_na + 1) * sizeof(char*))
+        for i from 0 <= i < 256:
+            self.na_first[i] = 0
+        for i from 0 <= i < self.n_na:
+            self.na_strings[i] = PyString_AsString(self.na_list[i])
+            self.na_first[<unsigned char> self.na_strings[i][0]] = 1
+
+        self._grow_stream(self.chunk_bytes)
+        self._grow_words(1024)
+        self._grow_lines(1024)
+
+    def __dealloc__(self):
+        free(self.stream)
+        free(self.words)
+        free(self.line_start)
+        free(self.line_fields)
+        free(self.na_strings)
+        free(self.usecols)
+
+    #----------------------------------------------------------------------
+    # Buffer management
+
+    cdef int _grow_stream(self, Py_ssize_t need) except -1:
+        cdef Py_ssize_t cap = self.stream_cap
+        cdef char *buf
+
+        if self.stream_len + need <= cap:
+            return 0
+
+        while cap < self.stream_len + need:
+            cap = 2 * cap + 1024
+
+        buf = <char*> realloc(self.stream, cap * sizeof(char))
+        if buf == NULL:
+            raise MemoryError()
+        self.stream = buf
+        self.stream_cap = cap
+        return 0
+
+    cdef int _grow_words(self, Py_ssize_t need) except -1:
+        cdef Py_ssize_t cap = self.words_cap
+        cdef Py_ssize_t *buf
+
+        if self.words_len + need <= cap:
+            return 0
+
+        while cap < self.words_len + need:
+            cap = 2 * cap + 1024
+
+        buf = <Py_ssize_t*> realloc(self.words, cap * sizeof(Py_ssize_t))
+        if buf == NULL:
+            raise MemoryError()
+        self.words = buf
+        self.words_cap = cap
+        return 0
+
+    cdef int _grow_lines(self, Py_ssize_t need) except -1:
+        cdef Py_ssize_t cap = self.lines_cap
+        cdef Py_ssize_t *start, *fields
+
+        if self.lines + need <= cap:
+            return 0
+
+        while cap < self.lines + need:
+            cap = 2 * cap + 1024
+
+        start = <Py_ssize_t*> realloc(self.line_start,
+                                      cap * sizeof(Py_ssize_t))
+        if start == NULL:
+            raise MemoryError()
+        self.line_start = start
+
+        fields = <Py_ssize_t*> realloc(self.line_fields,
+                                       cap * sizeof(Py_ssize_t))
+        if fields == NULL:
+            raise MemoryError()
+        self.line_fields = fields
+
+        self.lines_cap = cap
+        return 0
+
+    cdef int _discard_lines(self, Py_ssize_t n) except -1:
+        '''
+        Drop the first n tokenized lines, keeping any lines after them and the
+        line currently being tokenized
+        '''
+        cdef Py_ssize_t i, word_base, stream_base
+
+        if n == 0:
+            return 0
+
+        if n < self.lines:
+            word_base = self.line_start[n]
+        else:
+            word_base = self.line_word_start
+
+        if word_base < self.words_len:
+            stream_base = self.words[word_base]
+        else:
+            stream_base = self.field_start
+
+        memmove(self.stream, self.stream + stream_base,
+                self.stream_len - stream_base)
+        self.stream_len -= stream_base
+        self.field_start -= stream_base
+
+        memmove(self.words, self.words + word_base,
+                (self.words_len - word_base) * sizeof(Py_ssize_t))
+        self.words_len -= word_base
+        for i from 0 <= i < self.words_len:
+            self.words[i] -= stream_base
+        self.line_word_start -= word_base
+
+        memmove(self.line_start, self.line_start + n,
+                (self.lines - n) * sizeof(Py_ssize_t))
+        memmove(self.line_fields, self.line_fields + n,
+                (self.lines - n) * sizeof(Py_ssize_t))
+        self.lines -= n
+        for i from 0 <= i < self.lines:
+            self.line_start[i] -= word_base
+
+        return 0
+
+    #----------------------------------------------------------------------
+    # Tokenizer
+
+    cdef inline int _end_field(self) except -1:
+        if self.usecols != NULL:
+            self.last_kept = (self.field_index < self.usecols_len and
+                              self.usecols[self.field_index])
+            self.field_index += 1
+            if not self.last_kept:
+                self.stream_len = self.field_start
+                return 0
+
+        self._grow_words(1)
+        self.stream[self.stream_len] = 0
+        self.stream_len += 1
+        self.words[self.words_len] = self.field_start
+        self.words_len += 1
+        self.field_start = self.stream_len
+        return 0
+
+    cdef int _end_line(self) except -1:
+        cdef Py_ssize_t nfields, last
+        cdef char c
+
+        nfields = self.words_len - self.line_word_start
+
+        if self.strip_trailing and self.last_kept:
+            # equivalent to calling rstrip() on the raw line
+            while nfields > 0:
+                last = self.words[self.words_len - 1]
+                while self.stream_len - 1 > last:
+                    c = self.stream[self.stream_len - 2]
+                    if not (c == c' ' or c == c'\t' or c == c'\r' or
+                            c == c'\n' or c == c'\f' or c == c'\v'):
+                        break
+                    self.stream_len -= 1
+                    self.stream[self.stream_len - 1] = 0
+
+                # when discarding columns an empty trailing field is left
+                # in place, it converts to NA either way
+                if (self.stream_len - 1 > last or nfields == 1 or
+                    self.usecols != NULL or
+                    not (self.delimiter == c' ' or self.delimiter == c'\t')):
+                    break
+
+                # empty trailing field following a whitespace delimiter
+                self.stream_len = last
+                self.words_len -= 1
+                nfields -= 1
+
+            self.field_start = self.stream_len
+
+        if self.skiprows and self.record in self.skiprows:
+            if nfields > 0:
+                self.stream_len = self.words[self.line_word_start]
+            self.field_start = self.stream_len
+            self.words_len = self.line_word_start
+        else:
+            self._grow_lines(1)
+            self.line_start[self.lines] = self.line_word_start
+            self.line_fields[self.lines] = nfields
+            self.lines += 1
+            self.line_word_start = self.words_len
+
+        self.field_index = 0
+        self.last_kept = 1
+        self.record += 1
+        return 0
+
+    cdef int _tokenize_bytes(self, char *buf, Py_ssize_t length) except -1:
+        cdef:
+            Py_ssize_t i
+            char c
+            char delimiter = self.delimiter
+            char quotechar = self.quotechar
+            int state = self.state
+
+        # every input character yields at most one byte of output
+        self._grow_stream(length + 1)
+
+        i = 0
+        while i < length:
+            c = buf[i]
+
+            if state == START_RECORD:
+                if c == c'\n':
+                    # blank line
+                    self.record += 1
+                    i += 1
+                    continue
+                elif c == c'\r':
+                    self.record += 1
+                    state = EAT_CRNL
+                    i += 1
+                    continue
+                state = START_FIELD
+                # fall through to START_FIELD
+
+            if state == START_FIELD:
+                if c == c'\n' or c == c'\r':
+                    self._end_field()
+                    self._end_line()
+                    state = EAT_CRNL if c == c'\r' else START_RECORD
+                elif quotechar != 0 and c == quotechar:
+                    state = IN_QUOTED_FIELD
+                elif c == delimiter:
+                    self._end_field()
+                else:
+                    self.stream[self.stream_len] = c
+                    self.stream_len += 1
+                    state = IN_FIELD
+
+            elif state == IN_FIELD:
+                if c == c'\n' or c == c'\r':
+                    self._end_field()
+                    self._end_line()
+                    state = EAT_CRNL if c == c'\r' else START_RECORD
+                elif c == delimiter:
+                    self._end_field()
+                    state = START_FIELD
+                else:
+                    self.stream[self.stream_len] = c
+                    self.stream_len += 1
+
+            elif state == IN_QUOTED_FIELD:
+                if c == quotechar:
+                    state = QUOTE_IN_QUOTED_FIELD
+                else:
+                    self.stream[self.stream_len] = c
+                    self.stream_len += 1
+
+            elif state == QUOTE_IN_QUOTED_FIELD:
+                if c == quotechar:
+                    # doubled quote character
+                    self.stream[self.stream_len] = c
+                    self.stream_len += 1
+                    state = IN_QUOTED_FIELD
+                elif c == delimiter:
+                    self._end_field()
+                    state = START_FIELD
+                elif c == c'\n' or c == c'\r':
+                    self._end_field()
+                    self._end_line()
+                    state = EAT_CRNL if c == c'\r' else START_RECORD
+                else:
+                    self.stream[self.stream_len] = c
+                    self.stream_len += 1
+                    state = IN_FIELD
+
+            elif state == EAT_CRNL:
+                state = START_RECORD
+                if c != c'\n':
+                    # reprocess this character
+                    continue
+
+            i += 1
+
+        self.state = state
+        return 0
+
+    cdef int _finish(self) except -1:
+        self._grow_stream(1)
+        if self.state in (START_FIELD, IN_FIELD, IN_QUOTED_FIELD,
+                          QUOTE_IN_QUOTED_FIELD):
+            self._end_field()
+            self._end_line()
+        self.state = START_RECORD
+        self.eof = 1
+        return 0
+
+    cdef int _tokenize(self, Py_ssize_t nrows) except -1:
+        '''
+        Tokenize until at least nrows complete lines are buffered (or all of
+        the input if nrows < 0)
+        '''
+        cdef object chunk
+
+        while not self.eof and (nrows < 0 or self.lines < nrows):
+            chunk = self.source.read(self.chunk_bytes)
+            if not chunk:
+                self._finish()
+                break
+
+            if isinstance(chunk, unicode):
+                chunk = chunk.encode('utf-8')
+
+            self._tokenize_bytes(PyString_AsString(chunk),
+                                 PyString_Size(chunk))
+
+        return 0
+
+    #----------------------------------------------------------------------
+    # Conversion
+
+    cdef inline char *_get_word(self, Py_ssize_t i, Py_ssize_t j):
+        if j < self.line_fields[i]:
+            return self.stream + self.words[self.line_start[i] + j]
+        return NULL
+
+    cdef inline bint _is_na(self, char *word):
+        cdef Py_ssize_t k
+
+        if not self.na_first[<unsigned char> word[0]]:
+            return 0
+
+        for k from 0 <= k < self.n_na:
+            if strcmp(word, self.na_strings[k]) == 0:
+                return 1
+        return 0
+
+    cdef _convert_column(self, Py_ssize_t j, Py_ssize_t n):
+        cdef:
+            Py_ssize_t i
+            char *word
+            double val
+            bint all_int = n > 0
+            bint numeric = 1
+            ndarray[float64_t] result
+            ndarray[object] oresult
+
+        result = np.empty(n, dtype=np.float64)
+
+        for i from 0 <= i < n:
+            word = self._get_word(i, j)
+            if word == NULL or self._is_na(word):
+                result[i] = NaN
+                all_int = 0
+                continue
+
+            if not _to_double(word, &val):
+                numeric = 0
+                break
+
+            result[i] = val
+            if all_int and not (val > -9.2e18 and val < 9.2e18 and
+                                val == <double> (<int64_t> val)):
+                all_int = 0
+
+        if numeric:
+            if all_int:
+                return result.astype(np.int64)
+            return result
+
+        # non-numeric data, NA fields become NaN, numeric fields floats
+        oresult = np.empty(n, dtype=object)
+        for i from 0 <= i < n:
+            word = self._get_word(i, j)
+            if word == NULL or self._is_na(word):
+                oresult[i] = NaN
+            elif _to_double(word, &val):
+                oresult[i] = val
+            else:
+                oresult[i] = PyString_FromString(word)
+
+        return oresult
+
+    cdef _typed_column(self, Py_ssize_t j, Py_ssize_t n, object dtype):
+        cdef:
+            Py_ssize_t i
+            char *word
+            double dval
+            int64_t ival
+            ndarray[float64_t] fresult
+            ndarray[int64_t] iresult
+            ndarray[object] oresult
+
+        dtype = np.dtype(dtype)
+
+        if issubclass(dtype.type, np.integer):
+            iresult = np.empty(n, dtype=np.int64)
+            for i from 0 <= i < n:
+                word = self._get_word(i, j)
+                if word == NULL or self._is_na(word):
+                    raise ValueError('Integer column %d has NA values' % j)
+                if not _to_int64(word, &ival):
+                    raise ValueError('Unable to parse %r as %s in column %d'
+                                     % (word, dtype, j))
+                iresult[i] = ival
+            return iresult.astype(dtype)
+
+        elif issubclass(dtype.type, np.floating):
+            fresult = np.empty(n, dtype=np.float64)
+            for i from 0 <= i < n:
+                word = self._get_word(i, j)
+                if word == NULL or self._is_na(word):
+                    fresult[i] = NaN
+                elif _to_double(word, &dval):
+                    fresult[i] = dval
+                else:
+                    raise ValueError('Unable to parse %r as %s in column %d'
+                                     % (word, dtype, j))
+            return fresult.astype(dtype)
+
+        oresult = np.empty(n, dtype=object)
+        for i from 0 <= i < n:
+            word = self._get_word(i, j)
+            if word == NULL or self._is_na(word):
+                oresult[i] = NaN
+            else:
+                oresult[i] = PyString_FromString(word)
+
+        if dtype == np.object_:
+            return oresult
+        return oresult.astype(dtype)
+
+    cdef _string_column(self, Py_ssize_t j, Py_ssize_t n):
+        cdef:
+            Py_ssize_t i
+            char *word
+            ndarray[object] result
+
+        result = np.empty(n, dtype=object)
+        for i from 0 <= i < n:
+            word = self._get_word(i, j)
+            if word == NULL:
+                result[i] = ''
+            else:
+                result[i] = PyString_FromString(word)
+
+        return result
+
+    cdef int _filter_words(self, Py_ssize_t start, Py_ssize_t nfields,
+                           Py_ssize_t dest) except -1:
+        '''
+        Move the kept words among the nfields words at start down to dest,
+        returning the number kept
+        '''
+        cdef Py_ssize_t k, kept = 0
+
+        for k from 0 <= k < nfields:
+            if k < self.usecols_len and self.usecols[k]:
+                self.words[dest + kept] = self.words[start + k]
+                kept += 1
+
+        return kept
+
+    #----------------------------------------------------------------------
+    # Public interface
+
+    def set_usecols(self, positions):
+        '''
+        Keep only the fields at the given (0-indexed) positions of each line,
+        including lines which have already been tokenized
+        '''
+        cdef Py_ssize_t i, nfields, dest = 0
+
+        positions = sorted(set(positions))
+        if len(positions) > 0 and positions[0] < 0:
+            raise ValueError('usecols positions must be non-negative')
+
+        if self.usecols != NULL:
+            raise Exception('usecols already set')
+
+        self.usecols_len = positions[-1] + 1 if len(positions) > 0 else 0
+        self.usecols = <char*> realloc(NULL, self.usecols_len + 1)
+        for i from 0 <= i < self.usecols_len:
+            self.usecols[i] = 0
+        for i in positions:
+            self.usecols[i] = 1
+
+        # compact words already buffered
+        for i from 0 <= i < self.lines:
+            nfields = self.line_fields[i]
+            self.line_fields[i] = self._filter_words(self.line_start[i],
+                                                     nfields, dest)
+            self.line_start[i] = dest
+            dest += self.line_fields[i]
+
+        nfields = self.words_len - self.line_word_start
+        self.field_index = nfields
+        nfields = self._filter_words(self.line_word_start, nfields, dest)
+        self.line_word_start = dest
+        self.words_len = dest + nfields
+
+    def peek_nfields(self):
+        '''
+        Number of fields in the next line, without consuming it
+        '''
+        self._tokenize(1)
+        if self.lines == 0:
+            return 0
+        return self.line_fields[0]
+
+    def read_rows(self, Py_ssize_t n):
+        '''
+        Return the next n rows as lists of strings
+        '''
+        cdef:
+            Py_ssize_t i, j, nrows
+            list rows = [], row
+
+        self._tokenize(n)
+        nrows = n if n < self.lines else self.lines
+
+        for i from 0 <= i < nrows:
+            row = []
+            for j from 0 <= j < self.line_fields[i]:
+                row.append(PyString_FromString(self._get_word(i, j)))
+            rows.append(row)
+
+        self._discard_lines(nrows)
+        return rows
+
+    def read(self, rows=None, raw=None, dtypes=None):
+        '''
+        Tokenize and convert the next block of rows
+
+        Parameters
+        ----------
+        rows : int, default None
+            Number of rows to read, or all remaining rows if None
+        raw : collection of ints, default None
+            Column positions to return as unconverted strings
+        dtypes : dict, default None
+            Column position -> dtype for columns not needing type inference.
+            NA fields become NaN, or raise for integer dtypes
+
+        Returns
+        -------
+        columns : list of ndarray
+            One array per column, the number of columns being the largest
+            number of fields found in any row. Missing fields are NA
+        '''
+        cdef:
+            Py_ssize_t i, n, ncols = 0
+            list result = []
+
+        if rows is None:
+            self._tokenize(-1)
+            n = self.lines
+        else:
+            n = rows
+            self._tokenize(n)
+            if n > self.lines:
+                n = self.lines
+
+        if raw is None:
+            raw = ()
+        if dtypes is None:
+            dtypes = {}
+
+        for i from 0 <= i < n:
+            if self.line_fields[i] > ncols:
+                ncols = self.line_fields[i]
+
+        for i from 0 <= i < ncols:
+            if i in raw:
+                result.append(self._string_column(i, n))
+            elif i in dtypes:
+                result.append(self._typed_column(i, n, dtypes[i]))
+            else:
+                result.append(self._convert_column(i, n))
+
+        self._discard_lines(n)
+        return result
@@ -317,3 +317,534 @@ def getMergeVec(ndarray values, dict oldMap):
 
     return fillVec, mask.astype(bool)
 
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pad_int64(ndarray[int64_t] old, ndarray[int64_t] new):
+    '''
+    Fill indexer for sorted, unique old and new labels: location of the last
+    old label <= each new label, -1 if there is none
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, nold = len(old), nnew = len(new)
+        ndarray[int32_t] indexer = np.empty(nnew, dtype=np.int32)
+
+    for i from 0 <= i < nnew:
+        while j < nold and old[j] <= new[i]:
+            j += 1
+        indexer[i] = j - 1
+
+    return indexer
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def backfill_int64(ndarray[int64_t] old, ndarray[int64_t] new):
+    '''
+    Fill indexer for sorted, unique old and new labels: location of the first
+    old label >= each new label, -1 if there is none
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, nold = len(old), nnew = len(new)
+        ndarray[int32_t] indexer = np.empty(nnew, dtype=np.int32)
+
+    for i from 0 <= i < nnew:
+        while j < nold and old[j] < new[i]:
+            j += 1
+        if j < nold:
+            indexer[i] = j
+        else:
+            indexer[i] = -1
+
+    return indexer
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def union_sorted_int64(ndarray[int64_t] left, ndarray[int64_t] right):
+    '''
+    Merge two sorted arrays of unique values into their sorted union
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        ndarray[int64_t] result = np.empty(nleft + nright, dtype=np.int64)
+        int64_t lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            i += 1
+            j += 1
+        elif lval < rval:
+            result[k] = lval
+            i += 1
+        else:
+            result[k] = rval
+            j += 1
+        k += 1
+
+    while i < nleft:
+        result[k] = left[i]
+        i += 1
+        k += 1
+
+    while j < nright:
+        result[k] = right[j]
+        j += 1
+        k += 1
+
+    return result[:k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def intersection_sorted_int64(ndarray[int64_t] left,
+                              ndarray[int64_t] right):
+    '''
+    Intersection of two sorted arrays of unique values, sorted
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        ndarray[int64_t] result = np.empty(min(nleft, nright),
+                                           dtype=np.int64)
+        int64_t lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            i += 1
+            j += 1
+            k += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pad_float64(ndarray[float64_t] old, ndarray[float64_t] new):
+    '''
+    Fill indexer for sorted, unique old and new labels: location of the last
+    old label <= each new label, -1 if there is none
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, nold = len(old), nnew = len(new)
+        ndarray[int32_t] indexer = np.empty(nnew, dtype=np.int32)
+
+    for i from 0 <= i < nnew:
+        while j < nold and old[j] <= new[i]:
+            j += 1
+        indexer[i] = j - 1
+
+    return indexer
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def backfill_float64(ndarray[float64_t] old, ndarray[float64_t] new):
+    '''
+    Fill indexer for sorted, unique old and new labels: location of the first
+    old label >= each new label, -1 if there is none
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, nold = len(old), nnew = len(new)
+        ndarray[int32_t] indexer = np.empty(nnew, dtype=np.int32)
+
+    for i from 0 <= i < nnew:
+        while j < nold and old[j] < new[i]:
+            j += 1
+        if j < nold:
+            indexer[i] = j
+        else:
+            indexer[i] = -1
+
+    return indexer
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def union_sorted_float64(ndarray[float64_t] left, ndarray[float64_t] right):
+    '''
+    Merge two sorted arrays of unique values into their sorted union
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        ndarray[float64_t] result = np.empty(nleft + nright, dtype=np.float64)
+        float64_t lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            i += 1
+            j += 1
+        elif lval < rval:
+            result[k] = lval
+            i += 1
+        else:
+            result[k] = rval
+            j += 1
+        k += 1
+
+    while i < nleft:
+        result[k] = left[i]
+        i += 1
+        k += 1
+
+    while j < nright:
+        result[k] = right[j]
+        j += 1
+        k += 1
+
+    return result[:k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def intersection_sorted_float64(ndarray[float64_t] left,
+                                ndarray[float64_t] right):
+    '''
+    Intersection of two sorted arrays of unique values, sorted
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        ndarray[float64_t] result = np.empty(min(nleft, nright),
+                                             dtype=np.float64)
+        float64_t lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            i += 1
+            j += 1
+            k += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def left_join_indexer_int64(ndarray[int64_t] left, ndarray[int64_t] right):
+    '''
+    Merge two sorted arrays of unique values: location in right of each left
+    value, -1 if it is not there
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, nleft = len(left), nright = len(right)
+        ndarray[int32_t] indexer = np.empty(nleft, dtype=np.int32)
+        int64_t lval
+
+    for i from 0 <= i < nleft:
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            indexer[i] = j
+        else:
+            indexer[i] = -1
+
+    return indexer
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def inner_join_indexer_int64(ndarray[int64_t] left, ndarray[int64_t] right):
+    '''
+    Merge two sorted arrays of unique values into their intersection, with
+    the locations of each result value in left and in right
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        Py_ssize_t n = min(nleft, nright)
+        ndarray[int64_t] result = np.empty(n, dtype=np.int64)
+        ndarray[int32_t] lindexer = np.empty(n, dtype=np.int32)
+        ndarray[int32_t] rindexer = np.empty(n, dtype=np.int32)
+        int64_t lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            i += 1
+            j += 1
+            k += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:k], lindexer[:k], rindexer[:k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def outer_join_indexer_int64(ndarray[int64_t] left, ndarray[int64_t] right):
+    '''
+    Merge two sorted arrays of unique values into their union, with the
+    locations of each result value in left and in right (-1 if absent)
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        Py_ssize_t n = nleft + nright
+        ndarray[int64_t] result = np.empty(n, dtype=np.int64)
+        ndarray[int32_t] lindexer = np.empty(n, dtype=np.int32)
+        ndarray[int32_t] rindexer = np.empty(n, dtype=np.int32)
+        int64_t lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            i += 1
+            j += 1
+        elif lval < rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = -1
+            i += 1
+        else:
+            result[k] = rval
+            lindexer[k] = -1
+            rindexer[k] = j
+            j += 1
+        k += 1
+
+    while i < nleft:
+        result[k] = left[i]
+        lindexer[k] = i
+        rindexer[k] = -1
+        i += 1
+        k += 1
+
+    while j < nright:
+        result[k] = right[j]
+        lindexer[k] = -1
+        rindexer[k] = j
+        j += 1
+        k += 1
+
+    return result[:k], lindexer[:k], rindexer[:k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def left_join_indexer_float64(ndarray[float64_t] left, ndarray[float64_t] right):
+    '''
+    Merge two sorted arrays of unique values: location in right of each left
+    value, -1 if it is not there
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, nleft = len(left), nright = len(right)
+        ndarray[int32_t] indexer = np.empty(nleft, dtype=np.int32)
+        float64_t lval
+
+    for i from 0 <= i < nleft:
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            indexer[i] = j
+        else:
+            indexer[i] = -1
+
+    return indexer
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def inner_join_indexer_float64(ndarray[float64_t] left, ndarray[float64_t] right):
+    '''
+    Merge two sorted arrays of unique values into their intersection, with
+    the locations of each result value in left and in right
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        Py_ssize_t n = min(nleft, nright)
+        ndarray[float64_t] result = np.empty(n, dtype=np.float64)
+        ndarray[int32_t] lindexer = np.empty(n, dtype=np.int32)
+        ndarray[int32_t] rindexer = np.empty(n, dtype=np.int32)
+        float64_t lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            i += 1
+            j += 1
+            k += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:k], lindexer[:k], rindexer[:k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def outer_join_indexer_float64(ndarray[float64_t] left, ndarray[float64_t] right):
+    '''
+    Merge two sorted arrays of unique values into their union, with the
+    locations of each result value in left and in right (-1 if absent)
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        Py_ssize_t n = nleft + nright
+        ndarray[float64_t] result = np.empty(n, dtype=np.float64)
+        ndarray[int32_t] lindexer = np.empty(n, dtype=np.int32)
+        ndarray[int32_t] rindexer = np.empty(n, dtype=np.int32)
+        float64_t lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            i += 1
+            j += 1
+        elif lval < rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = -1
+            i += 1
+        else:
+            result[k] = rval
+            lindexer[k] = -1
+            rindexer[k] = j
+            j += 1
+        k += 1
+
+    while i < nleft:
+        result[k] = left[i]
+        lindexer[k] = i
+        rindexer[k] = -1
+        i += 1
+        k += 1
+
+    while j < nright:
+        result[k] = right[j]
+        lindexer[k] = -1
+        rindexer[k] = j
+        j += 1
+        k += 1
+
+    return result[:k], lindexer[:k], rindexer[:k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def left_join_indexer_object(ndarray[object] left, ndarray[object] right):
+    '''
+    Merge two sorted arrays of unique values: location in right of each left
+    value, -1 if it is not there
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, nleft = len(left), nright = len(right)
+        ndarray[int32_t] indexer = np.empty(nleft, dtype=np.int32)
+        object lval
+
+    for i from 0 <= i < nleft:
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            indexer[i] = j
+        else:
+            indexer[i] = -1
+
+    return indexer
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def inner_join_indexer_object(ndarray[object] left, ndarray[object] right):
+    '''
+    Merge two sorted arrays of unique values into their intersection, with
+    the locations of each result value in left and in right
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        Py_ssize_t n = min(nleft, nright)
+        ndarray[object] result = np.empty(n, dtype=object)
+        ndarray[int32_t] lindexer = np.empty(n, dtype=np.int32)
+        ndarray[int32_t] rindexer = np.empty(n, dtype=np.int32)
+        object lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            i += 1
+            j += 1
+            k += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result[:k], lindexer[:k], rindexer[:k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def outer_join_indexer_object(ndarray[object] left, ndarray[object] right):
+    '''
+    Merge two sorted arrays of unique values into their union, with the
+    locations of each result value in left and in right (-1 if absent)
+    '''
+    cdef:
+        Py_ssize_t i = 0, j = 0, k = 0, nleft = len(left), nright = len(right)
+        Py_ssize_t n = nleft + nright
+        ndarray[object] result = np.empty(n, dtype=object)
+        ndarray[int32_t] lindexer = np.empty(n, dtype=np.int32)
+        ndarray[int32_t] rindexer = np.empty(n, dtype=np.int32)
+        object lval, rval
+
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            i += 1
+            j += 1
+        elif lval < rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = -1
+            i += 1
+        else:
+            result[k] = rval
+            lindexer[k] = -1
+            rindexer[k] = j
+            j += 1
+        k += 1
+
+    while i < nleft:
+        result[k] = left[i]
+        lindexer[k] = i
+        rindexer[k] = -1
+        i += 1
+        k += 1
+
+    while j < nright:
+        result[k] = right[j]
+        lindexer[k] = -1
+        rindexer[k] = j
+        j += 1
+        k += 1
+
+    return result[:k], lindexer[:k], rindexer[:k]
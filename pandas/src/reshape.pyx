@@ -0,0 +1,62 @@
+#-------------------------------------------------------------------------------
+# Reshaping long data: each row goes to a (row, column) cell of the result,
+# for every value column. With width columns per value column, values[i, j]
+# lands in out[row[i], j * width + col[i]]. Rows labeled -1 are skipped and a
+# cell hit twice keeps the last value
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def unstack_float64(ndarray[float64_t, ndim=2] values,
+                    ndarray[int32_t] row, ndarray[int32_t] col,
+                    ndarray[float64_t, ndim=2] out, Py_ssize_t width):
+    cdef:
+        Py_ssize_t i, j, r, c, N, K
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        r = row[i]
+        c = col[i]
+        if r < 0 or c < 0:
+            continue
+
+        for j from 0 <= j < K:
+            out[r, j * width + c] = values[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def unstack_int64(ndarray[int64_t, ndim=2] values,
+                  ndarray[int32_t] row, ndarray[int32_t] col,
+                  ndarray[int64_t, ndim=2] out, Py_ssize_t width):
+    cdef:
+        Py_ssize_t i, j, r, c, N, K
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        r = row[i]
+        c = col[i]
+        if r < 0 or c < 0:
+            continue
+
+        for j from 0 <= j < K:
+            out[r, j * width + c] = values[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def unstack_object(ndarray[object, ndim=2] values,
+                   ndarray[int32_t] row, ndarray[int32_t] col,
+                   ndarray[object, ndim=2] out, Py_ssize_t width):
+    cdef:
+        Py_ssize_t i, j, r, c, N, K
+
+    N, K = (<object> values).shape
+
+    for i from 0 <= i < N:
+        r = row[i]
+        c = col[i]
+        if r < 0 or c < 0:
+            continue
+
+        for j from 0 <= j < K:
+            out[r, j * width + c] = values[i, j]
@@ -150,3 +150,194 @@ cdef class IndexableSkiplist:
             tmpnode.width[level] -= 1
 
         self.size -= 1
+
+#-------------------------------------------------------------------------------
+# C version of the indexable skiplist for the moving order statistics, no
+# Python objects or calls to random() per insert. Removed nodes are kept on
+# free lists by height and reused by later inserts
+
+from libc.stdlib cimport malloc, free
+
+ctypedef struct skipnode_t:
+    double value
+    int levels
+    skipnode_t **next
+    int *width
+
+ctypedef struct skiplist_t:
+    skipnode_t *head
+    skipnode_t **chain
+    int *steps_at_level
+    skipnode_t **free_nodes
+    int size, maxlevels
+    unsigned int seed
+
+cdef skipnode_t *_skipnode_new(double value, int levels):
+    cdef skipnode_t *node
+
+    # links and widths live in the same block as the node
+    node = <skipnode_t*> malloc(sizeof(skipnode_t) +
+                                levels * (sizeof(skipnode_t*) + sizeof(int)))
+    if node == NULL:
+        raise MemoryError()
+
+    node.value = value
+    node.levels = levels
+    node.next = <skipnode_t**> (node + 1)
+    node.width = <int*> (node.next + levels)
+    return node
+
+cdef skiplist_t *skiplist_init(int expected_size) except NULL:
+    cdef:
+        skiplist_t *sl
+        int level, maxlevels
+
+    maxlevels = int_max(1, <int> (1 + Log2(int_max(expected_size, 1))))
+
+    sl = <skiplist_t*> malloc(sizeof(skiplist_t))
+    if sl == NULL:
+        raise MemoryError()
+
+    sl.size = 0
+    sl.maxlevels = maxlevels
+    sl.seed = 2463534242
+    sl.chain = <skipnode_t**> malloc(maxlevels * sizeof(skipnode_t*))
+    sl.steps_at_level = <int*> malloc(maxlevels * sizeof(int))
+    sl.free_nodes = <skipnode_t**> malloc((maxlevels + 1) *
+                                          sizeof(skipnode_t*))
+    sl.head = _skipnode_new(NaN, maxlevels)
+
+    for level from 0 <= level < maxlevels:
+        sl.head.next[level] = NULL
+        sl.head.width[level] = 1
+
+    for level from 0 <= level <= maxlevels:
+        sl.free_nodes[level] = NULL
+
+    return sl
+
+cdef void skiplist_destroy(skiplist_t *sl):
+    cdef:
+        skipnode_t *node
+        skipnode_t *tmp
+        int level
+
+    node = sl.head
+    while node != NULL:
+        tmp = node.next[0]
+        free(node)
+        node = tmp
+
+    for level from 0 <= level <= sl.maxlevels:
+        node = sl.free_nodes[level]
+        while node != NULL:
+            tmp = node.next[0]
+            free(node)
+            node = tmp
+
+    free(sl.chain)
+    free(sl.steps_at_level)
+    free(sl.free_nodes)
+    free(sl)
+
+cdef inline int _skiplist_height(skiplist_t *sl):
+    # geometric with p = 1/2 like 1 - log2(random()), from an xorshift
+    cdef:
+        unsigned int x = sl.seed
+        int d = 1
+
+    x ^= x << 13
+    x ^= x >> 17
+    x ^= x << 5
+    sl.seed = x
+
+    while d < sl.maxlevels and x & 1:
+        x >>= 1
+        d += 1
+
+    return d
+
+cdef inline double skiplist_get(skiplist_t *sl, int i):
+    cdef:
+        int level
+        skipnode_t *node = sl.head
+
+    i += 1
+    for level from sl.maxlevels > level >= 0:
+        while node.width[level] <= i:
+            i -= node.width[level]
+            node = node.next[level]
+
+    return node.value
+
+cdef int skiplist_insert(skiplist_t *sl, double value) except -1:
+    cdef:
+        int level, steps, d
+        skipnode_t *node = sl.head
+        skipnode_t *prevnode
+        skipnode_t *newnode
+
+    # find first node on each level where node.next[levels].value > value
+    for level from sl.maxlevels > level >= 0:
+        sl.steps_at_level[level] = 0
+        while node.next[level] != NULL and node.next[level].value <= value:
+            sl.steps_at_level[level] += node.width[level]
+            node = node.next[level]
+        sl.chain[level] = node
+
+    d = _skiplist_height(sl)
+    newnode = sl.free_nodes[d]
+    if newnode != NULL:
+        sl.free_nodes[d] = newnode.next[0]
+        newnode.value = value
+    else:
+        newnode = _skipnode_new(value, d)
+
+    # insert a link to the newnode at each level
+    steps = 0
+    for level from 0 <= level < d:
+        prevnode = sl.chain[level]
+        newnode.next[level] = prevnode.next[level]
+        prevnode.next[level] = newnode
+        newnode.width[level] = prevnode.width[level] - steps
+        prevnode.width[level] = steps + 1
+        steps += sl.steps_at_level[level]
+
+    for level from d <= level < sl.maxlevels:
+        sl.chain[level].width[level] += 1
+
+    sl.size += 1
+    return 0
+
+cdef int skiplist_remove(skiplist_t *sl, double value) except -1:
+    cdef:
+        int level, d
+        skipnode_t *node = sl.head
+        skipnode_t *prevnode
+        skipnode_t *tmpnode
+
+    # find first node on each level where node.next[levels].value >= value
+    for level from sl.maxlevels > level >= 0:
+        while node.next[level] != NULL and node.next[level].value < value:
+            node = node.next[level]
+        sl.chain[level] = node
+
+    tmpnode = sl.chain[0].next[0]
+    if tmpnode == NULL or tmpnode.value != value:
+        raise KeyError('Not Found')
+
+    # remove one link at each level
+    d = tmpnode.levels
+    for level from 0 <= level < d:
+        prevnode = sl.chain[level]
+        prevnode.width[level] += tmpnode.width[level] - 1
+        prevnode.next[level] = tmpnode.next[level]
+
+    for level from d <= level < sl.maxlevels:
+        sl.chain[level].width[level] -= 1
+
+    tmpnode.next[0] = sl.free_nodes[d]
+    sl.free_nodes[d] = tmpnode
+
+    sl.size -= 1
+    return 0
@@ -4,4 +4,8 @@ include "isnull.pyx"
 include "groupby.pyx"
 include "moments.pyx"
 include "reindex.pyx"
+include "hashtable.pyx"
+include "join.pyx"
+include "reshape.pyx"
 include "io.pyx"
+include "parser.pyx"
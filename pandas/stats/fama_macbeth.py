@@ -6,6 +6,10 @@ from pandas.core.api import Series, DataFrame
 import pandas.stats.common as common
 from pandas.util.decorators import cache_readonly
 
+# below this fraction of the mean squared deviation from the overall mean, the
+# variance of a block of betas is computed from the block
+_VAR_RTOL = 1e-3
+
 def fama_macbeth(**kwargs):
     """Runs Fama-MacBeth regression.
 
@@ -163,30 +167,29 @@ class MovingFamaMacBeth(FamaMacBeth):
         return self._window_type == common.ROLLING
 
     def _calc_stats(self):
-        mean_betas = []
-        std_betas = []
-        t_stats = []
-
         # XXX
 
         mask = self._ols_result._rolling_ols_call[2]
         obs_total = mask.astype(int).cumsum()
 
         start = self._window - 1
-        betas = self._beta_raw
-        for i in xrange(start, self._T):
-            if self._is_rolling:
-                begin = i - start
-            else:
-                begin = 0
+        ends = np.arange(start, self._T)
+        if self._is_rolling:
+            begins = ends - start
+        else:
+            begins = np.zeros(len(ends), dtype=int)
 
-            B = betas[max(obs_total[begin] - 1, 0) : obs_total[i]]
-            mean_beta, std_beta, t_stat = _calc_t_stat(B, self._nw_lags_beta)
-            mean_betas.append(mean_beta)
-            std_betas.append(std_beta)
-            t_stats.append(t_stat)
+        # the betas of each window are betas[lo : hi]
+        lo = np.maximum(obs_total[begins] - 1, 0)
+        hi = obs_total[ends]
 
-        return np.array([mean_betas, std_betas, t_stats])
+        betas = self._beta_raw
+        if self._nw_lags_beta is not None:
+            stats = [_calc_t_stat(betas[a : b], self._nw_lags_beta)
+                     for a, b in zip(lo, hi)]
+            return np.array(zip(*stats))
+
+        return _calc_t_stats(betas, lo, hi)
 
     _stats = cache_readonly(_calc_stats)
 
@@ -195,8 +198,9 @@ class MovingFamaMacBeth(FamaMacBeth):
 
     @cache_readonly
     def _result_index(self):
-        mask = self._ols_result._rolling_ols_call[1]
-        return self._index[mask]
+        # one result for each window, ending at each date from the first full
+        # window on
+        return self._index[self._window - 1:]
 
     @cache_readonly
     def _results(self):
@@ -223,3 +227,38 @@ def _calc_t_stat(beta, nw_lags_beta):
     t_stat = mean_beta / std_beta
 
     return mean_beta, std_beta, t_stat
+
+def _calc_t_stats(beta, lo, hi):
+    """
+    _calc_t_stat without Newey-West adjustment of the blocks beta[lo[i]:hi[i]]
+    of the betas, from cumulative sums of the betas and their squares, taken
+    after subtracting the mean of all the betas
+    """
+    K = beta.shape[1]
+    center = beta.mean(0) if len(beta) else np.zeros(K)
+    dev = beta - center
+
+    sums = np.zeros((len(beta) + 1, K))
+    sums[1:] = dev.cumsum(0)
+    sumsq = np.zeros((len(beta) + 1, K))
+    sumsq[1:] = (dev ** 2).cumsum(0)
+
+    N = (hi - lo).astype(float)[:, np.newaxis]
+    mean_dev = (sums[hi] - sums[lo]) / N
+    meansq_dev = (sumsq[hi] - sumsq[lo]) / N
+
+    # diagonal of the covariance, as in _calc_t_stat
+    var_beta = meansq_dev - mean_dev ** 2
+
+    mean_beta = mean_dev + center
+    std_beta = np.sqrt(np.maximum(var_beta, 0)) / np.sqrt(N)
+    t_stat = mean_beta / std_beta
+
+    # when the betas of a block are far from the overall mean compared to
+    # their spread, the variance is a small difference of large terms
+    inexact = (var_beta < _VAR_RTOL * meansq_dev).any(1).nonzero()[0]
+    for i in inexact:
+        block = _calc_t_stat(beta[lo[i] : hi[i]], None)
+        mean_beta[i], std_beta[i], t_stat[i] = block
+
+    return np.array([mean_beta, std_beta, t_stat])
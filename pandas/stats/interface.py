@@ -46,6 +46,9 @@ def ols(**kwargs):
             By default, the first dummy is dropped if no dummy is specified.
         cluster: {'time', 'entity'}
             cluster variances
+        n_jobs: int
+            With pool=False, the number of processes fitting the entities'
+            regressions in parallel, -1 for one per CPU.  Defaults to 1.
 
     Returns
     -------
@@ -34,6 +34,34 @@ def inv(a):
     except linalg.LinAlgError:
         return np.linalg.pinv(a)
 
+def solve_many(a, b):
+    """
+    Returns the solutions of A[i] X = B[i] for a stack of square matrices A
+    and vectors B, solved together
+    """
+    try:
+        return linalg.solve(a, b[..., np.newaxis])[..., 0]
+    except linalg.LinAlgError:
+        return np.array([solve(x, y) for x, y in zip(a, b)])
+
+def inv_many(a):
+    """Returns the inverses of a stack of square matrices."""
+    try:
+        return linalg.inv(a)
+    except linalg.LinAlgError:
+        return np.array([inv(x) for x in a])
+
+def rank_many(xx, cond=1.0e-12):
+    """
+    Returns the ranks of matrices X from a stack of their cross-products X'X.
+
+    The eigenvalues of X'X are the squared singular values of X, so it is the
+    ratio of each eigenvalue to the largest which is compared with cond
+    """
+    eigvals = linalg.eigvalsh(xx)
+    top = eigvals.max(axis=-1)[..., np.newaxis]
+    return np.greater(eigvals, top * cond).sum(axis=-1)
+
 def is_psd(m):
     eigvals = linalg.eigvals(m)
     return np.isreal(eigvals).all() and (eigvals >= 0).all()
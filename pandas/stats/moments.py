@@ -4,19 +4,26 @@ statistics implemented in Cython
 """
 from __future__ import division
 
+from datetime import timedelta
 from functools import wraps
 
 from numpy import NaN
 import numpy as np
 
-from pandas.core.api import DataFrame, Series, notnull
+from pandas.core.api import DataFrame, Series
+from pandas.core.datetools import DateOffset
+from pandas.core.index import DatetimeIndex, _timedelta_ns
 import pandas._tseries as _tseries
 
 __all__ = ['rolling_count', 'rolling_max', 'rolling_min',
            'rolling_sum', 'rolling_mean', 'rolling_std', 'rolling_cov',
            'rolling_corr', 'rolling_var', 'rolling_skew', 'rolling_kurt',
            'rolling_quantile', 'rolling_median', 'rolling_apply',
-           'ewma', 'ewmvar', 'ewmstd', 'ewmvol', 'ewmcorr', 'ewmcov']
+           'ewma', 'ewmvar', 'ewmstd', 'ewmvol', 'ewmcorr', 'ewmcov',
+           'RollingSum', 'RollingMean', 'RollingVar', 'EWMA']
+
+# streaming versions, updated with new values as they arrive
+from pandas._tseries import RollingSum, RollingMean, RollingVar, EWMA
 
 def rolling_count(arg, window, time_rule=None):
     """
@@ -25,16 +32,19 @@ def rolling_count(arg, window, time_rule=None):
     Parameters
     ----------
     arg :  DataFrame or numpy ndarray-like
-    window : Number of observations used for calculating statistic
+    window : int, DateOffset or timedelta
+        Number of observations used for calculating statistic, or length of
+        time spanned by the window
     """
     arg = _conv_timerule(arg, time_rule)
-    window = min(window, len(arg))
+    window, start = _get_window(arg, window)
+    if start is None:
+        window = min(window, len(arg))
 
     return_hook, values = _process_data_structure(arg, kill_inf=False)
 
     converted = np.isfinite(values).astype(float)
-    result = rolling_sum(converted, window, min_periods=1,
-                         time_rule=time_rule)
+    result = _tseries.roll_sum(converted, window, 1, start)
 
     # putmask here?
     result[np.isnan(result)] = 0
@@ -44,7 +54,11 @@ def rolling_count(arg, window, time_rule=None):
 def rolling_cov(arg1, arg2, window, min_periods=None, time_rule=None):
     X, Y = _prep_binary(arg1, arg2)
     mean = lambda x: rolling_mean(x, window, min_periods, time_rule)
-    bias_adj = window / (window - 1)
+    if _is_time_window(window):
+        count = rolling_count(X + Y, window, time_rule)
+        bias_adj = count / (count - 1)
+    else:
+        bias_adj = window / (window - 1)
     return (mean(X * Y) - mean(X) * mean(Y)) * bias_adj
 
 def rolling_corr(arg1, arg2, window, min_periods=None, time_rule=None):
@@ -62,7 +76,9 @@ def _rolling_moment(arg, window, func, minp, axis=0, time_rule=None):
     Parameters
     ----------
     arg :  DataFrame or numpy ndarray-like
-    window : Number of observations used for calculating statistic
+    window : int, DateOffset or timedelta
+        Number of observations used for calculating statistic, or length of
+        time spanned by the window
     func : Cython function to compute rolling statistic on raw series
     minp : int
         Minimum number of observations required to have a value
@@ -75,13 +91,62 @@ def _rolling_moment(arg, window, func, minp, axis=0, time_rule=None):
     y : type of input
     """
     arg = _conv_timerule(arg, time_rule)
-    calc = lambda x: func(x, window, minp=minp)
     return_hook, values = _process_data_structure(arg)
-    # actually calculate the moment. Faster way to do this?
-    result = np.apply_along_axis(calc, axis, values)
+
+    window, start = _get_window(arg, window)
+    if start is not None and minp is None:
+        minp = 1
+
+    # the Cython functions do all the columns of 2-d input in one go
+    if axis == 1:
+        result = func(values.T, window, minp, start).T
+    else:
+        result = func(values, window, minp, start)
 
     return return_hook(result)
 
+def _is_time_window(window):
+    return isinstance(window, (DateOffset, timedelta))
+
+def _get_window(arg, window):
+    """
+    Integer windows are returned as is. A window given as a DateOffset or
+    timedelta ends at each date of the index of arg and covers the dates
+    after that date less the offset; it is returned as the position where
+    each of these windows starts, for the Cython functions
+
+    Returns
+    -------
+    (window, start) : start is None for integer windows
+    """
+    if not _is_time_window(window):
+        return window, None
+
+    index = getattr(arg, 'index', None)
+    if index is None or not index.is_all_dates():
+        raise Exception('Windows spanning a length of time need a Series '
+                        'or DataFrame indexed by dates')
+
+    if isinstance(index, DatetimeIndex):
+        stamps = index.asi8
+    else:
+        stamps = _tseries.array_datetime_to_ns(np.asarray(index,
+                                                          dtype=object))
+
+    if len(stamps) > 1 and (np.diff(stamps) < 0).any():
+        raise Exception('Index must be sorted for windows spanning a '
+                        'length of time')
+
+    delta = getattr(window, 'delta', window)
+    if isinstance(delta, timedelta):
+        lower = stamps - _timedelta_ns(delta)
+    else:
+        bounds = [d - window for d in index]
+        lower = _tseries.array_datetime_to_ns(np.asarray(bounds,
+                                                         dtype=object))
+
+    return 0, _tseries.window_starts(stamps, lower)
+
 def _process_data_structure(arg, kill_inf=True):
     if isinstance(arg, DataFrame):
         return_hook = lambda v: type(arg)(v, index=arg.index,
@@ -124,20 +189,10 @@ def ewma(arg, com=None, span=None, min_periods=0, time_rule=None):
     com = _get_center_of_mass(com, span)
     arg = _conv_timerule(arg, time_rule)
 
-    def _ewma(v):
-        result = _tseries.ewma(v, com)
-        first_index = _first_valid_index(v)
-        result[first_index : first_index + min_periods] = NaN
-        return result
-
     return_hook, values = _process_data_structure(arg)
-    output = np.apply_along_axis(_ewma, 0, values)
+    output = _tseries.ewma(values, com, int(min_periods))
     return return_hook(output)
 
-def _first_valid_index(arr):
-    # argmax scans from left
-    return notnull(arr).argmax()
-
 def ewmvar(arg, com=None, span=None, min_periods=0, bias=False,
            time_rule=None):
     com = _get_center_of_mass(com, span)
@@ -206,9 +261,13 @@ _doc_template = """
 Parameters
 ----------
 %s
-window : Number of observations used for calculating statistic
+window : int, DateOffset or timedelta
+    Number of observations used for calculating statistic, or length of time
+    spanned by the window, e.g. datetools.Minute(5) (for Series / DataFrame
+    indexed by dates, without resampling them)
 min_periods : int
-    Minimum number of observations in window required to have a value
+    Minimum number of observations in window required to have a value,
+    defaults to window (or 1 for windows spanning a length of time)
 time_rule : {None, 'WEEKDAY', 'EOM', 'W@MON', ...}, default=None
     Name of time rule to conform to before computing statistic
 
@@ -301,9 +360,9 @@ def _use_window(minp, window):
 def _rolling_func(func, desc, check_minp=_use_window):
     @wraps(func)
     def f(arg, window, min_periods=None, time_rule=None):
-        def call_cython(arg, window, minp):
+        def call_cython(arg, window, minp, start):
             minp = check_minp(minp, window)
-            return func(arg, window, minp)
+            return func(arg, window, minp, start=start)
         return _rolling_moment(arg, window, call_cython, min_periods,
                                time_rule=time_rule)
 
@@ -333,7 +392,9 @@ def rolling_quantile(arg, window, quantile, min_periods=None, time_rule=None):
     Parameters
     ----------
     arg : Series, DataFrame
-    window : Number of observations used for calculating statistic
+    window : int, DateOffset or timedelta
+        Number of observations used for calculating statistic, or length of
+        time spanned by the window
     quantile : 0 <= quantile <= 1
     min_periods : int
         Minimum number of observations in window required to have a value
@@ -345,9 +406,9 @@ def rolling_quantile(arg, window, quantile, min_periods=None, time_rule=None):
     y : type of input argument
     """
 
-    def call_cython(arg, window, minp):
+    def call_cython(arg, window, minp, start):
         minp = _use_window(minp, window)
-        return _tseries.roll_quantile(arg, window, minp, quantile)
+        return _tseries.roll_quantile(arg, window, minp, quantile, start)
     return _rolling_moment(arg, window, call_cython, min_periods,
                            time_rule=time_rule)
 
@@ -357,7 +418,9 @@ def rolling_apply(arg, window, func, min_periods=None, time_rule=None):
     Parameters
     ----------
     arg : Series, DataFrame
-    window : Number of observations used for calculating statistic
+    window : int, DateOffset or timedelta
+        Number of observations used for calculating statistic, or length of
+        time spanned by the window
     func : function
         Must produce a single value from an ndarray input
     min_periods : int
@@ -369,9 +432,9 @@ def rolling_apply(arg, window, func, min_periods=None, time_rule=None):
     -------
     y : type of input argument
     """
-    def call_cython(arg, window, minp):
+    def call_cython(arg, window, minp, start):
         minp = _use_window(minp, window)
-        return _tseries.roll_generic(arg, window, minp, func)
+        return _tseries.roll_generic(arg, window, minp, func, start)
     return _rolling_moment(arg, window, call_cython, min_periods,
                            time_rule=time_rule)
 
@@ -15,9 +15,14 @@ from pandas.util.decorators import cache_readonly
 import pandas.stats.common as common
 import pandas.stats.math as math
 import pandas.stats.moments as moments
+import pandas._tseries as _tseries
 
 _FP_ERR = 1e-13
 
+# below this fraction of the total sum of squares, the sum of squared
+# residuals of a moving regression is computed from the residuals
+_SSE_RTOL = 1e-3
+
 class OLS(object):
     """
     Runs a full sample ordinary least squares regression
@@ -688,25 +693,17 @@ class MovingOLS(OLS):
         betas = np.empty((N, K), dtype=float)
         betas[:] = np.NaN
 
-        valid = self._time_has_obs
-        enough = self._enough_obs
-        window = self._window
+        todo = self._time_has_obs & self._enough_obs
 
         # Use transformed (demeaned) Y, X variables
-        cum_xx = self._cum_xx(x)
-        cum_xy = self._cum_xy(x, y)
-
-        for i in xrange(N):
-            if not valid[i] or not enough[i]:
-                continue
-
-            xx = cum_xx[i]
-            xy = cum_xy[i]
-            if self._is_rolling and i >= window:
-                xx = xx - cum_xx[i - window]
-                xy = xy - cum_xy[i - window]
+        if x is self._x and y is self._y:
+            moments = self._window_moments
+        else:
+            moments = self._calc_moments(x, y)
 
-            betas[i] = math.solve(xx, xy)
+        if todo.any():
+            betas[todo] = math.solve_many(moments['xx'][todo],
+                                          moments['xy'][todo])
 
         mask = -np.isnan(betas).any(axis=1)
         have_betas = np.arange(N)[mask]
@@ -714,85 +711,107 @@ class MovingOLS(OLS):
         return betas, have_betas, mask
 
     def _rolling_rank(self):
-        dates = self._index
-        window = self._window
+        moments = self._window_moments
 
-        ranks = np.empty(len(dates), dtype=float)
+        ranks = np.empty(len(self._index), dtype=float)
         ranks[:] = np.NaN
-        for i, date in enumerate(dates):
-            if self._is_rolling and i >= window:
-                prior_date = dates[i - window + 1]
-            else:
-                prior_date = dates[0]
 
-            x_slice = self._x.truncate(before=prior_date, after=date).values
+        have_obs = moments['count'] > 0
+        if have_obs.any():
+            ranks[have_obs] = math.rank_many(moments['xx'][have_obs])
 
-            if len(x_slice) == 0:
-                continue
+        return ranks
 
-            ranks[i] = math.rank(x_slice)
+    @cache_readonly
+    def _window_moments(self):
+        return self._calc_moments(self._x, self._y)
 
-        return ranks
+    def _calc_moments(self, x, y):
+        """
+        Sums of the cross-products needed by the regression over the window
+        ending at each date: X'X (xx), X'y (xy), y'y (yy), the sums of x (sumx)
+        and y (sumy), and the number of observations (count). Also the
+        cross-products of x and y centered on their means over the window
+        (cxx, cxy, cyy) and these means (meanx, meany).
+
+        The cross-products of each observation are added up by date, and their
+        sums over the windows are differences of cumulative sums of these. The
+        centered cross-products are computed from the same sums taken after
+        subtracting the means of x and y over all the data, which keeps them
+        small (and their differences accurate) when y or x have a large level
+        """
+        xv = np.asarray(x.values, dtype=float)
+        yv = _y_converter(y).astype(float)
 
-    def _cum_xx(self, x):
-        dates = self._index
-        K = len(x.columns)
-        valid = self._time_has_obs
-        cum_xx = []
-
-        slicer = lambda df, dt: df.truncate(dt, dt).values
-        if isinstance(x, DataFrame) and not isinstance(x, LongPanel):
-            _get_index = x.index.get_loc
-            def slicer(df, dt):
-                i = _get_index(dt)
-                return df.values[i:i+1, :]
-
-        last = np.zeros((K, K))
-        for i, date in enumerate(dates):
-            if not valid[i]:
-                cum_xx.append(last)
-                continue
-
-            x_slice = slicer(x, date)
-            xx = last = last + np.dot(x_slice.T, x_slice)
-            cum_xx.append(xx)
-
-        return cum_xx
-
-    def _cum_xy(self, x, y):
-        dates = self._index
-        valid = self._time_has_obs
-        cum_xy = []
-
-        x_slicer = lambda df, dt: df.truncate(dt, dt).values
-        if isinstance(x, DataFrame) and not isinstance(x, LongPanel):
-            _get_index = x.index.get_loc
-            def x_slicer(df, dt):
-                i = _get_index(dt)
-                return df.values[i:i+1]
-
-        if isinstance(y, Series):
-            _y_get_index = y.index.get_loc
-            _values = y.values
-            def y_slicer(df, dt):
-                i = _y_get_index(dt)
-                return _values[i:i+1]
+        n, K = xv.shape
+        if n:
+            shift_x = xv.mean(0)
+            shift_y = yv.mean()
         else:
-            y_slicer = lambda s, dt: _y_converter(s.truncate(dt, dt))
+            shift_x = np.zeros(K)
+            shift_y = 0.
+
+        rows = np.column_stack((_cross_products(xv, yv),
+                                _cross_products(xv - shift_x, yv - shift_y)))
+        sums = self._window_sums(rows, self._date_labels(x))
 
-        last = np.zeros(len(x.columns))
-        for i, date in enumerate(dates):
-            if not valid[i]:
-                cum_xy.append(last)
-                continue
+        names = ['xx', 'xy', 'sumx', 'yy', 'sumy', 'count']
 
-            x_slice = x_slicer(x, date)
-            y_slice = y_slicer(y, date)
+        # the unshifted sums keep stretches of exact zeros exact
+        width = rows.shape[1] // 2
+        result = dict(zip(names, _split_sums(sums[:, :width], K)))
+        xx, xy, sumx, yy, sumy, _ = _split_sums(sums[:, width:], K)
 
-            xy = last = last + np.dot(x_slice.T, y_slice)
-            cum_xy.append(xy)
+        # means over the window of the shifted values
+        count = result['count']
+        nobs = np.maximum(count, 1)
+        mx = sumx / nobs[:, np.newaxis]
+        my = sumy / nobs
 
-        return cum_xy
+        result['cxx'] = xx - (mx[:, :, np.newaxis] * mx[:, np.newaxis, :] *
+                              count[:, np.newaxis, np.newaxis])
+        result['cxy'] = xy - mx * (my * count)[:, np.newaxis]
+        result['cyy'] = yy - count * my ** 2
+        result['meanx'] = mx + shift_x
+        result['meany'] = my + shift_y
+
+        return result
+
+    def _window_sums(self, values, labels):
+        """
+        Add up the rows of values (one per observation) by date, then over the
+        window ending at each date
+        """
+        N = len(self._index)
+        values = np.ascontiguousarray(values, dtype=float)
+
+        by_date = np.empty((N, values.shape[1]), dtype=float)
+        counts = np.zeros(N, dtype=np.int32)
+        _tseries.group_add(by_date, counts, values, labels.astype(np.int32))
+
+        # dates without observations add nothing
+        by_date[counts == 0] = 0
+
+        sums = by_date.cumsum(axis=0)
+
+        # drop the dates which left the window. Differencing the cumulative
+        # sums keeps stretches of exact zeros (e.g. an all-zero dummy) exact
+        if self._is_rolling:
+            window = self._window
+            sums[window:] = sums[window:] - sums[:-window]
+
+        return sums
+
+    def _date_labels(self, data):
+        """
+        Position in the date index of each observation
+        """
+        if isinstance(data, LongPanel):
+            labels, _ = self._index.get_indexer(data.major_axis)
+            return labels.take(data.major_labels)
+
+        labels, _ = self._index.get_indexer(data.index)
+        return labels
 
     @cache_readonly
     def _rank_raw(self):
@@ -873,42 +892,63 @@ class MovingOLS(OLS):
 
     @cache_readonly
     def _resid_stats(self):
-        uncentered_sst = []
-        sst = []
-        sse = []
+        moments = self._window_moments
+        indices = self._valid_indices
 
-        Y = self._y
-        X = self._x
+        beta = self._beta_raw
+        cxx = moments['cxx'][indices]
+        cxy = moments['cxy'][indices]
+        cyy = moments['cyy'][indices]
+        count = moments['count'][indices]
+
+        # sum of (y - X b)^2 expanded in the cross-products centered on the
+        # window means, plus the squared mean residual for each observation
+        mean_resid = (moments['meany'][indices] -
+                      (moments['meanx'][indices] * beta).sum(1))
+        sse = (cyy - 2 * (beta * cxy).sum(1) +
+               (beta * (cxx * beta[:, np.newaxis, :]).sum(2)).sum(1) +
+               count * mean_resid ** 2)
+
+        # when the fit is close to exact, sse is a small difference of large
+        # terms, sum the squared residuals of these windows instead
+        inexact = (sse < _SSE_RTOL * cyy).nonzero()[0]
+        if len(inexact):
+            sse[inexact] = self._window_sse(inexact)
 
-        dates = self._index
-        window = self._window
-        for n, index in enumerate(self._valid_indices):
-            if self._is_rolling and index >= window:
-                prior_date = dates[index - window + 1]
-            else:
-                prior_date = dates[0]
+        return {
+            'sse' : np.maximum(sse, 0),
+            'centered_tss' : cyy,
+            'uncentered_tss' : moments['yy'][indices],
+        }
 
-            date = dates[index]
-            beta = self._beta_raw[n]
+    def _window_sse(self, positions):
+        """
+        Sum of the squared residuals of the windows at the given positions in
+        _valid_indices, from the data of each window
+        """
+        xv = np.asarray(self._x.values, dtype=float)
+        yv = _y_converter(self._y).astype(float)
 
-            X_slice = X.truncate(before=prior_date, after=date).values
-            Y_slice = _y_converter(Y.truncate(before=prior_date, after=date))
+        labels = self._date_labels(self._x)
+        order = labels.argsort(kind='mergesort')
+        labels = labels[order]
 
-            resid = Y_slice - np.dot(X_slice, beta)
+        ends = self._valid_indices[positions]
+        if self._is_rolling:
+            starts = ends - self._window + 1
+        else:
+            starts = np.zeros(len(ends), dtype=int)
 
-            SS_err = (resid ** 2).sum()
-            SS_total = ((Y_slice - Y_slice.mean()) ** 2).sum()
-            SST_uncentered = (Y_slice ** 2).sum()
+        lo = labels.searchsorted(starts)
+        hi = labels.searchsorted(ends, side='right')
 
-            sse.append(SS_err)
-            sst.append(SS_total)
-            uncentered_sst.append(SST_uncentered)
+        result = np.empty(len(positions))
+        for i, n in enumerate(positions):
+            rows = order[lo[i] : hi[i]]
+            resid = yv[rows] - np.dot(xv[rows], self._beta_raw[n])
+            result[i] = (resid ** 2).sum()
 
-        return {
-            'sse' : np.array(sse),
-            'centered_tss' : np.array(sst),
-            'uncentered_tss' : np.array(uncentered_sst),
-        }
+        return result
 
     @cache_readonly
     def _rmse_raw(self):
@@ -953,23 +993,26 @@ class MovingOLS(OLS):
     @cache_readonly
     def _var_beta_raw(self):
         """Returns the raw covariance of beta."""
+        indices = self._valid_indices
+        xx = self._window_moments['xx'][indices]
+
+        if self._nw_lags is None:
+            rmse = self._rmse_raw
+            return math.inv_many(xx) * (rmse ** 2)[:, np.newaxis, np.newaxis]
+
         x = self._x
         y = self._y
         dates = self._index
         nobs = self._nobs
-        rmse = self._rmse_raw
         beta = self._beta_raw
         df = self._df_raw
         window = self._window
-        cum_xx = self._cum_xx(self._x)
 
         results = []
-        for n, i in enumerate(self._valid_indices):
-            xx = cum_xx[i]
+        for n, i in enumerate(indices):
             date = dates[i]
 
             if self._is_rolling and i >= window:
-                xx = xx - cum_xx[i - window]
                 prior_date = dates[i - window + 1]
             else:
                 prior_date = dates[0]
@@ -979,70 +1022,35 @@ class MovingOLS(OLS):
             xv = x_slice.values
             yv = np.asarray(y_slice)
 
-            if self._nw_lags is None:
-                result = math.inv(xx) * (rmse[n] ** 2)
-            else:
-                resid = yv - np.dot(xv, beta[n])
-                m = (xv.T * resid).T
-
-                xeps = math.newey_west(m, self._nw_lags, nobs[n], df[n],
-                                       self._nw_overlap)
+            resid = yv - np.dot(xv, beta[n])
+            m = (xv.T * resid).T
 
-                xx_inv = math.inv(xx)
-                result = np.dot(xx_inv, np.dot(xeps, xx_inv))
+            xeps = math.newey_west(m, self._nw_lags, nobs[n], df[n],
+                                   self._nw_overlap)
 
-            results.append(result)
+            xx_inv = math.inv(xx[n])
+            results.append(np.dot(xx_inv, np.dot(xeps, xx_inv)))
 
         return np.array(results)
 
     @cache_readonly
     def _forecast_mean_raw(self):
         """Returns the raw covariance of beta."""
-        nobs = self._nobs
-        window = self._window
-
-        # x should be ones
-        dummy = DataFrame(index=self._y.index)
-        dummy['y'] = 1
-
-        cum_xy = self._cum_xy(dummy, self._y)
-
-        results = []
-        for n, i in enumerate(self._valid_indices):
-            sumy = cum_xy[i]
-
-            if self._is_rolling and i >= window:
-                sumy = sumy - cum_xy[i - window]
-
-            results.append(sumy[0] / nobs[n])
-
-        return np.array(results)
+        sumy = self._window_moments['sumy'][self._valid_indices]
+        return sumy / self._nobs
 
     @cache_readonly
     def _forecast_vol_raw(self):
         """Returns the raw covariance of beta."""
-        beta = self._beta_raw
-        window = self._window
-        dates = self._index
-        x = self._x
+        moments = self._window_moments
+        indices = self._valid_indices
 
-        results = []
-        for n, i in enumerate(self._valid_indices):
-            date = dates[i]
-            if self._is_rolling and i >= window:
-                prior_date = dates[i - window + 1]
-            else:
-                prior_date = dates[0]
-
-            x_slice = x.truncate(prior_date, date).values
-            x_demeaned = x_slice - x_slice.mean(0)
-            x_cov = np.dot(x_demeaned.T, x_demeaned) / (len(x_slice) - 1)
+        beta = self._beta_raw
+        count = moments['count'][indices][:, np.newaxis, np.newaxis]
+        x_cov = moments['cxx'][indices] / (count - 1)
 
-            B = beta[n]
-            result = np.dot(B, np.dot(x_cov, B))
-            results.append(np.sqrt(result))
-
-        return np.array(results)
+        result = (beta * (x_cov * beta[:, np.newaxis, :]).sum(2)).sum(1)
+        return np.sqrt(result)
 
     @cache_readonly
     def _y_fitted_raw(self):
@@ -1132,6 +1140,27 @@ def _safe_update(d, other):
 
         d[k] = v
 
+def _cross_products(xv, yv):
+    """
+    Rows of the cross-products of x and y of each observation: x x', x y, x,
+    y^2, y and 1
+    """
+    n, K = xv.shape
+    cross = (xv[:, :, np.newaxis] * xv[:, np.newaxis, :]).reshape((n, K * K))
+    return np.column_stack((cross, xv * yv[:, np.newaxis], xv, yv * yv, yv,
+                            np.ones(n)))
+
+def _split_sums(sums, K):
+    """
+    xx, xy, sumx, yy, sumy and count from sums of the rows of _cross_products
+    """
+    N = len(sums)
+    xx = sums[:, :K * K].reshape((N, K, K))
+    xy = sums[:, K * K : K * K + K]
+    sumx = sums[:, K * K + K : K * K + 2 * K]
+    yy, sumy, count = sums[:, K * K + 2 * K:].T
+    return xx, xy, sumx, yy, sumy, count
+
 def _combine_rhs(rhs):
     """
     Glue input X variables together while checking for potential
@@ -700,10 +700,11 @@ class MovingPanelOLS(MovingOLS, PanelOLS):
         beta = self._beta_raw
         df = self._df_raw
         window = self._window
+        window_xx = self._window_xx
 
-        if not self._time_effects:
-            # Non-transformed X
-            cum_xx = self._cum_xx(x)
+        if cluster_axis is None and self._nw_lags is None:
+            xx = window_xx[self._valid_indices]
+            return math.inv_many(xx) * (rmse ** 2)[:, np.newaxis, np.newaxis]
 
         results = []
         for n, i in enumerate(self._valid_indices):
@@ -717,21 +718,40 @@ class MovingPanelOLS(MovingOLS, PanelOLS):
             x_slice = x.truncate(prior_date, date)
             y_slice = y.truncate(prior_date, date)
 
-            if self._time_effects:
-                xx = _xx_time_effects(x_slice, y_slice)
-            else:
-                xx = cum_xx[i]
-                if self._is_rolling and i >= window:
-                    xx = xx - cum_xx[i - window]
-
-            result = _var_beta_panel(y_slice, x_slice, beta[n], xx, rmse[n],
-                                    cluster_axis, self._nw_lags,
-                                    nobs[n], df[n], self._nw_overlap)
+            result = _var_beta_panel(y_slice, x_slice, beta[n], window_xx[i],
+                                     rmse[n], cluster_axis, self._nw_lags,
+                                     nobs[n], df[n], self._nw_overlap)
 
             results.append(result)
 
         return np.array(results)
 
+    @cache_readonly
+    def _window_xx(self):
+        """
+        Non-transformed X'X over the window ending at each date, less
+        (X'T) (T'T)^-1 (T'X) with time effects, T being the time dummies
+        """
+        xx = self._window_moments['xx']
+
+        if not self._time_effects:
+            return xx
+
+        N, K = len(self._index), len(self._x.items)
+
+        # each date contributes (x_t' 1) (1' x_t) / n_t
+        xt = self._x.sum('minor').values
+        count = self._y.count(level=0)['__y__'].values
+
+        selector = count > 0
+        xt = xt[selector] / np.sqrt(count[selector])[:, np.newaxis]
+        by_date = np.zeros((N, K * K))
+        by_date[selector] = (xt[:, :, np.newaxis] *
+                             xt[:, np.newaxis, :]).reshape((len(xt), -1))
+
+        effects = self._window_sums(by_date, np.arange(N))
+        return xx - effects.reshape((N, K, K))
+
     @cache_readonly
     def _resid_raw(self):
         beta_matrix = self._beta_matrix(lag=0)
@@ -808,6 +828,10 @@ class NonPooledPanelOLS(object):
         FULL_SAMPLE, ROLLING, EXPANDING.  FULL_SAMPLE by default.
     window : int
         size of window (for rolling/expanding OLS)
+    n_jobs : int, default 1
+        Number of processes fitting the entities' regressions in parallel, -1
+        for one per CPU. The workers also compute the statistics in
+        ATTRIBUTES up front. The results are the same as fitting serially
     """
 
     ATTRIBUTES = [
@@ -833,32 +857,72 @@ class NonPooledPanelOLS(object):
 
     def __init__(self, y, x, window_type=common.FULL_SAMPLE, window=None,
                  min_periods=None, intercept=True, nw_lags=None,
-                 nw_overlap=False):
+                 nw_overlap=False, n_jobs=1):
 
         for attr in self.ATTRIBUTES:
             setattr(self.__class__, attr, create_ols_attr(attr))
 
-        results = {}
+        kwds = dict(window_type=window_type,
+                    window=window,
+                    min_periods=min_periods,
+                    intercept=intercept,
+                    nw_lags=nw_lags,
+                    nw_overlap=nw_overlap)
+
+        entities = list(y)
+
+        if n_jobs == 1:
+            fitted = [_fit_entity(y, x, entity, kwds) for entity in entities]
+        else:
+            fitted = _fit_entities_parallel(y, x, entities, kwds, n_jobs)
+
+        self.results = dict(zip(entities, fitted))
+
+def _fit_entity(y, x, entity, kwds):
+    from pandas.stats.interface import ols
+
+    entity_x = {}
+    for x_var in x:
+        entity_x[x_var] = x[x_var][entity]
+
+    return ols(y=y[entity], x=entity_x, **kwds)
+
+# The panel data of the worker processes of _fit_entities_parallel. It is
+# passed in when each worker starts, where processes are forked it is inherited
+# from the parent rather than pickled
+_worker_data = None
+
+def _init_worker(y, x, kwds):
+    global _worker_data
+    _worker_data = y, x, kwds
+
+def _fit_entity_worker(entity):
+    y, x, kwds = _worker_data
+    result = _fit_entity(y, x, entity, kwds)
 
-        for entity in y:
-            entity_y = y[entity]
+    # the statistics are computed lazily, compute them in the worker. Any
+    # errors are raised again when the attribute is looked up in the parent
+    for attr in NonPooledPanelOLS.ATTRIBUTES:
+        try:
+            getattr(result, attr)
+        except Exception:
+            pass
 
-            entity_x = {}
-            for x_var in x:
-                entity_x[x_var] = x[x_var][entity]
+    return result
 
-            from pandas.stats.interface import ols
-            results[entity] = ols(y=entity_y,
-                                  x=entity_x,
-                                  window_type=window_type,
-                                  window=window,
-                                  min_periods=min_periods,
-                                  intercept=intercept,
-                                  nw_lags=nw_lags,
-                                  nw_overlap=nw_overlap)
+def _fit_entities_parallel(y, x, entities, kwds, n_jobs):
+    import multiprocessing
 
-        self.results = results
+    if n_jobs is None or n_jobs < 0:
+        n_jobs = multiprocessing.cpu_count()
 
+    pool = multiprocessing.Pool(n_jobs, initializer=_init_worker,
+                                initargs=(y, x, kwds))
+    try:
+        return pool.map(_fit_entity_worker, entities)
+    finally:
+        pool.terminate()
+        pool.join()
 
 def _var_beta_panel(y, x, beta, xx, rmse, cluster_axis,
                    nw_lags, nobs, df, nw_overlap):
@@ -1,9 +1,41 @@
+import numpy as np
+
 from pandas.stats.api import fama_macbeth
+from pandas.stats.fama_macbeth import _calc_t_stat, _calc_t_stats
 from common import assert_almost_equal, BaseTest
 
 class TestFamaMacBeth(BaseTest):
     def testFamaMacBethRolling(self):
         self.checkFamaMacBethExtended('rolling', self.panel_x, self.panel_y)
+        self.checkFamaMacBethExtended('expanding', self.panel_x, self.panel_y)
+        self.checkFamaMacBethExtended('rolling', self.panel_x, self.panel_y,
+                                      nw_lags_beta=2)
+
+    def testFamaMacBethResultIndex(self):
+        result = fama_macbeth(y=self.panel_y, x=self.panel_x,
+                              window_type='rolling', window=25)
+
+        index = result._index[24:]
+        self.assert_(result.mean_beta.index.equals(index))
+        self.assert_(result.t_stat.index.equals(index))
+        assert_almost_equal(result.std_beta.values, result._std_beta_raw)
+
+    def testCalcTStatsLargeMean(self):
+        # betas with a large mean and small spread, and trending betas
+        T, window = 2000, 25
+        level = 1000 + 1e-3 * np.random.randn(T, 2)
+        trend = np.arange(T)[:, np.newaxis] + 1e-3 * np.random.randn(T, 2)
+
+        hi = np.arange(window, T + 1)
+        for lo in [hi - window, np.zeros(len(hi), dtype=int)]:
+            for beta in [level, trend]:
+                result = _calc_t_stats(beta, lo, hi)
+
+                for i in xrange(len(hi)):
+                    expected = _calc_t_stat(beta[lo[i] : hi[i]], None)
+                    for j in range(3):
+                        diff = result[j][i] / expected[j] - 1
+                        self.assert_((np.abs(diff) < 1e-10).all())
 
     def checkFamaMacBethExtended(self, window_type, x, y, **kwds):
         window = 25
@@ -1,7 +1,7 @@
 import unittest
 import nose
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from numpy.random import randn
 import numpy as np
 
@@ -69,6 +69,67 @@ class TestMoments(unittest.TestCase):
 
             self._check_moment_func(f, alt)
 
+    def test_rolling_order_stats(self):
+        # ties, NaNs and windows longer than the data
+        arr = np.array([3., 1., np.NaN, 1., 5., 2., 2., np.NaN, np.NaN, 0.,
+                        4., 4.])
+
+        def naive(window, minp, f):
+            result = np.empty(len(arr))
+            for i in range(len(arr)):
+                x = arr[max(i - window + 1, 0) : i + 1]
+                x = x[np.isfinite(x)]
+                result[i] = f(x) if len(x) >= max(minp, 1) else np.NaN
+            return result
+
+        for window, minp in [(1, 1), (3, 2), (4, 1), (20, 5)]:
+            assert_almost_equal(moments.rolling_max(arr, window, minp),
+                                naive(window, minp, np.max))
+            assert_almost_equal(moments.rolling_min(arr, window, minp),
+                                naive(window, minp, np.min))
+            assert_almost_equal(moments.rolling_median(arr, window, minp),
+                                naive(window, minp, np.median))
+
+    def test_rolling_time_window(self):
+        # irregular times, windows are the last 5 minutes up to each one
+        secs = np.cumsum(np.random.randint(1, 120, size=N))
+        dates = [datetime(2011, 1, 3) + timedelta(seconds=int(x))
+                 for x in secs]
+        series = Series(self.arr, index=dates)
+
+        def naive(f, minp):
+            result = np.empty(N)
+            for i, d in enumerate(dates):
+                lower = d - timedelta(minutes=5)
+                x = np.array([v for v, t in zip(self.arr[:i + 1], dates)
+                              if t > lower])
+                x = x[np.isfinite(x)]
+                result[i] = f(x) if len(x) >= minp else np.NaN
+            return result
+
+        cases = [(moments.rolling_sum, np.sum, 1),
+                 (moments.rolling_mean, np.mean, 1),
+                 (moments.rolling_min, np.min, 1),
+                 (moments.rolling_median, np.median, 1),
+                 (moments.rolling_var, lambda x: np.var(x, ddof=1), 2)]
+
+        for func, static_comp, minp in cases:
+            for window in (datetools.Minute(5), timedelta(minutes=5)):
+                result = func(series, window)
+                self.assert_(result.index is series.index)
+                assert_almost_equal(result.values, naive(static_comp, minp))
+
+        result = moments.rolling_count(series, datetools.Minute(5))
+        assert_almost_equal(result.values, naive(len, 0))
+
+        frame = DataFrame({'A' : series, 'B' : series * 2})
+        result = moments.rolling_mean(frame, datetools.Minute(5))
+        assert_almost_equal(result['B'].values, 2 * naive(np.mean, 1))
+
+        # need dates
+        self.assertRaises(Exception, moments.rolling_mean, self.arr,
+                          datetools.Minute(5))
+
     def test_rolling_apply(self):
         def roll_mean(x, window, min_periods=None, time_rule=None):
             return moments.rolling_apply(x, window,
@@ -154,6 +215,13 @@ class TestMoments(unittest.TestCase):
         frame_result = func(self.frame, 50)
         self.assertEquals(type(frame_result), DataFrame)
 
+        # all columns at once gives the same as one at a time
+        arr2d = self.frame.values.copy()
+        arr2d[self._nan_locs, 2] = np.NaN
+        result = func(arr2d, 50)
+        for j in [0, 2, K - 1]:
+            assert_almost_equal(result[:, j], func(arr2d[:, j], 50))
+
         # check time_rule works
         if has_time_rule:
             win = 25
@@ -188,6 +256,43 @@ class TestMoments(unittest.TestCase):
     def test_ewmvol(self):
         self._check_ew(moments.ewmvol)
 
+    def test_ewma_min_periods(self):
+        arr = self.arr.copy()
+        arr[:5] = np.NaN
+        result = moments.ewma(arr, com=10, min_periods=10)
+        self.assert_(np.isnan(result[:15]).all())
+        self.assert_(not np.isnan(result[15:20]).any())
+
+        frame = DataFrame({'A' : arr, 'B' : self.arr})
+        result = moments.ewma(frame, com=10, min_periods=10)
+        self.assert_(np.isnan(result['A'][:15]).all())
+        self.assert_(np.isnan(result['B'][:10]).all())
+        self.assert_(not np.isnan(result['B'][10:20]).any())
+
+    def test_streaming(self):
+        import cPickle as pickle
+
+        def _check(acc, expected):
+            # in pieces, surviving a pickle round trip part way
+            result = [acc.update(self.arr[:5]), acc.update(self.arr[5])]
+            acc = pickle.loads(pickle.dumps(acc, 2))
+            result.append(acc.update(self.arr[6:50]))
+            acc = pickle.loads(pickle.dumps(acc))
+            result.append(acc.update(self.arr[50:]))
+            assert_almost_equal(np.concatenate(result), expected)
+
+        _check(moments.RollingSum(10), moments.rolling_sum(self.arr, 10))
+        _check(moments.RollingMean(10, min_periods=3),
+               moments.rolling_mean(self.arr, 10, min_periods=3))
+        _check(moments.RollingVar(10, min_periods=3),
+               moments.rolling_var(self.arr, 10, min_periods=3))
+        _check(moments.EWMA(com=5, min_periods=3),
+               moments.ewma(self.arr, com=5, min_periods=3))
+        _check(moments.EWMA(span=20), moments.ewma(self.arr, span=20))
+
+        self.assertRaises(Exception, moments.EWMA)
+        self.assertRaises(Exception, moments.EWMA, com=9.5, span=20)
+
     def test_ewma_span_com_args(self):
         A = moments.ewma(self.arr, com=9.5)
         B = moments.ewma(self.arr, span=20)
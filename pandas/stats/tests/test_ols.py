@@ -168,6 +168,43 @@ class TestOLS(BaseTest):
 
             assert_almost_equal(ref, res)
 
+    def test_moving_ols_zero_regressor(self):
+        # windows in which a regressor is all zeros are rank deficient
+        x = testing.makeTimeDataFrame()
+        y = x.pop('A')
+        x['B'][:12] = 0.
+
+        self.checkMovingOLS('rolling', x, y)
+        self.checkMovingOLS('expanding', x, y)
+
+    def test_moving_ols_high_r2(self):
+        # large level and nearly exact fit, sums of squares of y are huge
+        # compared to the sum of squared residuals
+        x = testing.makeTimeDataFrame().reindex(columns=['A', 'B'])
+        noise = 1e-5 * np.random.randn(len(x))
+        y = 1000 + 2 * x['A'] - 3 * x['B'] + noise
+
+        window = 10
+        for window_type in ['rolling', 'expanding']:
+            model = ols(y=y, x=x, window_type=window_type, window=window)
+
+            for n, i in enumerate(model._valid_indices):
+                if window_type == 'rolling':
+                    start = max(i - window + 1, 0)
+                else:
+                    start = 0
+
+                xs = np.column_stack((x.values[start : i + 1],
+                                      np.ones(i + 1 - start)))
+                ys = y.values[start : i + 1]
+                beta = np.linalg.lstsq(xs, ys)[0]
+                resid = ys - np.dot(xs, beta)
+                rmse = np.sqrt((resid ** 2).sum() / (len(ys) - 3))
+
+                self.assertAlmostEqual(model._rmse_raw[n] / rmse, 1, 6)
+
+            self.assert_((model._var_beta_raw[:, 0, 0] > 0).all())
+
     def test_f_test(self):
         x = testing.makeTimeDataFrame()
         y = x.pop('A')
@@ -423,6 +460,23 @@ class TestPanelOLS(BaseTest):
         self.checkNonPooled(y=self.panel_y, x=self.panel_x,
                             window_type='rolling', window=25, min_periods=10)
 
+    def testNonPooledParallel(self):
+        for kwds in [{}, dict(window_type='rolling', window=25,
+                              min_periods=10)]:
+            serial = ols(y=self.panel_y, x=self.panel_x, pool=False, **kwds)
+            parallel = ols(y=self.panel_y, x=self.panel_x, pool=False,
+                           n_jobs=2, **kwds)
+
+            self.assertEqual(sorted(serial.results),
+                             sorted(parallel.results))
+            for entity, result in serial.results.iteritems():
+                other = parallel.results[entity]
+                if isinstance(result.beta, Series):
+                    assert_series_equal(result.beta, other.beta)
+                else:
+                    assert_frame_equal(result.beta, other.beta)
+                    assert_series_equal(result.r2, other.r2)
+
     def checkNonPooled(self, x, y, **kwds):
         # For now, just check that it doesn't crash
         result = ols(y=y, x=x, pool=False, **kwds)
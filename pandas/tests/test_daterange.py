@@ -43,6 +43,30 @@ class TestDateRangeGeneration(unittest.TestCase):
                           end = datetime(2008, 1, 6)),
                      [])
 
+    def test_integer_generation(self):
+        # matches stepping with offset.apply
+        def _apply_range(start, end, offset):
+            result = []
+            cur = start
+            if offset._normalizeFirst:
+                cur = datetools.normalize_date(cur)
+            while cur <= end:
+                result.append(cur)
+                cur = offset.apply(cur)
+            return result
+
+        offsets = [datetools.bday, datetools.Hour(5), datetools.Minute(),
+                   datetools.Second(7)]
+        for offset in offsets:
+            for start, end in [(datetime(2009, 1, 3, 5),
+                                datetime(2009, 3, 1, 12)),
+                               (datetime(1969, 12, 25),
+                                datetime(1970, 1, 10))]:
+                result = list(generate_range(start, end, offset=offset))
+                start = offset.rollforward(start)
+                end = offset.rollback(end)
+                self.assertEqual(result, _apply_range(start, end, offset))
+
 class TestDateRange(unittest.TestCase):
 
     def setUp(self):
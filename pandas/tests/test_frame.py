@@ -13,7 +13,8 @@ import numpy as np
 
 import pandas.core.datetools as datetools
 from pandas.core.index import NULL_INDEX
-from pandas.core.api import (DataFrame, Index, Series, notnull, isnull)
+from pandas.core.api import (DataFrame, Index, MultiIndex, Series, notnull,
+                             isnull)
 
 from pandas.util.testing import (assert_almost_equal,
                                  assert_series_equal,
@@ -1362,6 +1363,30 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
 
         os.remove(path)
 
+    def test_toCSV_chunksize_float_format(self):
+        path = '__tmp__'
+
+        frame = self.tsframe.copy()
+        frame['A'][:3] = nan
+        frame['E'] = 'foo'
+        frame['F'] = np.arange(len(frame))
+
+        frame.toCSV(path)
+        expected = open(path).read()
+        frame.toCSV(path, chunksize=7)
+        self.assertEqual(open(path).read(), expected)
+
+        recons = DataFrame.fromcsv(path)
+        assert_frame_equal(frame, recons)
+
+        frame.toCSV(path, float_format='%.2f', nanRep='NA', chunksize=5)
+        lines = open(path).read().splitlines()
+        self.assertEqual(len(lines), len(frame) + 1)
+        self.assertEqual(lines[1].split(',')[1], 'NA')
+        self.assertEqual(lines[4].split(',')[1], '%.2f' % frame['A'][3])
+
+        os.remove(path)
+
     def test_info(self):
         io = StringIO()
         self.frame.info(buf=io)
@@ -1697,6 +1722,44 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         df = DataFrame.from_records(lp.toRecords())
         tm.assert_panel_equal(df.pivot('major', 'minor'), wp)
 
+    def test_pivot_aggfunc(self):
+        frame = DataFrame({'index' : ['A', 'A', 'B', 'B', 'B'],
+                           'columns' : ['One', 'One', 'One', 'Two', 'Two'],
+                           'values' : [1., 2., 3., 4., 6.],
+                           'other' : [1, 1, 2, 2, 2]})
+
+        pivoted = frame.pivot('index', 'columns', 'values', aggfunc='mean')
+        expected = DataFrame({'One' : {'A' : 1.5, 'B' : 3.},
+                              'Two' : {'B' : 5.}})
+        assert_frame_equal(pivoted, expected)
+
+        wp = frame.pivot('index', 'columns', aggfunc=np.sum)
+        assert_frame_equal(wp['values'],
+                           DataFrame({'One' : {'A' : 3., 'B' : 3.},
+                                      'Two' : {'B' : 10.}}))
+        assert_frame_equal(wp['other'],
+                           DataFrame({'One' : {'A' : 2., 'B' : 2.},
+                                      'Two' : {'B' : 4.}}))
+
+    def test_pivot_aggfunc_count(self):
+        frame = DataFrame({'index' : ['A', 'A', 'B', 'B', 'B'],
+                           'columns' : ['One', 'One', 'One', 'Two', 'Two'],
+                           'values' : [1., 2., 3., 4., 6.]})
+        unique = frame.take([0, 2, 3])
+
+        for aggfunc in ('count', len):
+            pivoted = unique.pivot('index', 'columns', 'values',
+                                   aggfunc=aggfunc)
+            expected = DataFrame({'One' : {'A' : 1., 'B' : 1.},
+                                  'Two' : {'B' : 1.}})
+            assert_frame_equal(pivoted, expected)
+
+            pivoted = frame.pivot('index', 'columns', 'values',
+                                  aggfunc=aggfunc)
+            expected = DataFrame({'One' : {'A' : 2., 'B' : 1.},
+                                  'Two' : {'B' : 2.}})
+            assert_frame_equal(pivoted, expected)
+
     def test_reindex(self):
         newFrame = self.frame.reindex(self.ts1.index)
 
@@ -1918,6 +1981,41 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         applied = self.empty.apply(np.mean)
         self.assert_(not applied)
 
+    def test_apply_rows(self):
+        # reduction
+        applied = self.mixed_frame.apply(lambda x: x['A'] + x['B'], axis=1)
+        expected = self.mixed_frame['A'] + self.mixed_frame['B']
+        assert_series_equal(applied, expected)
+
+        # transform, the rows passed in are reused
+        applied = self.frame.apply(lambda x: x, axis=1)
+        assert_frame_equal(applied, self.frame)
+
+        applied = self.frame.apply(lambda x: x * 2, axis=1)
+        assert_frame_equal(applied, self.frame * 2)
+
+        # result not lining up with the columns
+        applied = self.frame.apply(lambda x: x[:2], axis=1)
+        expected = self.frame.copy()
+        expected['C'] = np.nan
+        expected['D'] = np.nan
+        assert_frame_equal(applied, expected)
+
+    def test_apply_raw(self):
+        result = self.frame.apply(np.mean, raw=True)
+        expected = self.frame.apply(np.mean)
+        assert_series_equal(result, expected)
+
+        result = self.frame.apply(np.mean, axis=1, raw=True)
+        expected = self.frame.apply(np.mean, axis=1)
+        assert_series_equal(result, expected)
+
+        result = self.frame.apply(lambda x: x * 2, raw=True)
+        assert_frame_equal(result, self.frame * 2)
+
+        result = self.frame.apply(lambda x: x * 2, axis=1, raw=True)
+        assert_frame_equal(result, self.frame * 2)
+
 
     def test_apply_broadcast(self):
         broadcasted = self.frame.apply(np.mean, broadcast=True)
@@ -2172,6 +2270,26 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
 
         self.assertRaises(Exception, f.join, f2, how='foo')
 
+        # the frames joined are left unconsolidated
+        f['E'] = 1.
+        f2['F'] = 1.
+        joined = f.join(f2, how='outer')
+        self.assertEqual(len(f._data.blocks), 2)
+        self.assertEqual(len(f2._data.blocks), 2)
+        self.assertEqual(len(joined._data.blocks), 1)
+
+    def test_join_index_sorted_unsorted(self):
+        f = self.frame.reindex(columns=['A', 'B'])[5:20]
+        f2 = self.frame.reindex(columns=['C', 'D'])[::2]
+
+        # reversed index goes through the hash table path
+        f2_rev = f2[::-1]
+
+        for how in ('left', 'right', 'inner', 'outer'):
+            joined = f.join(f2, how=how)
+            expected = f.join(f2_rev, how=how)
+            assert_frame_equal(joined, expected.reindex(joined.index))
+
     def test_join(self):
         index, data = tm.getMixedTypeDict()
         target = DataFrame(data, index=index)
@@ -2216,9 +2334,83 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         source_copy['A'] = 0
         self.assertRaises(Exception, target.join, source_copy, on='A')
 
-        # can't specify how
         self.assertRaises(Exception, target.join, source, on='C',
-                          how='left')
+                          how='foo')
+
+    def test_join_on_how(self):
+        left = DataFrame({'key' : ['a', 'b', 'a', 'c', None],
+                          'v' : np.arange(5.)},
+                         index=['r0', 'r1', 'r2', 'r3', 'r4'])
+        right = DataFrame({'w' : [1., 2., 3., 4.]},
+                          index=['a', 'a', 'b', 'e'])
+
+        # many-to-many
+        joined = left.join(right, on='key')
+        self.assert_(np.array_equal(joined['key'],
+                                    ['a', 'a', 'b', 'a', 'a', 'c', None]))
+        assert_almost_equal(joined['v'], [0, 0, 1, 2, 2, 3, 4])
+        assert_almost_equal(joined['w'], [1, 2, 3, 1, 2, nan, nan])
+        self.assert_(np.array_equal(joined.index, np.arange(7)))
+
+        joined = left.join(right, on='key', how='inner')
+        assert_almost_equal(joined['v'], [0, 0, 1, 2, 2])
+        assert_almost_equal(joined['w'], [1, 2, 3, 1, 2])
+
+        joined = left.join(right, on='key', how='right')
+        self.assert_(np.array_equal(joined['key'], ['a', 'a', 'a', 'a', 'b',
+                                                    'e']))
+        assert_almost_equal(joined['v'], [0, 2, 0, 2, 1, nan])
+        assert_almost_equal(joined['w'], [1, 1, 2, 2, 3, 4])
+
+        joined = left.join(right, on='key', how='outer')
+        self.assertEqual(len(joined), 8)
+        self.assertEqual(joined['key'][7], 'e')
+        self.assertEqual(joined['w'][7], 4)
+        self.assert_(np.isnan(joined['v'][7]))
+
+        # inner join without repeats keeps the index
+        joined = left.join(right[2:], on='key', how='inner')
+        self.assert_(np.array_equal(joined.index, ['r1']))
+
+        # keys filled in from other keep their dtype
+        left = DataFrame({'key' : [1, 2, 3], 'v' : [1., 2., 3.]})
+        right = DataFrame({'w' : [10., 20.]}, index=np.array([2, 4]))
+        for how in ('right', 'outer'):
+            joined = left.join(right, on='key', how=how)
+            self.assert_(joined['key'].dtype == np.int64)
+        joined = left.join(right, on='key', how='outer')
+        self.assert_(np.array_equal(joined['key'], [1, 2, 3, 4]))
+        self.assert_(np.array_equal(joined.columns, ['key', 'v', 'w']))
+
+        # NA keys don't match an NA label, also for unique indexes
+        left = DataFrame({'key' : [1., nan, 2.]})
+        right = DataFrame({'w' : [100., 200.]}, index=[1., nan])
+        joined = left.join(right, on='key')
+        assert_almost_equal(joined['w'], [100., nan, nan])
+        joined = left.join(right, on='key', how='outer')
+        assert_almost_equal(joined['w'], [100., nan, nan, 200.])
+
+    def test_join_on_multiple_keys(self):
+        left = DataFrame({'k1' : ['a', 'a', 'b', 'b', 'b'],
+                          'k2' : [1, 2, 1, 3, 3],
+                          'v' : np.arange(5.)})
+        index = MultiIndex.from_arrays([np.array(['a', 'b', 'b', 'c']),
+                                        np.array([2, 1, 3, 1])])
+        right = DataFrame({'w' : [10., 20., 30., 40.]}, index=index)
+
+        joined = left.join(right, on=['k1', 'k2'])
+        assert_almost_equal(joined['w'], [nan, 10, 20, 30, 30])
+        self.assert_(joined.index.equals(left.index))
+
+        joined = left.join(right, on=['k1', 'k2'], how='outer')
+        assert_almost_equal(joined['w'], [nan, 10, 20, 30, 30, 40])
+        self.assertEqual(joined['k1'][5], 'c')
+        self.assertEqual(joined['k2'][5], 1)
+
+        # other needs a MultiIndex with a level per key
+        self.assertRaises(Exception, left.join,
+                          DataFrame({'w' : [1.]}, index=['a']),
+                          on=['k1', 'k2'], how='inner')
 
     def test_clip(self):
         median = self.frame.median().median()
@@ -464,6 +464,53 @@ class TestGroupBy(unittest.TestCase):
 
         _testit(lambda x: x.sum())
         _testit(lambda x: x.mean())
+        _testit(lambda x: x.min())
+        _testit(lambda x: x.max())
+        _testit(lambda x: x.count())
+        _testit(lambda x: x.var())
+        _testit(lambda x: x.std())
+
+    def test_first_last_prod(self):
+        df = DataFrame({'A' : ['a', 'a', 'b', 'b', 'b'],
+                        'B' : [nan, 2., 3., nan, 5.],
+                        'C' : [1., 2., 3., 4., nan]})
+        grouped = df.groupby('A')
+
+        first = grouped.first()
+        assert_almost_equal(first['B'], [2., 3.])
+        assert_almost_equal(first['C'], [1., 3.])
+
+        last = grouped.last()
+        assert_almost_equal(last['B'], [2., 5.])
+        assert_almost_equal(last['C'], [2., 4.])
+
+        prod = grouped.prod()
+        assert_almost_equal(prod['B'], [2., 15.])
+        assert_almost_equal(prod['C'], [2., 12.])
+
+        # no numeric columns to aggregate
+        result = df.ix[:, ['A']].groupby(df['C']).first()
+        self.assertEqual(list(result['A']), ['a', 'a', 'b', 'b'])
+
+    def test_groupby_many_keys(self):
+        # product of the group counts overflows int64
+        n = 1000
+        keys = []
+        for _ in range(8):
+            key = np.random.randint(0, 1 << 20, size=n)
+            key[1::2] = key[::2]
+            keys.append(key)
+        series = Series(np.ones(n))
+
+        result = series.groupby(keys).sum()
+        expected = defaultdict(float)
+        for k in zip(*keys):
+            expected[k] += 1
+
+        self.assertEqual(len(result), len(expected))
+        self.assert_(result.index.is_monotonic)
+        for k, v in result.iteritems():
+            self.assertEqual(v, expected[k])
 
     def test_grouping_attrs(self):
         deleveled = self.mframe.delevel()
@@ -5,7 +5,10 @@ import unittest
 
 import numpy as np
 
-from pandas.core.index import Index, Factor, MultiIndex, NULL_INDEX
+from pandas.core.daterange import DateRange
+from pandas.core.index import (Index, Int64Index, Float64Index, DatetimeIndex,
+                               Factor, MultiIndex, NULL_INDEX)
+import pandas.core.datetools as datetools
 from pandas.util.testing import assert_almost_equal
 import pandas.util.testing as tm
 import pandas._tseries as tseries
@@ -124,6 +127,40 @@ class TestIndex(unittest.TestCase):
         for i in sl:
             self.assertEqual(i, sl[sl.indexMap[i]])
 
+    def test_engine(self):
+        engine = self.dateIndex._engine
+        self.assert_(self.dateIndex.view(Index)._engine is engine)
+        self.assert_(self.dateIndex[:10]._engine is not engine)
+
+        idx = Index([0, 0, 0])
+        self.assertRaises(Exception, idx.get_loc, 0)
+        self.assertRaises(Exception, idx.__contains__, 0)
+
+        # binary search on large, sorted indexes, no hash table
+        cutoff = tseries._SIZE_CUTOFF
+        try:
+            tseries._SIZE_CUTOFF = 10
+            for index in (self.dateIndex, self.intIndex):
+                engine = index.view(Index)._engine
+                for i, val in enumerate(index):
+                    self.assertEqual(engine.get_loc(val), i)
+                self.assert_('foo' not in engine)
+                self.assert_(engine.mapping is None)
+                self.assertRaises(KeyError, engine.get_loc, 'foo')
+                self.assertRaises(TypeError, engine.get_loc, slice(None))
+
+                target = np.array(list(index[::-2]) + ['foo'],
+                                  dtype=object)
+                expected = range(len(index) - 1, -1, -2) + [-1]
+                self.assert_(np.array_equal(engine.get_indexer(target),
+                                            expected))
+        finally:
+            tseries._SIZE_CUTOFF = cutoff
+
+        indexer, mask = self.strIndex.get_indexer(self.strIndex[::-1])
+        self.assert_(np.array_equal(indexer, np.arange(99, -1, -1)))
+        self.assert_(mask.all())
+
     def test_getitem(self):
         arr = np.array(self.dateIndex)
         self.assertEquals(self.dateIndex[5], arr[5])
@@ -284,6 +321,277 @@ class TestIndex(unittest.TestCase):
         self.assertEquals(idx.slice_locs(end=8), (0, 6))
         self.assertEquals(idx.slice_locs(end=9), (0, 7))
 
+class TestInt64Index(unittest.TestCase):
+
+    def setUp(self):
+        self.index = Int64Index(np.arange(0, 20, 2))
+
+    def test_constructor(self):
+        index = Index(np.arange(5))
+        self.assert_(isinstance(index, Int64Index))
+        self.assert_(index.dtype == np.int64)
+
+        index = Index(np.arange(5, dtype=np.int32))
+        self.assert_(isinstance(index, Int64Index))
+
+        index = Index(np.arange(5.))
+        self.assert_(isinstance(index, Float64Index))
+
+        index = Index(np.arange(5), dtype=object)
+        self.assert_(not isinstance(index, Int64Index))
+        self.assert_(index.dtype == np.object_)
+
+        # integers not fitting in int64 stay objects unless asked for
+        big = np.array([2 ** 63], dtype=np.uint64)
+        index = Index(big)
+        self.assert_(not isinstance(index, Int64Index))
+        self.assert_(index.dtype == np.object_)
+        self.assertEqual(index[0], 2 ** 63)
+        self.assertRaises(TypeError, Int64Index, big)
+        self.assert_(isinstance(Index(np.arange(5, dtype=np.uint64)),
+                                Int64Index))
+
+        index = Int64Index([1, 2, 3.])
+        self.assert_(index.dtype == np.int64)
+        self.assertRaises(TypeError, Int64Index, [1, 2.5])
+        self.assertRaises(Exception, Int64Index, ['a', 'b'])
+        self.assertRaises(ValueError, Int64Index, 5)
+
+        self.assert_(isinstance(self.index[2:5], Int64Index))
+        self.assert_(isinstance(self.index.take([3, 1]), Int64Index))
+
+    def test_get_loc(self):
+        self.assertEqual(self.index.get_loc(4), 2)
+        self.assertEqual(self.index.get_loc(4.0), 2)
+        self.assertRaises(KeyError, self.index.get_loc, 5)
+        self.assertRaises(KeyError, self.index.get_loc, 4.5)
+        self.assertRaises(KeyError, self.index.get_loc, 'foo')
+        self.assertRaises(TypeError, self.index.get_loc, slice(None))
+        self.assert_(18 in self.index)
+        self.assert_(3 not in self.index)
+
+    def test_get_indexer(self):
+        target = Int64Index(np.arange(10))
+        indexer, mask = self.index.get_indexer(target)
+        expected = [0, -1, 1, -1, 2, -1, 3, -1, 4, -1]
+        self.assert_(np.array_equal(indexer, expected))
+        self.assert_(np.array_equal(mask, indexer != -1))
+
+        # object target
+        indexer, mask = self.index.get_indexer(Index([4, 'foo', 4.5, 6]))
+        self.assert_(np.array_equal(indexer, [2, -1, -1, 3]))
+
+    def test_get_indexer_pad_backfill(self):
+        target = Int64Index(np.arange(-1, 22, 3))
+
+        indexer, mask = self.index.get_indexer(target, method='pad')
+        expected = [-1, 1, 2, 4, 5, 7, 8, 9]
+        self.assert_(np.array_equal(indexer, expected))
+        self.assert_(np.array_equal(mask, indexer != -1))
+
+        indexer, mask = self.index.get_indexer(target, method='backfill')
+        expected = [0, 1, 3, 4, 6, 7, 9, -1]
+        self.assert_(np.array_equal(indexer, expected))
+
+        # compare with the generic implementation
+        obj_index = Index(self.index, dtype=object)
+        obj_target = Index(target, dtype=object)
+        for method in ('pad', 'backfill'):
+            result = self.index.get_indexer(target, method=method)
+            expected = obj_index.get_indexer(obj_target, method=method)
+            self.assert_(np.array_equal(result[0][expected[1]],
+                                        expected[0][expected[1]]))
+            self.assert_(np.array_equal(result[1], expected[1]))
+
+        result = Float64Index(self.index).get_indexer(target + 0.5,
+                                                      method='pad')
+        self.assert_(np.array_equal(result[0],
+                                    [-1, 1, 2, 4, 5, 7, 8, 9]))
+
+    def test_union(self):
+        other = Int64Index(np.arange(5, 25, 3))
+        result = self.index.union(other)
+        self.assert_(isinstance(result, Int64Index))
+        expected = np.union1d(self.index, other)
+        self.assert_(np.array_equal(result, expected))
+
+        # not sorted
+        result = self.index.union(other[::-1])
+        self.assert_(np.array_equal(result, expected))
+
+        result = self.index.union(Index(list(other), dtype=object))
+        self.assert_(isinstance(result, Int64Index))
+        self.assert_(np.array_equal(result, expected))
+
+        result = self.index.union(Index(['a', 'b']))
+        self.assertEqual(len(result), len(self.index) + 2)
+
+        result = Float64Index(self.index).union(other + 0.5)
+        self.assert_(isinstance(result, Float64Index))
+        self.assert_(np.array_equal(result, np.union1d(self.index,
+                                                       other + 0.5)))
+
+    def test_intersection(self):
+        other = Int64Index(np.arange(5, 25, 3))
+        expected = np.intersect1d(self.index.values, other.values)
+
+        result = self.index.intersection(other)
+        self.assert_(isinstance(result, Int64Index))
+        self.assert_(np.array_equal(result, expected))
+
+        result = self.index.intersection(other[::-1])
+        self.assert_(np.array_equal(result, expected))
+
+        result = self.index.intersection(Index(['a', 8]))
+        self.assert_(np.array_equal(result, [8]))
+
+    def test_join(self):
+        other = Int64Index([7, 12, 25, 1, 2, 5])
+        other_mono = Int64Index([1, 2, 5, 7, 12, 25])
+
+        for how in ('left', 'right', 'inner', 'outer'):
+            # merge path against the hash table path
+            result = self.index.join(other_mono, how=how,
+                                     return_indexers=True)
+            expected = self.index.join(other, how=how, return_indexers=True)
+            join_index, lidx, ridx = result
+            self.assert_(np.array_equal(join_index, sorted(expected[0])))
+            for idx, index in ((lidx, self.index), (ridx, other_mono)):
+                if idx is None:
+                    self.assert_(join_index.equals(index))
+                else:
+                    mask = idx != -1
+                    self.assert_(np.array_equal(index.values.take(idx[mask]),
+                                                join_index.values[mask]))
+                    for label in join_index.values[-mask]:
+                        self.assert_(label not in index)
+
+        join_index, lidx, ridx = self.index.join(other_mono, how='outer',
+                                                 return_indexers=True)
+        self.assert_(isinstance(join_index, Int64Index))
+        self.assert_(np.array_equal(join_index,
+                                    [0, 1, 2, 4, 5, 6, 7, 8, 10, 12, 14, 16,
+                                     18, 25]))
+        self.assert_(np.array_equal(lidx, [0, -1, 1, 2, -1, 3, -1, 4, 5, 6,
+                                           7, 8, 9, -1]))
+        self.assert_(np.array_equal(ridx, [-1, 0, 1, -1, 2, -1, 3, -1, -1, 4,
+                                           -1, -1, -1, 5]))
+
+        join_index, lidx, ridx = self.index.join(other_mono, how='inner',
+                                                 return_indexers=True)
+        self.assert_(np.array_equal(join_index, [2, 12]))
+        self.assert_(np.array_equal(lidx, [1, 6]))
+        self.assert_(np.array_equal(ridx, [1, 4]))
+
+        # object labels
+        index = Index(list('abdeg'))
+        join_index, lidx, ridx = index.join(Index(list('bcdf')), how='outer',
+                                            return_indexers=True)
+        self.assert_(np.array_equal(join_index, list('abcdefg')))
+        self.assert_(np.array_equal(lidx, [0, 1, -1, 2, 3, -1, 4]))
+
+        result = self.index.join(self.index[2:], how='outer',
+                                 return_indexers=True)
+        self.assert_(result[0] is self.index)
+        self.assert_(result[1] is None)
+
+        self.assertRaises(Exception, self.index.join, other_mono, how='foo')
+
+    def test_slice_locs(self):
+        self.assertEqual(self.index.slice_locs(4, 10), (2, 6))
+        self.assertEqual(self.index.slice_locs(3, 11), (2, 6))
+        self.assertEqual(self.index.slice_locs(end=-1), (0, 0))
+
+        index = Int64Index([5, 1, 3])
+        self.assertEqual(index.slice_locs(1, 3), (1, 3))
+
+class TestDatetimeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = DateRange('1/1/2000', periods=20)
+        self.index = DatetimeIndex(self.rng)
+
+    def test_constructor(self):
+        self.assert_(self.index.dtype == np.int64)
+        self.assert_(np.array_equal(self.index.values, self.rng))
+        self.assert_(DatetimeIndex(self.index.asi8).equals(self.index))
+        self.assert_(DatetimeIndex(list(self.rng)).equals(self.index))
+        self.assert_(DatetimeIndex(iter(self.rng)).equals(self.index))
+        self.assert_(self.index.is_all_dates())
+
+        self.assertRaises(TypeError, DatetimeIndex, ['a', 'b'])
+        self.assertRaises(ValueError, DatetimeIndex, [datetime(1, 1, 1)])
+        self.assertRaises(ValueError, DatetimeIndex, datetime(2000, 1, 1))
+
+        stamp = datetime(2000, 1, 1, 12, 30, 15, 250)
+        self.assertEqual(DatetimeIndex([stamp])[0], stamp)
+        self.assertEqual(tseries.ns_to_datetime(tseries.datetime_to_ns(stamp)),
+                         stamp)
+
+    def test_getitem(self):
+        self.assertEqual(self.index[3], self.rng[3])
+        self.assert_(isinstance(self.index[3], datetime))
+        self.assert_(isinstance(self.index[2:5], DatetimeIndex))
+        self.assert_(isinstance(self.index.take([3, 1]), DatetimeIndex))
+        self.assertEqual(list(self.index[[3, 1]]), [self.rng[3], self.rng[1]])
+        self.assertEqual(list(self.index), list(self.rng))
+
+    def test_get_loc(self):
+        self.assertEqual(self.index.get_loc(self.rng[5]), 5)
+        self.assertRaises(KeyError, self.index.get_loc, datetime(1999, 1, 1))
+        self.assertRaises(KeyError, self.index.get_loc, 5)
+        self.assertRaises(KeyError, self.index.get_loc, 'foo')
+        self.assertRaises(TypeError, self.index.get_loc, slice(None))
+        self.assert_(self.rng[5] in self.index)
+        self.assert_(0 not in self.index)
+
+    def test_get_indexer(self):
+        target = self.rng[::2].union(self.rng.shift(1, datetools.day))
+        expected = Index(self.rng).get_indexer(target)
+        result = self.index.get_indexer(target)
+        self.assert_(np.array_equal(result[0], expected[0]))
+        self.assert_(np.array_equal(result[1], expected[1]))
+
+        for method in ('pad', 'backfill'):
+            expected = Index(self.rng[::3]).get_indexer(target,
+                                                        method=method)
+            result = self.index[::3].get_indexer(DatetimeIndex(target),
+                                                 method=method)
+            self.assert_(np.array_equal(result[0][expected[1]],
+                                        expected[0][expected[1]]))
+            self.assert_(np.array_equal(result[1], expected[1]))
+
+        indexer, mask = self.index.get_indexer(Index(['a', self.rng[2]]))
+        self.assert_(np.array_equal(indexer, [-1, 2]))
+
+    def test_set_ops(self):
+        result = self.index[:10].union(self.index[5:])
+        self.assert_(isinstance(result, DatetimeIndex))
+        self.assert_(result.equals(self.index))
+        self.assert_(self.index[:10].union(self.rng[5:]).equals(self.rng))
+
+        result = self.index[::2].intersection(self.index[::3])
+        self.assert_(result.equals(self.index[::6]))
+
+        result = self.index.union(Index(['a']))
+        self.assertEqual(len(result), len(self.index) + 1)
+
+    def test_slice_locs_shift(self):
+        self.assertEqual(self.index.slice_locs(datetime(2000, 1, 4),
+                                               datetime(2000, 1, 9)), (1, 5))
+        self.assertEqual(self.index.asOfDate(datetime(2000, 1, 9)),
+                         self.rng[4])
+
+        for offset in (datetools.Hour(3), datetools.bday):
+            result = self.index.shift(2, offset)
+            self.assert_(isinstance(result, DatetimeIndex))
+            self.assert_(result.equals(self.rng.shift(2, offset)))
+
+    def test_pickle(self):
+        unpickled = pickle.loads(pickle.dumps(self.index))
+        self.assert_(isinstance(unpickled, DatetimeIndex))
+        self.assert_(unpickled.equals(self.index))
+
 class TestMultiIndex(unittest.TestCase):
 
     def setUp(self):
@@ -504,6 +812,31 @@ class TestMultiIndex(unittest.TestCase):
         self.assertRaises(Exception, idx1.get_indexer,
                           list(zip(*idx2.get_tuple_index())[0]))
 
+    def test_get_indexer_different_levels(self):
+        index = MultiIndex.from_tuples([('a', 1), ('a', 2), ('b', 1),
+                                        ('c', 3)])
+        other = MultiIndex.from_tuples([('c', 3), ('b', 1), ('d', 1),
+                                        ('a', 5), ('a', 1)])
+
+        r1, r2 = index.get_indexer(other)
+        assert_almost_equal(r1, [3, 2, -1, -1, 0])
+        assert_almost_equal(r2, [True, True, False, False, True])
+
+        r1, r2 = index.get_indexer(other.get_tuple_index())
+        assert_almost_equal(r1, [3, 2, -1, -1, 0])
+
+        self.assert_(('c', 3) in index)
+        self.assert_(('c', 1) not in index)
+        self.assert_(('e', 1) not in index)
+        self.assertEqual(index.get_loc(('b', 1)), 2)
+
+        self.assert_(index.is_unique)
+        self.assert_(index.is_monotonic)
+        self.assert_(not other.is_monotonic)
+
+        dups = MultiIndex.from_tuples([('a', 1), ('b', 1), ('a', 1)])
+        self.assert_(not dups.is_unique)
+
     def test_format(self):
         self.index.format()
 
@@ -577,6 +910,15 @@ class TestMultiIndex(unittest.TestCase):
         self.assertRaises(TypeError, self.index.union,
                           self.index.get_tuple_index())
 
+        # levels differ
+        index = MultiIndex.from_tuples([('a', 1), ('a', 2), ('c', 3)])
+        other = MultiIndex.from_tuples([('b', 1), ('a', 2), ('c', 5)])
+        the_union = index.union(other)
+        expected = MultiIndex.from_tuples([('a', 1), ('a', 2), ('b', 1),
+                                           ('c', 3), ('c', 5)])
+        self.assert_(the_union.equals(expected))
+        self.assert_(the_union.equal_levels(expected))
+
     def test_intersection(self):
         piece1 = self.index[:5][::-1]
         piece2 = self.index[3:]
@@ -593,6 +935,14 @@ class TestMultiIndex(unittest.TestCase):
         self.assertRaises(TypeError, self.index.intersection,
                           self.index.get_tuple_index())
 
+        # levels differ, unused level values are dropped
+        index = MultiIndex.from_tuples([('a', 1), ('a', 2), ('c', 3)])
+        other = MultiIndex.from_tuples([('b', 1), ('a', 2), ('c', 3)])
+        the_int = index.intersection(other)
+        expected = MultiIndex.from_tuples([('a', 2), ('c', 3)])
+        self.assert_(the_int.equals(expected))
+        self.assert_(the_int.equal_levels(expected))
+
     def test_sortlevel(self):
         import random
 
@@ -8,7 +8,7 @@ import unittest
 
 import numpy as np
 
-from pandas.core.api import DataFrame, Index, notnull
+from pandas.core.api import DataFrame, Index, isnull, notnull
 from pandas.core.datetools import bday
 from pandas.core.frame import group_agg
 from pandas.core.panel import WidePanel, LongPanel, pivot
@@ -787,6 +787,16 @@ class TestLongPanel(unittest.TestCase):
         self.panel.toCSV('__tmp__')
         os.remove('__tmp__')
 
+        # all values are written as floats
+        lp = LongPanel(np.arange(6).reshape((2, 3)), columns=['a', 'b', 'c'],
+                       index=self.panel.index[:2])
+        lp.toCSV('__tmp__')
+        lines = open('__tmp__').read().splitlines()
+        os.remove('__tmp__')
+        self.assertEqual(lines[1].split(',')[2:],
+                         ['0.000000000000', '1.000000000000',
+                          '2.000000000000'])
+
     def test_toString(self):
         from cStringIO import StringIO
 
@@ -946,6 +956,43 @@ class TestLongPanel(unittest.TestCase):
         # corner case, empty
         df = pivot(np.array([]), np.array([]), np.array([]))
 
+    def test_pivot_dtypes(self):
+        # integers stay integers when every cell is filled
+        df = pivot(np.array([1, 1, 2, 2]), np.array(['a', 'b', 'a', 'b']),
+                   np.array([1, 2, 3, 4]))
+        self.assert_(issubclass(df.values.dtype.type, np.integer))
+        self.assertEqual(df['b'][2], 4)
+
+        # and are upcast when some are missing
+        df = pivot(np.array([1, 1, 2]), np.array(['a', 'b', 'a']),
+                   np.array([1, 2, 3]))
+        self.assert_(df.values.dtype == np.float64)
+        self.assert_(np.isnan(df['b'][2]))
+
+        df = pivot(np.array([1, 2]), np.array(['a', 'b']),
+                   np.array(['foo', 'bar'], dtype=object))
+        self.assertEqual(df['b'][2], 'bar')
+        self.assert_(isnull(df['a'][2]))
+
+    def test_pivot_aggfunc(self):
+        index = np.array([1, 1, 1, 2, 2])
+        columns = np.array(['a', 'a', 'b', 'a', 'a'])
+        values = np.array([1., 2., 3., 4., 6.])
+
+        # last one wins by default
+        df = pivot(index, columns, values)
+        self.assertEqual(df['a'][1], 2)
+
+        for aggfunc in ('mean', 'sum', np.sum, 'max'):
+            df = pivot(index, columns, values, aggfunc=aggfunc)
+            f = aggfunc
+            if isinstance(f, basestring):
+                f = getattr(np, f)
+            self.assertEqual(df['a'][1], f([1., 2.]))
+            self.assertEqual(df['a'][2], f([4., 6.]))
+            self.assertEqual(df['b'][1], 3)
+            self.assert_(np.isnan(df['b'][2]))
+
 def test_group_agg():
     values = np.ones((10, 2)) * np.arange(10).reshape((10, 1))
     bounds = np.arange(5) * 2
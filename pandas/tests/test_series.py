@@ -669,6 +669,16 @@ class TestSeries(unittest.TestCase):
 
     def test_toCSV(self):
         self.ts.toCSV('_foo')
+        lines = open('_foo').read().splitlines()
+        self.assertEqual(len(lines), len(self.ts))
+        self.assertEqual(lines[0], '%s,%s' % (self.ts.index[0], self.ts[0]))
+
+        self.ts[:2] = np.nan
+        self.ts.toCSV('_foo', nanRep='NA', float_format='%.3f', chunksize=4)
+        lines = open('_foo').read().splitlines()
+        self.assertEqual(lines[1], '%s,NA' % self.ts.index[1])
+        self.assertEqual(lines[-1], '%s,%.3f' % (self.ts.index[-1],
+                                                 self.ts[-1]))
         os.remove('_foo')
 
     def test_toDict(self):
@@ -984,6 +994,15 @@ class TestSeries(unittest.TestCase):
         unstacked = s.unstack(0)
         assert_frame_equal(unstacked, expected)
 
+        # integer data with missing cells
+        index = MultiIndex(levels=[['bar', 'foo'], ['one', 'two']],
+                           labels=[[1, 1, 0], [0, 1, 0]])
+        s = Series(np.arange(3), index=index)
+        unstacked = s.unstack()
+        self.assert_(unstacked.values.dtype == np.float64)
+        self.assertEqual(unstacked['one']['bar'], 2)
+        self.assert_(np.isnan(unstacked['two']['bar']))
+
 #-------------------------------------------------------------------------------
 # TimeSeries-specific
 
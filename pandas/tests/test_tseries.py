@@ -97,5 +97,112 @@ class TestTseriesUtil(unittest.TestCase):
         self.assert_(np.array_equal(filler, expect_filler))
         self.assert_(np.array_equal(mask, expect_mask))
 
+    def test_hashtables(self):
+        table = tseries.Int64HashTable()
+        table.map_locations(np.arange(0, 1000, 3, dtype=np.int64))
+        self.assertEqual(len(table), 334)
+        self.assertEqual(table.get_item(999), 333)
+        self.assert_(3 in table)
+        self.assert_(4 not in table)
+        self.assertRaises(KeyError, table.get_item, 4)
+        result = table.lookup(np.array([6, 7, 0], dtype=np.int64))
+        self.assert_(np.array_equal(result, [2, -1, 0]))
+
+        table = tseries.Float64HashTable()
+        table.map_locations(np.array([1.5, np.nan, -0.0]))
+        self.assertEqual(table.get_item(0.0), 2)
+        self.assertEqual(table.get_item(np.nan), 1)
+        result = table.lookup(np.array([1.5, 2.5]))
+        self.assert_(np.array_equal(result, [0, -1]))
+
+        table = tseries.PyObjectHashTable()
+        values = np.array(['a', 1, (1, 2), None], dtype=object)
+        table.map_locations(values)
+        self.assertEqual(table.get_item((1, 2)), 2)
+        self.assertEqual(table.get_item(1.0), 1)
+        self.assertRaises(TypeError, table.get_item, [1, 2])
+        result = table.lookup(np.array([None, 'b'], dtype=object))
+        self.assert_(np.array_equal(result, [3, -1]))
+
+    def test_join_indexers(self):
+        left = np.array([1, 3, 5, 7, 9], dtype=np.int64)
+        right = np.array([2, 3, 7, 8], dtype=np.int64)
+
+        for conv in (lambda x: x, lambda x: x.astype(float),
+                     lambda x: x.astype(object)):
+            kind = {np.int64 : 'int64', np.float64 : 'float64',
+                    np.object_ : 'object'}[conv(left).dtype.type]
+            left_join = getattr(tseries, 'left_join_indexer_%s' % kind)
+            inner_join = getattr(tseries, 'inner_join_indexer_%s' % kind)
+            outer_join = getattr(tseries, 'outer_join_indexer_%s' % kind)
+
+            result = left_join(conv(left), conv(right))
+            self.assert_(np.array_equal(result, [-1, 1, -1, 2, -1]))
+
+            joined, lidx, ridx = inner_join(conv(left), conv(right))
+            self.assert_(np.array_equal(joined, [3, 7]))
+            self.assert_(np.array_equal(lidx, [1, 3]))
+            self.assert_(np.array_equal(ridx, [1, 2]))
+
+            joined, lidx, ridx = outer_join(conv(left), conv(right))
+            self.assert_(np.array_equal(joined, [1, 2, 3, 5, 7, 8, 9]))
+            self.assert_(np.array_equal(lidx, [0, -1, 1, 2, 3, -1, 4]))
+            self.assert_(np.array_equal(ridx, [-1, 0, 1, -1, 2, 3, -1]))
+
+    def test_hash_join(self):
+        left = np.array([0, 1, -1, 2, 1], dtype=np.int32)
+        right = np.array([1, 1, 3, -1, 0], dtype=np.int32)
+
+        lidx, ridx = tseries.left_outer_join(left, right, 4)
+        self.assert_(np.array_equal(lidx, [0, 1, 1, 2, 3, 4, 4]))
+        self.assert_(np.array_equal(ridx, [4, 0, 1, -1, -1, 0, 1]))
+
+        lidx, ridx = tseries.inner_join(left, right, 4)
+        self.assert_(np.array_equal(lidx, [0, 1, 1, 4, 4]))
+        self.assert_(np.array_equal(ridx, [4, 0, 1, 0, 1]))
+
+        lidx, ridx = tseries.full_outer_join(left, right, 4)
+        self.assert_(np.array_equal(lidx, [0, 1, 1, 2, 3, 4, 4, -1, -1]))
+        self.assert_(np.array_equal(ridx, [4, 0, 1, -1, -1, 0, 1, 2, 3]))
+
+        table = tseries.PyObjectHashTable()
+        labels = table.get_labels(np.array(['a', 'b', None, 'a'],
+                                           dtype=object))
+        self.assert_(np.array_equal(labels, [0, 1, -1, 0]))
+        labels = table.get_labels(np.array(['c', 'a'], dtype=object))
+        self.assert_(np.array_equal(labels, [2, 0]))
+
+        table = tseries.Float64HashTable()
+        labels = table.get_labels(np.array([2.5, np.nan, 2.5, 1.]))
+        self.assert_(np.array_equal(labels, [0, -1, 0, 1]))
+
+    def test_group_var(self):
+        labels = np.array([0, 1, 0, -1, 1, 0, 2], dtype=np.int32)
+        values = np.array([[1e10 + 1, 1.],
+                           [np.nan, 2.],
+                           [1e10 + 2, 3.],
+                           [5., 5.],
+                           [4., 4.],
+                           [1e10 + 3, np.nan],
+                           [7., 7.]])
+        out = np.empty((3, 2))
+        counts = np.zeros(3, dtype=np.int32)
+        tseries.group_var(out, counts, values, labels)
+
+        common.assert_almost_equal(out, [[1., 2.], [np.nan, 2.],
+                                         [np.nan, np.nan]])
+        self.assert_(np.array_equal(counts, [3, 2, 1]))
+
+    def test_unstack(self):
+        values = np.array([[1., 2.], [3., 4.], [5., 6.]])
+        row = np.array([1, 0, -1], dtype=np.int32)
+        col = np.array([0, 1, 1], dtype=np.int32)
+        out = np.empty((2, 4))
+        out.fill(np.nan)
+        tseries.unstack_float64(values, row, col, out, 2)
+
+        common.assert_almost_equal(out, [[np.nan, 3., np.nan, 4.],
+                                         [1., np.nan, 2., np.nan]])
+
 class TestMoments(unittest.TestCase):
     pass
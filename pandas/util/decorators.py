@@ -58,6 +58,13 @@ class ResettableCache(dict):
         for mustreset in self._resetdict.get(key, []):
             self[mustreset] = None
 
+    def __reduce__(self):
+        return (self.__class__, (self._resetdict,), dict(self))
+
+    def __setstate__(self, state):
+        # restore the entries as they were, without resetting their dependents
+        dict.update(self, state)
+
     def __delitem__(self, key):
         dict.__delitem__(self, key)
         for mustreset in self._resetdict.get(key, []):
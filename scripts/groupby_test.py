@@ -6,27 +6,32 @@ import numpy as np
 from pandas import *
 
 import pandas._tseries as tseries
+from pandas.core.common import _factorize
 import pandas.core.groupby as gp
 import pandas.util.testing as tm
 reload(gp)
 
-"""
-
 k = 1000
 values = np.random.randn(8 * k)
 key1 = np.array(['foo', 'bar', 'baz', 'bar', 'foo', 'baz', 'bar', 'baz'] * k,
                 dtype=object)
 key2 = np.array(['b', 'b', 'b', 'b', 'a', 'a', 'a', 'a' ] * k,
                 dtype=object)
-shape, labels, idicts = gp.labelize(key1, key2)
+
+labels1, uniques1 = _factorize(key1)
+labels2, uniques2 = _factorize(key2)
+label_list = [labels1, labels2]
+shape = [len(uniques1), len(uniques2)]
 
 print tseries.group_labels(key1)
 
+comp_ids, ngroups, group_labels = gp._get_group_info(label_list, shape)
+
 # print shape
-# print labels
-# print idicts
+# print comp_ids
+# print group_labels
 
-result = tseries.group_aggregate(values, labels, shape)
+result = gp._aggregate_labels(values[:, np.newaxis], comp_ids, ngroups, 'add')
 
 print tseries.groupby_indices(key2)
 
@@ -40,25 +45,20 @@ k2 = df['key2']
 # del df['key1']
 # del df['key2']
 
-# r2 = gp.multi_groupby(df, np.sum, k1, k2)
-
 # print result
 
-gen = gp.generate_groups(df['v1'], labels, shape, axis=1,
-                         factory=DataFrame)
-
 res = defaultdict(dict)
-for a, gen1 in gen:
-    for b, group in gen1:
-        print a, b
-        print group
-        # res[b][a] = group['values'].sum()
-        res[b][a] = group.sum()
+for a, b, group in df.groupby(['key1', 'key2']):
+    print a, b
+    print group
+    res[b][a] = group['v1'].sum()
 
 res = DataFrame(res)
 
 grouped = df.groupby(['key1', 'key2'])
-"""
+for i, (a, b) in enumerate(zip(uniques1.take(group_labels[0]),
+                               uniques2.take(group_labels[1]))):
+    assert(abs(result[i, 0] - res[b][a]) < 1e-8)
 
 # data = {'A' : [0, 0, 0, 0, 1, 1, 1, 1, 1, 1., nan, nan],
 #         'B' : ['A', 'B'] * 6,
@@ -219,8 +219,9 @@ else:
     cmdclass['build_ext'] =  build_ext
     cmdclass['sdist'] =  CheckSDist
 
-tseries_depends = ['reindex', 'io', 'common', 'groupby'
-                   'skiplist', 'isnull', 'moments', 'operators']
+tseries_depends = ['reindex', 'hashtable', 'join', 'reshape', 'io', 'parser',
+                   'common', 'groupby' 'skiplist', 'isnull', 'moments',
+                   'operators']
 
 def srcpath(name=None, suffix='.pyx', subdir='src'):
     return pjoin('pandas', subdir, name+suffix)